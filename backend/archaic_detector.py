@@ -0,0 +1,288 @@
+"""고어/의미 변화 단어 감지기
+
+archaic_words, semantic_shifts를 catalog_version당 한 번 읽어 토큰 단위 트라이로
+만들어 두고, 감지는 입력 텍스트를 한 번 훑는 것으로 끝낸다 (요청마다 DB 조회 없음).
+트라이는 한 단어 항목과 여러 단어로 된 구(phrase) 항목을 모두 지원하고, 굴절형
+(knoweth, sayest, doeth 등)도 만들 때 미리 펼쳐 넣어 원래 사전 항목으로 연결한다.
+앱 시작 시 load_archaic_detector()로 미리 만들고, 버전이 바뀌면 다음 요청에서 다시 만든다.
+
+챕터 본문은 seed 이후 바뀌지 않으므로 챕터별 등장 위치는 seed 시점에
+rebuild_term_occurrences()로 chapter_term_occurrences 테이블에 미리 색인해 둔다.
+"""
+import re
+import json
+import time
+from bisect import bisect_left
+from database import get_async_catalog_db, bulk_insert
+from catalog_cache import catalog_cache
+from archaic_inflections import expand_forms, inflected_entries
+
+ARCHAIC_SQL = "SELECT word, modern_equivalent, definition_ko, category FROM archaic_words"
+SHIFTS_SQL = "SELECT word, historical_meaning_ko, modern_meaning_ko, tip_ko FROM semantic_shifts"
+
+TOKEN_RE = re.compile(r"[A-Za-z]+")
+
+_END = None  # 트라이 노드에서 "여기서 끝나는 항목" 목록의 키 (토큰은 항상 문자열)
+
+KIND_NAMES = ("archaic", "shift")  # chapter_term_occurrences.kind 값 (인덱스 = 트라이의 kind)
+
+
+def _tokens(word: str):
+    return [token.lower() for token in TOKEN_RE.findall(word)]
+
+
+class ArchaicDetector:
+    """사전 한 버전에 대한 감지 인덱스 (만든 뒤에는 읽기 전용)"""
+
+    def __init__(self, version, archaic_rows, shift_rows):
+        self.version = version
+        self.archaic = [{
+            "word": row["word"],
+            "modernEquivalent": row["modern_equivalent"],
+            "definitionKo": row["definition_ko"]
+        } for row in archaic_rows]
+        # archaic[:dictionary_words]는 사전 테이블 항목, 그 뒤는 -eth/-est 굴절형 항목 (자동완성 등에서는 제외)
+        self.dictionary_words = len(self.archaic)
+        dictionary = {entry["word"].lower() for entry in self.archaic}
+        self.archaic.extend(entry for entry in inflected_entries() if entry["word"] not in dictionary)
+        self.shifts = [{
+            "word": row["word"],
+            "historicalMeaningKo": row["historical_meaning_ko"],
+            "modernMeaningKo": row["modern_meaning_ko"],
+            "tipKo": row["tip_ko"]
+        } for row in shift_rows]
+
+        # 토큰 트라이: {토큰: 자식 노드, _END: [(0=고어|1=의미 변화, 항목 인덱스), ...]}
+        self._root = {}
+        self._by_term = {}  # (kind, 소문자 단어) -> 항목 인덱스 (색인 테이블 조회 결과 매핑용)
+        self.phrases = 0
+        for kind, entries in ((0, self.archaic), (1, self.shifts)):
+            for index, entry in enumerate(entries):
+                self._add(_tokens(entry["word"]), (kind, index))
+                self._by_term[(kind, entry["word"].lower())] = index
+        self.inflected = len(self.archaic) - self.dictionary_words
+        # 사전 항목의 변이형/복수형 (archaic_inflections의 확장 테이블) - 원래 항목으로 연결
+        for index, row in enumerate(archaic_rows):
+            for form in expand_forms(row["word"], row["category"]):
+                self._add(_tokens(form), (0, index))
+                self.inflected += 1
+
+    def _add(self, tokens, ref):
+        if not tokens:
+            return
+        if len(tokens) > 1:
+            self.phrases += 1
+        node = self._root
+        for token in tokens:
+            node = node.setdefault(token, {})
+        refs = node.setdefault(_END, [])
+        if ref not in refs:
+            refs.append(ref)
+
+    def _scan(self, text: str):
+        """(시작 오프셋, 끝 오프셋, 항목 목록)을 텍스트 순서대로 생성
+
+        각 토큰 위치에서 트라이를 따라가 가장 긴 항목을 택한다. 구는 토큰 사이가
+        공백일 때만 이어지며, 한 단어 항목은 루트에서 dict 조회 한 번으로 끝난다.
+        """
+        root = self._root
+        tokens = [(m.start(), m.end(), m.group().lower()) for m in TOKEN_RE.finditer(text)]
+        count = len(tokens)
+        i = 0
+        while i < count:
+            start, end, token = tokens[i]
+            node = root.get(token)
+            if node is None:
+                i += 1
+                continue
+            match = (i, end, node[_END]) if _END in node else None
+            j = i + 1
+            while j < count and len(node) > (_END in node):
+                next_start, next_end, next_token = tokens[j]
+                if not text[tokens[j - 1][1]:next_start].isspace():
+                    break
+                node = node.get(next_token)
+                if node is None:
+                    break
+                if _END in node:
+                    match = (j, next_end, node[_END])
+                j += 1
+            if match is None:
+                i += 1
+                continue
+            last, match_end, refs = match
+            yield start, match_end, refs
+            i = last + 1
+
+    def detect(self, text: str, positions: bool = False) -> dict:
+        """텍스트에 등장하는 고어/의미 변화 단어 (중복 제거, 단어 순 정렬)
+
+        positions=True면 등장 위치도 함께 반환. 하이라이트용으로 항목당 객체 대신
+        [시작, 길이, 항목 인덱스]를 이어 붙인 평탄한 정수 배열(archaicSpans/shiftSpans)로
+        인코딩하며, 항목 인덱스는 archaicWords/semanticShifts 배열의 위치다.
+        오프셋은 JS 문자열과 같은 UTF-16 코드 단위 기준.
+        """
+        found = set()
+        matches = [] if positions else None
+        for start, end, refs in self._scan(text):
+            found.update(refs)
+            if positions:
+                matches.append((start, end, refs))
+
+        archaic_refs = sorted((i for kind, i in found if kind == 0), key=lambda i: self.archaic[i]["word"].lower())
+        shift_refs = sorted((i for kind, i in found if kind == 1), key=lambda i: self.shifts[i]["word"].lower())
+        result = {
+            "archaicWords": [self.archaic[i] for i in archaic_refs],
+            "semanticShifts": [self.shifts[i] for i in shift_refs],
+            "totalArchaic": len(archaic_refs),
+            "totalShifts": len(shift_refs)
+        }
+        if positions:
+            result["archaicSpans"], result["shiftSpans"] = self._encode_spans(
+                text, matches, {i: n for n, i in enumerate(archaic_refs)}, {i: n for n, i in enumerate(shift_refs)}
+            )
+        return result
+
+    @staticmethod
+    def _encode_spans(text, matches, archaic_pos, shift_pos):
+        archaic_spans, shift_spans = [], []
+        to_utf16 = _utf16_offset_mapper(text)
+        for start, end, refs in matches:
+            if to_utf16 is not None:
+                start, end = to_utf16(start), to_utf16(end)
+            for kind, i in refs:
+                if kind == 0:
+                    archaic_spans.extend((start, end - start, archaic_pos[i]))
+                else:
+                    shift_spans.extend((start, end - start, shift_pos[i]))
+        return archaic_spans, shift_spans
+
+    def term_occurrences(self, text: str) -> dict:
+        """{(kind 이름, 소문자 단어): [시작, 길이, ...]} - chapter_term_occurrences 적재용 (UTF-16 오프셋)"""
+        occurrences = {}
+        to_utf16 = _utf16_offset_mapper(text)
+        for start, end, refs in self._scan(text):
+            if to_utf16 is not None:
+                start, end = to_utf16(start), to_utf16(end)
+            for kind, i in refs:
+                entry = (self.archaic if kind == 0 else self.shifts)[i]
+                occurrences.setdefault((KIND_NAMES[kind], entry["word"].lower()), []).extend((start, end - start))
+        return occurrences
+
+    def resolve_term(self, term: str) -> list:
+        """단어/구(굴절형, 변이형 포함) -> 감지 시 연결되는 [(kind 이름, 소문자 사전 단어)]
+
+        chapter_term_occurrences는 사전 단어로 색인되므로 doeth -> ("archaic", "doth")처럼
+        바꿔서 조회해야 한다. 사전에 없는 형태면 빈 목록.
+        """
+        node = self._root
+        for token in _tokens(term):
+            node = node.get(token)
+            if node is None:
+                return []
+        return [
+            (KIND_NAMES[kind], (self.archaic if kind == 0 else self.shifts)[i]["word"].lower())
+            for kind, i in node.get(_END, ())
+        ]
+
+    def annotations(self, rows) -> dict:
+        """chapter_term_occurrences 행들을 detect(positions=True)와 같은 형태로 변환
+
+        사전에서 빠진 단어(색인이 오래된 경우)는 건너뛴다.
+        """
+        found = {0: [], 1: []}  # kind -> [(항목 인덱스, offsets)]
+        for row in rows:
+            kind = KIND_NAMES.index(row["kind"])
+            index = self._by_term.get((kind, row["term"]))
+            if index is not None:
+                found[kind].append((index, json.loads(row["offsets"])))
+
+        result = {}
+        span_lists = []
+        for kind, entries, words_key, total_key in ((0, self.archaic, "archaicWords", "totalArchaic"),
+                                                    (1, self.shifts, "semanticShifts", "totalShifts")):
+            items = sorted(found[kind], key=lambda item: entries[item[0]]["word"].lower())
+            result[words_key] = [entries[index] for index, _offsets in items]
+            result[total_key] = len(items)
+            spans = []
+            for position, (_index, offsets) in enumerate(items):
+                spans.extend((offsets[k], offsets[k + 1], position) for k in range(0, len(offsets), 2))
+            spans.sort()
+            span_lists.append([value for span in spans for value in span])
+        result["archaicSpans"], result["shiftSpans"] = span_lists
+        return result
+
+    def stats(self):
+        return {
+            "version": self.version,
+            "archaicWords": self.dictionary_words,
+            "semanticShifts": len(self.shifts),
+            "phrases": self.phrases,
+            "inflectedForms": self.inflected,
+        }
+
+
+def _utf16_offset_mapper(text: str):
+    """파이썬 문자 오프셋 -> UTF-16 오프셋 변환 함수 (BMP 밖 문자가 없으면 None - 변환 불필요)"""
+    if text.isascii():
+        return None
+    astral = [i for i, ch in enumerate(text) if ord(ch) > 0xFFFF]
+    if not astral:
+        return None
+    # BMP 밖 문자(이모지 등)는 UTF-16에서 2칸 - 앞에 있는 개수만큼 밀림
+    return lambda offset: offset + bisect_left(astral, offset)
+
+
+_detector = None
+
+
+def rebuild_term_occurrences(conn) -> int:
+    """chapter_term_occurrences 전체 재구성 (동기 연결 - seed 스크립트에서 챕터/사전 변경 후 호출)
+
+    반환값은 적재한 행 수.
+    """
+    cursor = conn.cursor()
+    cursor.execute(ARCHAIC_SQL)
+    archaic_rows = cursor.fetchall()
+    cursor.execute(SHIFTS_SQL)
+    shift_rows = cursor.fetchall()
+    detector = ArchaicDetector(None, archaic_rows, shift_rows)
+
+    cursor.execute("SELECT book_id, chapter_number, content FROM chapters")
+    rows = []
+    for chapter in cursor.fetchall():
+        chapter_id = f"{chapter['book_id']}-ch{chapter['chapter_number']}"
+        for (kind, term), offsets in detector.term_occurrences(chapter["content"] or "").items():
+            rows.append((chapter_id, kind, term, len(offsets) // 2, json.dumps(offsets, separators=(",", ":"))))
+
+    cursor.execute("DELETE FROM chapter_term_occurrences")
+    bulk_insert(conn, "chapter_term_occurrences", ("chapter_id", "kind", "term", "occurrences", "offsets"), rows)
+    conn.commit()
+    print(f"[archaic] 챕터 단어 색인 재구성: {len(rows)}행")
+    return len(rows)
+
+
+async def load_archaic_detector(version=None):
+    """사전 테이블을 읽어 감지기를 새로 만들고 교체"""
+    global _detector
+    start = time.perf_counter()
+    async with get_async_catalog_db() as conn:
+        archaic_rows, shift_rows = await conn.batch([(ARCHAIC_SQL, []), (SHIFTS_SQL, [])])
+    detector = ArchaicDetector(version, archaic_rows, shift_rows)
+    _detector = detector
+    print(f"[archaic] 감지기 로드: 고어 {detector.dictionary_words}개 (굴절형 {detector.inflected}개), 의미 변화 {len(detector.shifts)}개 "
+          f"({(time.perf_counter() - start) * 1000:.1f}ms)")
+    return detector
+
+
+async def get_archaic_detector():
+    """현재 catalog_version의 감지기 반환 (버전이 바뀌었거나 아직 없으면 다시 로드)
+
+    catalog_version이 없으면(None) None으로 만든 감지기를 계속 쓴다 - 갱신은
+    /internal/archaic-detector/reload 또는 버전이 기록된 뒤의 다음 요청에서.
+    """
+    version = await catalog_cache.current_version()
+    detector = _detector
+    if detector is None or detector.version != version:
+        detector = await load_archaic_detector(version)
+    return detector
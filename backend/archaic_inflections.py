@@ -0,0 +1,115 @@
+"""고어 굴절형 확장 테이블
+
+사전(archaic_words)에는 기본형만 있으므로, 감지기를 만들 때 여기 정의한 규칙으로
+굴절형을 미리 펼쳐 트라이에 함께 넣는다. 감지 시점에는 정규식/접미사 분석 없이
+기존과 같은 토큰 조회 한 번으로 굴절형을 찾는다.
+
+- 동사 어미 -eth/-est: VERB_STEMS로 만든 형태(knoweth, sayest 등)를 각각 별도 항목으로
+  (inflected_entries) - 사전 테이블에는 넣지 않으므로 /archaic-words, 자동완성에는 나오지 않음
+  ("-est"는 최상급 greatest, 명사 forest 등과 겹치므로 어간 목록에 있는 동사만 확장하고,
+  어간이 형용사도 되어 -est 형태가 현대 영어 최상급인 경우(meanest)는 SUPERLATIVE_FORMS로 제외)
+- 철자/굴절 변이: VARIANT_FORMS (doeth -> doth, methought -> methinks 등)
+- 명사 복수형: 사전의 noun 항목에 -s 형태 추가
+"""
+
+# -eth/-est를 붙여 쓰는 흔한 동사 어간 (성경/셰익스피어/고전 산문 기준)
+VERB_STEMS = (
+    "abide", "answer", "ask", "believe", "bless", "break", "bring", "call", "care", "cast",
+    "cause", "come", "comfort", "command", "consider", "cry", "deliver", "deny", "depart",
+    "desire", "die", "dwell", "eat", "endure", "fall", "fear", "feel", "fight", "find",
+    "fly", "follow", "forget", "forgive", "give", "go", "grow", "hate", "hear", "help", "hide",
+    "hold", "hope", "judge", "keep", "kill", "know", "labour", "lead", "learn", "leave", "lie",
+    "lift", "like", "listen", "live", "look", "lose", "love", "make", "mean", "meet", "mock",
+    "move", "need", "obey", "open", "pass", "pay", "please", "pray", "promise", "put", "reign",
+    "remain", "remember", "rest", "return", "rise", "run", "say", "see", "seek", "seem", "send",
+    "serve", "shine", "show", "sing", "sit", "sleep", "smite", "speak", "spend", "stand",
+    "suffer", "take", "teach", "tell", "think", "trust", "turn", "understand", "wait", "walk",
+    "want", "watch", "weep", "wish", "work", "worship", "write",
+)
+
+# 어간 + -est가 형용사 최상급과 같은 철자인 형태 - 현대 영어에서도 흔히 쓰므로 2인칭형으로 등록하지 않음
+# (the meanest man, the openest field, the likest copy)
+SUPERLATIVE_FORMS = frozenset(("meanest", "openest", "likest"))
+
+# 어미 앞에서 자음을 겹쳐 쓰는 어간 (sitteth, runneth)
+DOUBLED_STEMS = frozenset(("sit", "run", "put", "forget", "get", "set"))
+
+# 불규칙형 (어간 규칙으로 만들 수 없는 형태) -> 현대 영어 형태
+IRREGULAR_FORMS = {
+    "saith": "says",
+    "sayst": "(you) say",
+    "canst": "(you) can",
+    "couldst": "(you) could",
+    "shouldst": "(you) should",
+    "mayst": "(you) may",
+    "mightst": "(you) might",
+    "didst": "(you) did",
+    "hadst": "(you) had",
+    "wast": "(you) were",
+    "wert": "(you) were",
+}
+
+# 사전 항목 단어 -> 같은 항목으로 볼 철자/굴절 변이
+VARIANT_FORMS = {
+    "doth": ("doeth",),
+    "dost": ("doest",),
+    "wouldst": ("wouldest",),
+    "methinks": ("methought",),
+}
+
+
+def _add_suffix(stem: str, suffix: str) -> str:
+    """어간 + -eth/-est 철자 규칙 (love -> loveth, see -> seeth, cry -> crieth, sit -> sitteth)"""
+    if stem in DOUBLED_STEMS:
+        return stem + stem[-1] + suffix
+    if stem.endswith("ee") or stem.endswith("oe"):
+        return stem + suffix[1:]
+    if stem.endswith("e"):
+        return stem[:-1] + suffix
+    if stem.endswith("y") and stem[-2:-1] not in "aeiou":
+        return stem[:-1] + "i" + suffix
+    return stem + suffix
+
+
+def _third_person(stem: str) -> str:
+    """현대 영어 3인칭 단수 현재형 (know -> knows, go -> goes, cry -> cries, watch -> watches)"""
+    if stem.endswith("y") and stem[-2:-1] not in "aeiou":
+        return stem[:-1] + "ies"
+    if stem.endswith(("s", "sh", "ch", "x", "o")):
+        return stem + "es"
+    return stem + "s"
+
+
+def inflected_entries() -> list:
+    """-eth/-est 굴절형 항목 목록 (감지기가 사전 항목 뒤에 덧붙이는 고어 항목과 같은 형태)"""
+    entries = []
+    for stem in VERB_STEMS:
+        entries.append({
+            "word": _add_suffix(stem, "eth"),
+            "modernEquivalent": _third_person(stem),
+            "definitionKo": f"'{stem}'의 3인칭 단수 현재형 (고어 어미 -eth = -s)"
+        })
+        second_person = _add_suffix(stem, "est")
+        if second_person in SUPERLATIVE_FORMS:
+            continue
+        entries.append({
+            "word": second_person,
+            "modernEquivalent": f"(you) {stem}",
+            "definitionKo": f"thou와 함께 쓰는 '{stem}'의 2인칭 단수형 (고어 어미 -est)"
+        })
+    for word, modern in IRREGULAR_FORMS.items():
+        entries.append({
+            "word": word,
+            "modernEquivalent": modern,
+            "definitionKo": f"'{modern}'의 고어 불규칙형"
+        })
+    return entries
+
+
+def expand_forms(word: str, category: str = None) -> list:
+    """사전 항목 하나에 대해 같은 항목으로 등록할 변이형 목록 (기본형 제외, 소문자)"""
+    word = word.lower()
+    forms = list(VARIANT_FORMS.get(word, ()))
+    if category == "noun" and " " not in word and not word.endswith("s"):
+        forms.append(word + "s")
+    return forms
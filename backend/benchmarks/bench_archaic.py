@@ -0,0 +1,104 @@
+"""
+고어 감지 처리량 벤치마크: 기본형만 넣은 트라이 vs 굴절형까지 펼친 트라이
+
+seed_archaic_words의 사전으로 메모리 DB를 채운 뒤 -eth/-est 굴절형이 많은 책 전체 본문에 대해
+  - exact: 굴절형 확장 없이 사전 기본형만 (knoweth, sayest 등은 놓침)
+  - inflected: archaic_inflections의 굴절형 항목/변이형을 넣은 현재 감지기
+의 detect() 처리량(MB/s)과 찾은 등장 횟수를 비교하고, 굴절형 덕분에 더 찾은 횟수와
+가장 많이 나온 굴절형을 출력한다. 둘 다 텍스트를 한 번 훑는다.
+
+책 본문은 기본으로 Gutenberg의 Hamlet(#1524)을 scripts/gutenberg_api로 받아 임시 디렉터리에
+캐시해 쓰고(첫 실행만 네트워크 필요), .txt 경로를 주면 그 파일 전체를 쓴다.
+
+사용법: cd backend && python benchmarks/bench_archaic.py [반복 수] [책.txt]
+"""
+import os
+import sys
+import sqlite3
+import tempfile
+import timeit
+from collections import Counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "scripts"))
+
+import archaic_detector  # noqa: E402
+from archaic_detector import ArchaicDetector, ARCHAIC_SQL, SHIFTS_SQL  # noqa: E402
+from database import MIGRATIONS, InstrumentedSQLiteConnection, _sqlite_row_factory  # noqa: E402
+from seed_archaic_words import seed_archaic_words, seed_semantic_shifts  # noqa: E402
+
+DEFAULT_GUTENBERG_ID = 1524  # Shakespeare, Hamlet - knoweth, speakest, canst 등 굴절형이 많음
+
+
+def load_dictionary():
+    conn = sqlite3.connect(":memory:", factory=InstrumentedSQLiteConnection)
+    conn.row_factory = _sqlite_row_factory
+    for _version, _description, statements in MIGRATIONS:
+        for sql in statements:
+            conn.execute(sql)
+    seed_archaic_words(conn)
+    seed_semantic_shifts(conn)
+    return conn.execute(ARCHAIC_SQL).fetchall(), conn.execute(SHIFTS_SQL).fetchall()
+
+
+def load_book(path=None):
+    if path:
+        with open(path, encoding="utf-8") as f:
+            return os.path.basename(path), f.read()
+    cache = os.path.join(tempfile.gettempdir(), f"gutenberg-{DEFAULT_GUTENBERG_ID}.txt")
+    if not os.path.exists(cache):
+        from gutenberg_api import download_book_text
+        try:
+            text = download_book_text(DEFAULT_GUTENBERG_ID)
+        except Exception as e:
+            sys.exit(f"[bench] 기본 책을 받지 못했습니다 ({e}) - 굴절형이 들어 있는 .txt 경로를 인자로 주세요")
+        with open(cache, "w", encoding="utf-8") as f:
+            f.write(text)
+    with open(cache, encoding="utf-8") as f:
+        return f"gutenberg #{DEFAULT_GUTENBERG_ID}", f.read()
+
+
+def build_exact(archaic_rows, shift_rows):
+    """굴절형 확장을 끈 감지기 (확장 도입 전과 같은 트라이)"""
+    expand_forms, inflected_entries = archaic_detector.expand_forms, archaic_detector.inflected_entries
+    archaic_detector.expand_forms = lambda word, category=None: []
+    archaic_detector.inflected_entries = lambda: []
+    try:
+        return ArchaicDetector("exact", archaic_rows, shift_rows)
+    finally:
+        archaic_detector.expand_forms, archaic_detector.inflected_entries = expand_forms, inflected_entries
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    title, text = load_book(sys.argv[2] if len(sys.argv) > 2 else None)
+    archaic_rows, shift_rows = load_dictionary()
+    megabytes = len(text.encode("utf-8")) / 1e6
+
+    detectors = (
+        ("exact", build_exact(archaic_rows, shift_rows)),
+        ("inflected", ArchaicDetector("inflected", archaic_rows, shift_rows)),
+    )
+
+    print(f"book={title!r}, size={megabytes:.2f} MB, number={number}")
+    matches = {}
+    for name, detector in detectors:
+        matches[name] = sum(1 for _ in detector._scan(text))
+        for positions in (False, True):
+            best = min(timeit.repeat(lambda: detector.detect(text, positions=positions), number=number, repeat=5))
+            label = f"{name} positions={positions}"
+            print(f"{label:26s} {megabytes * number / best:7.2f} MB/s  matches={matches[name]}")
+
+    inflected = detectors[1][1]
+    # 굴절형 항목(사전 뒤에 덧붙인 항목)으로 찾은 단어 - 사전 변이형(doeth 등)은 원래 항목으로 세므로 빠짐
+    forms = Counter(
+        text[start:end].lower() for start, end, refs in inflected._scan(text)
+        if any(kind == 0 and i >= inflected.dictionary_words for kind, i in refs)
+    )
+    print(f"inflected forms: {inflected.stats()['inflectedForms']}, "
+          f"extra matches: {matches['inflected'] - matches['exact']}")
+    print("top inflected:", ", ".join(f"{form}={count}" for form, count in forms.most_common(10)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+영웅 응답 변환 벤치마크: 요청마다 row_to_hero vs 디코딩된 영웅 인덱스 조회
+
+seed_data.seed_heroes로 메모리 DB를 채운 뒤
+  - before: 요청마다 Row -> row_to_hero (json.loads 6개 컬럼, scenarios 포함)
+  - after: catalog_version당 한 번 만든 인덱스에서 목록/단건 조회
+를 비교한다. /heroes 목록과 /heroes/{id} 단건 두 패턴을 측정.
+
+사용법: cd backend && python benchmarks/bench_heroes.py [반복 수]
+"""
+import os
+import sys
+import sqlite3
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from database import MIGRATIONS, InstrumentedSQLiteConnection, _sqlite_row_factory  # noqa: E402
+from seed_data import seed_heroes  # noqa: E402
+from routers.heroes import row_to_hero  # noqa: E402
+
+
+def load_rows():
+    conn = sqlite3.connect(":memory:", factory=InstrumentedSQLiteConnection)
+    conn.row_factory = _sqlite_row_factory
+    for _version, _description, statements in MIGRATIONS:
+        for sql in statements:
+            conn.execute(sql)
+    seed_heroes(conn)
+    return conn.execute("SELECT * FROM heroes").fetchall()
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    rows = load_rows()
+    hero_id = rows[len(rows) // 2]["id"]
+
+    # after: routers.heroes.get_hero_index와 같은 구조
+    heroes = [row_to_hero(row) for row in rows]
+    by_id = {hero["id"]: hero for hero in heroes}
+
+    cases = (
+        ("list   before", lambda: [row_to_hero(row) for row in rows]),
+        ("list   after", lambda: list(heroes)),
+        ("detail before", lambda: row_to_hero(next(row for row in rows if row["id"] == hero_id))),
+        ("detail after", lambda: by_id[hero_id]),
+    )
+
+    print(f"heroes={len(rows)}, number={number}")
+    for name, func in cases:
+        best = min(timeit.repeat(func, number=number, repeat=5))
+        print(f"{name:14s} {best / number * 1e6:9.2f} us/request")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+행 표현 벤치마크: libsql ResultSet 행 처리 - 기존 경로 vs database.Row
+
+libsql_client가 돌려주는 것과 같은 ResultSet(libsql_client.Row 행)을 /books 응답처럼
+챕터 본문이 포함된 결과로 만들어, 각 경로의
+(1) fetchall 변환, (2) row_to_chapter 형태의 컬럼 접근 시간과 변환 결과의 메모리를 비교한다.
+  - libsql dict(zip()): 이전 TursoCursor.fetchall (행마다 dict(zip(result.columns, row)))
+  - libsql Row: 변환 없이 libsql_client.Row를 그대로 컬럼명으로 접근 (참고용)
+  - database.Row: 현재 _result_to_rows (결과셋당 인덱스 맵 1개 공유, 값 튜플 재사용)
+DB 연결은 필요 없음.
+
+사용법: cd backend && python benchmarks/bench_rows.py [행 수]
+"""
+import os
+import sys
+import timeit
+import tracemalloc
+
+from libsql_client import ResultSet, Row as LibsqlRow
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from database import _result_to_rows  # noqa: E402
+
+COLUMNS = ("id", "book_id", "chapter_number", "title", "content", "word_count", "vocabulary")
+
+
+def make_result(n):
+    """libsql_client가 HTTP 응답에서 만드는 것과 같은 형태의 ResultSet"""
+    content = "lorem ipsum " * 700  # 챕터 본문 ~8000자
+    column_idxs = {name: i for i, name in enumerate(COLUMNS)}
+    rows = [
+        LibsqlRow(column_idxs, (i, f"book-{i // 20}", i % 20 + 1, f"Chapter {i}", content, 1400, '["a", "b"]'))
+        for i in range(n)
+    ]
+    return ResultSet(COLUMNS, rows, 0, None)
+
+
+def legacy_fetchall(result):
+    """이전 TursoCursor.fetchall"""
+    return [dict(zip(result.columns, row)) for row in result.rows]
+
+
+def libsql_rows(result):
+    return result.rows
+
+
+def consume(rows):
+    # routers/books.row_to_chapter와 같은 접근 패턴
+    for row in rows:
+        (row["chapter_number"], row["title"], row["content"], row["word_count"], row["vocabulary"])
+
+
+def measure_memory(build, result):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    built = build(result)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del built
+    return after - before
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    result = make_result(n)
+    repeat = 20
+
+    print(f"rows={n}, repeat={repeat}")
+    timings = {}
+    for name, build in (("libsql dict(zip())", legacy_fetchall), ("libsql Row", libsql_rows),
+                        ("database.Row", _result_to_rows)):
+        build_time = min(timeit.repeat(lambda: build(result), number=1, repeat=repeat))
+        built = build(result)
+        access_time = min(timeit.repeat(lambda: consume(built), number=1, repeat=repeat))
+        memory = measure_memory(build, result)
+        timings[name] = build_time + access_time
+        print(
+            f"{name:18s} fetchall {build_time * 1000:8.2f} ms   "
+            f"access {access_time * 1000:8.2f} ms   "
+            f"memory {memory / 1024:8.1f} KiB ({memory / n:.0f} B/row)"
+        )
+    legacy, current = timings["libsql dict(zip())"], timings["database.Row"]
+    print(f"fetchall + access: legacy {legacy * 1000:.2f} ms -> database.Row {current * 1000:.2f} ms "
+          f"({legacy / current:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+카탈로그 응답 직렬화 벤치마크: response_model 경로 vs 미리 직렬화한 JSON 바이트
+
+같은 /books 데이터를 두 방식으로 내려주는 FastAPI 앱을 만들어 초당 요청 수를 비교한다.
+  - response_model: 요청마다 row_to_book/row_to_chapter(json.loads 포함) +
+    List[BookWithChapters] 검증 + FastAPI JSON 인코딩 (캐시 도입 전 /books 경로)
+  - bytes: catalog_cache.render_json으로 한 번 만든 바이트를 그대로 응답
+DB 없이 합성한 Row로 측정하므로 DB 조회 시간은 포함되지 않는다.
+
+사용법: cd backend && python benchmarks/bench_serialization.py [책 수] [요청 수]
+"""
+import os
+import sys
+import json
+import time
+import asyncio
+from typing import List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import httpx  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+
+from database import Row, _column_index  # noqa: E402
+from catalog_cache import render_json, json_response  # noqa: E402
+from models import BookWithChapters  # noqa: E402
+from routers.books import row_to_book, group_chapters  # noqa: E402
+
+BOOK_COLUMNS = (
+    "id", "title", "author", "difficulty", "genre", "year", "description", "cover_color",
+    "cover_image", "word_count", "reading_time", "learning_focus", "hero_id",
+)
+CHAPTER_COLUMNS = ("id", "book_id", "chapter_number", "title", "content", "word_count", "vocabulary")
+
+
+def make_rows(n_books, chapters_per_book=3):
+    book_index = _column_index(BOOK_COLUMNS)
+    chapter_index = _column_index(CHAPTER_COLUMNS)
+    content = "It was the best of times, it was the worst of times. " * 120  # 챕터 본문 ~6000자
+    books, chapters = [], []
+    for i in range(n_books):
+        book_id = f"book-{i}"
+        books.append(Row(book_index, (
+            book_id, f"Book {i}", "Author", "beginner", "fable", 1850, "A classic story.",
+            "#8B4513", None, 3000, "15분", json.dumps(["vocabulary", "grammar"]), None,
+        )))
+        for n in range(1, chapters_per_book + 1):
+            chapters.append(Row(chapter_index, (
+                i * chapters_per_book + n, book_id, n, f"Chapter {n}", content, 1100,
+                json.dumps(["thee", "thou", "hath", "doth"]),
+            )))
+    return books, chapters
+
+
+def build_books(book_rows, chapter_rows):
+    chapters_by_book = group_chapters(chapter_rows)
+    result = []
+    for book_row in book_rows:
+        book_data = row_to_book(book_row)
+        book_data["chapters"] = chapters_by_book.get(book_row["id"], [])
+        result.append(book_data)
+    return result
+
+
+def make_app(book_rows, chapter_rows):
+    app = FastAPI()
+    body = render_json(build_books(book_rows, chapter_rows), List[BookWithChapters])
+
+    @app.get("/model", response_model=List[BookWithChapters])
+    async def via_response_model():
+        return build_books(book_rows, chapter_rows)
+
+    @app.get("/bytes", response_model=List[BookWithChapters])
+    async def via_bytes():
+        return json_response(body)
+
+    return app, len(body)
+
+
+async def run(app, path, requests):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        first = await client.get(path)
+        first.raise_for_status()
+        start = time.perf_counter()
+        for _ in range(requests):
+            await client.get(path)
+        elapsed = time.perf_counter() - start
+    return first.content, requests / elapsed
+
+
+async def main():
+    n_books = int(sys.argv[1]) if len(sys.argv) > 1 else 14
+    requests = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    book_rows, chapter_rows = make_rows(n_books)
+    app, size = make_app(book_rows, chapter_rows)
+
+    print(f"books={n_books}, chapters={len(chapter_rows)}, body={size / 1024:.1f} KiB, requests={requests}")
+    results = {}
+    for name, path in (("response_model", "/model"), ("bytes", "/bytes")):
+        content, rps = await run(app, path, requests)
+        results[name] = (content, rps)
+        print(f"{name:15s} {rps:9.1f} req/s")
+
+    same = json.loads(results["response_model"][0]) == json.loads(results["bytes"][0])
+    print(f"speedup x{results['bytes'][1] / results['response_model'][1]:.1f}, identical payload: {same}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
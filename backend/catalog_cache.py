@@ -0,0 +1,171 @@
+"""카탈로그 응답 캐시
+
+books/heroes 같은 카탈로그 데이터는 seed/ingest 스크립트를 돌릴 때만 바뀐다.
+스크립트가 catalog_meta에 기록하는 catalog_version(내용 해시)을 키로 응답을
+메모리에 보관하고, 같은 버전 동안은 DB 조회와 변환 없이 그대로 돌려준다.
+ETag도 버전에서 만들기 때문에 If-None-Match가 맞으면 304로 바로 응답한다.
+
+응답은 처음 만들 때 한 번만 검증/직렬화해 JSON 바이트로 저장하고, 이후에는
+response_model 검증과 JSON 인코딩 없이 바이트를 그대로 내려준다.
+"""
+import os
+import json
+import time
+import hashlib
+from functools import lru_cache
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+from database import get_async_catalog_db
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json으로 (출력 형식 동일)
+    orjson = None
+
+CATALOG_VERSION_TTL = float(os.getenv("CATALOG_VERSION_TTL", "30"))  # catalog_version 재확인 주기(초)
+CATALOG_CACHE_MAX_AGE = int(os.getenv("CATALOG_CACHE_MAX_AGE", "60"))  # Cache-Control max-age(초)
+CATALOG_CACHE_MAX_ENTRIES = int(os.getenv("CATALOG_CACHE_MAX_ENTRIES", "512"))
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match 헤더(목록, *, W/ 접두사 포함)가 etag와 일치하는지"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+@lru_cache(maxsize=None)
+def _type_adapter(model):
+    return TypeAdapter(model)
+
+
+def render_json(data, model=None) -> bytes:
+    """응답 데이터를 compact JSON 바이트로 직렬화
+
+    model이 있으면 response_model과 같은 방식으로 검증/필터링한 뒤 pydantic의
+    직렬화기로, 없으면 orjson(없으면 json)으로 인코딩한다.
+    """
+    if model is not None:
+        adapter = _type_adapter(model)
+        return adapter.dump_json(adapter.validate_python(data))
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class CatalogCache:
+    """catalog_version 단위로 무효화되는 응답 캐시"""
+
+    def __init__(self, ttl=CATALOG_VERSION_TTL, max_entries=CATALOG_CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.version = None
+        self._checked_at = 0.0
+        self._entries = {}  # key -> (etag, JSON bytes)
+
+    async def _load_version(self):
+        try:
+            async with get_async_catalog_db() as conn:
+                cursor = conn.cursor()
+                await cursor.execute("SELECT value FROM catalog_meta WHERE key = 'catalog_version'")
+                row = await cursor.fetchone()
+            return row["value"] if row else None
+        except Exception as e:
+            # 마이그레이션 전 DB 등 catalog_meta가 없으면 캐시 없이 동작
+            print(f"[catalog-cache] catalog_version 조회 실패: {e}")
+            return None
+
+    async def current_version(self):
+        """catalog_version 반환 (TTL 동안은 메모리 값 사용). 버전이 바뀌면 캐시 비움"""
+        now = time.monotonic()
+        if now - self._checked_at < self.ttl:
+            return self.version
+        version = await self._load_version()
+        self._checked_at = now
+        if version != self.version:
+            if self.version is not None:
+                print(f"[catalog-cache] catalog_version 변경 {self.version[:12]} -> {(version or '-')[:12]}, 캐시 초기화")
+            self._entries.clear()
+            self.version = version
+        return version
+
+    def invalidate(self):
+        """다음 요청에서 catalog_version을 다시 읽도록 강제 (레플리카 갱신 직후 등)"""
+        self._checked_at = 0.0
+        self._entries.clear()
+
+    def etag_for(self, version: str, key: str) -> str:
+        key_hash = hashlib.sha1(key.encode("utf-8")).hexdigest()[:8]
+        return f'"{version[:16]}-{key_hash}"'
+
+    def get(self, key: str):
+        return self._entries.get(key)
+
+    def put(self, key: str, etag: str, body: bytes):
+        if len(self._entries) >= self.max_entries:
+            # 가장 오래된 항목부터 제거 (dict 삽입 순서)
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (etag, body)
+
+    def stats(self):
+        return {
+            "version": self.version,
+            "entries": len(self._entries),
+            "bytes": sum(len(body) for _etag, body in self._entries.values()),
+            "maxEntries": self.max_entries,
+            "versionTtl": self.ttl,
+        }
+
+
+catalog_cache = CatalogCache()
+
+
+def json_response(body: bytes, headers=None) -> Response:
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+async def catalog_conditional(request: Request, key: str):
+    """key에 대한 (캐시 헤더, 304 응답) 반환
+
+    If-None-Match가 현재 ETag와 같으면 두 번째 값이 304 응답. catalog_version이
+    없으면(seed 전) (None, None) - ETag 없이 매번 새로 응답해야 함.
+    """
+    version = await catalog_cache.current_version()
+    if version is None:
+        return None, None
+    etag = catalog_cache.etag_for(version, key)
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={CATALOG_CACHE_MAX_AGE}"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return headers, Response(status_code=304, headers=headers)
+    return headers, None
+
+
+async def cached_catalog_response(request: Request, key: str, build, model=None) -> Response:
+    """key에 해당하는 카탈로그 응답을 캐시에서 꺼내거나 build()로 만들어 저장
+
+    build()가 만든 데이터는 model(라우트의 response_model)로 한 번 검증해 JSON
+    바이트로 저장. If-None-Match가 현재 ETag와 같으면 DB/JSON 작업 없이 304를 반환.
+    catalog_version이 없으면(seed 전) 캐시와 ETag 없이 매번 build()로 응답.
+    """
+    headers, not_modified = await catalog_conditional(request, key)
+    if not_modified is not None:
+        return not_modified
+    if headers is None:
+        return json_response(render_json(await build(), model))
+
+    entry = catalog_cache.get(key)
+    if entry is None:
+        body = render_json(await build(), model)
+        catalog_cache.put(key, headers["ETag"], body)
+    else:
+        body = entry[1]
+
+    return json_response(body, headers)
@@ -0,0 +1,70 @@
+"""
+고어 감지 결과 검사 (굴절형 오탐/누락 회귀 확인)
+
+메모리 SQLite DB에 seed_archaic_words의 사전을 채워 감지기를 만든 뒤, 정해 둔 문장마다
+detect()가 찾은 고어 단어 목록이 기대값과 같은지 확인한다. 현대 영어 최상급(meanest)이나
+명사(forest)를 -est 2인칭형으로 잘못 감지하거나, 굴절형(knoweth)을 놓치거나, 변이형(doeth)이
+사전 단어로 연결되지 않으면 실패(exit 1)한다.
+
+사용법: python check_archaic_detection.py
+"""
+import sys
+import sqlite3
+
+from archaic_detector import ArchaicDetector, ARCHAIC_SQL, SHIFTS_SQL
+from database import MIGRATIONS, InstrumentedSQLiteConnection, _sqlite_row_factory
+from seed_archaic_words import seed_archaic_words, seed_semantic_shifts
+
+# (문장, 기대하는 고어 단어 목록 - detect() 결과 순서대로)
+CASES = (
+    ("the meanest man", []),
+    ("the openest field and the likest copy", []),
+    ("the greatest forest", []),
+    ("He knoweth not what thou sayest.", ["knoweth", "sayest", "thou"]),
+    ("What meanest thou? He meaneth well.", ["meaneth", "thou"]),
+    ("Methought he doeth well.", ["doth", "methinks"]),
+    ("Canst thou? He saith so.", ["canst", "saith", "thou"]),
+)
+
+# (단어, resolve_term() 기대값) - /terms/{term}/chapters가 조회하는 색인 키
+RESOLVE_CASES = (
+    ("doeth", [("archaic", "doth")]),
+    ("Methought", [("archaic", "methinks")]),
+    ("knoweth", [("archaic", "knoweth")]),
+    ("meanest", []),
+)
+
+
+def load_detector():
+    conn = sqlite3.connect(":memory:", factory=InstrumentedSQLiteConnection)
+    conn.row_factory = _sqlite_row_factory
+    for _version, _description, statements in MIGRATIONS:
+        for sql in statements:
+            conn.execute(sql)
+    seed_archaic_words(conn)
+    seed_semantic_shifts(conn)
+    detector = ArchaicDetector(None, conn.execute(ARCHAIC_SQL).fetchall(), conn.execute(SHIFTS_SQL).fetchall())
+    conn.close()
+    return detector
+
+
+def main():
+    detector = load_detector()
+    failures = 0
+    for text, expected in CASES:
+        found = [entry["word"] for entry in detector.detect(text)["archaicWords"]]
+        ok = found == expected
+        failures += not ok
+        print(f"[{'OK' if ok else 'FAIL'}] {text!r:45s} archaic={found}" + ("" if ok else f" (expected {expected})"))
+    for term, expected in RESOLVE_CASES:
+        found = detector.resolve_term(term)
+        ok = found == expected
+        failures += not ok
+        print(f"[{'OK' if ok else 'FAIL'}] resolve {term!r:37s} -> {found}" + ("" if ok else f" (expected {expected})"))
+
+    print(f"{failures} failures")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,168 @@
+"""
+라우터 SQL 쿼리 플랜 검사
+
+routers/*.py의 SELECT 문을 모아 마이그레이션이 적용된 빈 SQLite DB에서
+EXPLAIN QUERY PLAN을 실행하고, WHERE 조건이 있는데 인덱스 없이
+테이블 전체를 스캔하는 쿼리가 있으면 실패(exit 1)한다.
+
+문자열 상수뿐 아니라 f-string과 + 연결도 검사한다. 모듈 상수(HERO_CARD_SQL 등)는
+값으로 바꾸고, 요청마다 만드는 조각({where} 등)은 DYNAMIC_FRAGMENTS에 등록한
+대표 SQL로 바꾼다. 등록되지 않은 동적 조각이 있는 SELECT도 실패로 처리한다.
+
+사용법: python check_query_plans.py
+"""
+import ast
+import os
+import re
+import sqlite3
+import sys
+
+from database import MIGRATIONS
+
+ROUTERS_DIR = os.path.join(os.path.dirname(__file__), "routers")
+
+# "SCAN books USING INDEX ..."(정렬용 인덱스 순회)도 결국 모든 행을 방문하므로 풀스캔으로 취급
+FULL_SCAN = re.compile(r"^SCAN \w+\b")
+# 가상 테이블(FTS5 MATCH 등)은 모듈 자체 색인으로 찾고, sqlite_master는 스키마 크기만큼이라 제외
+NOT_FULL_SCAN = re.compile(r"^SCAN (sqlite_master\b|\w+ VIRTUAL TABLE\b)")
+
+# 요청마다 만드는 SQL 조각 -> 검사에 쓸 대표 SQL ((파일, f-string 안의 식) 기준)
+DYNAMIC_FRAGMENTS = {
+    # GET /chapters?ids= - (book_id, chapter_number) OR 체인
+    ("chapters.py", "where"): "(book_id = ? AND chapter_number = ?) OR (book_id = ? AND chapter_number = ?)",
+    # GET /terms/{term}/chapters - 감지기가 연결하는 (사전 단어, kind) 쌍마다 조건 하나
+    ("words.py", "where"): "(term = ? AND kind = ?) OR (term = ? AND kind = ?)",
+    # GET /search LIKE 대체 검색 - 검색어마다 조건 하나
+    ("search.py", "where"): "(c.title LIKE ? ESCAPE '\\' OR c.content LIKE ? ESCAPE '\\') "
+                            "AND (c.title LIKE ? ESCAPE '\\' OR c.content LIKE ? ESCAPE '\\')",
+}
+
+# 의도적으로 전체를 스캔하는 쿼리 ((파일, SQL에 포함된 문자열)) - 결과에는 표시만 하고 실패로 치지 않음
+ALLOWED_SCANS = [
+    # FTS5 색인이 없는 DB용 /search 대체 검색 (본문 LIKE는 색인을 쓸 수 없음)
+    ("search.py", "c.content LIKE ?"),
+]
+
+
+class DynamicSQL(Exception):
+    """DYNAMIC_FRAGMENTS에 없는 식이 들어간 SQL"""
+
+
+def _module_constants(tree):
+    """모듈 최상위 NAME = "..." / 숫자 상수 (앞에서 정의한 상수를 쓰는 f-string/연결도 풀어서)"""
+    constants = {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            try:
+                value = _render(node.value, constants, None)
+            except DynamicSQL:
+                continue
+            constants[node.targets[0].id] = value
+    return constants
+
+
+def _render(node, constants, filename):
+    """문자열 식 -> SQL 문자열 (상수/모듈 상수/등록된 동적 조각만 허용)"""
+    if isinstance(node, ast.Constant) and isinstance(node.value, (str, int, float)):
+        return str(node.value)
+    if isinstance(node, ast.Name) and node.id in constants:
+        return constants[node.id]
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        return _render(node.left, constants, filename) + _render(node.right, constants, filename)
+    if isinstance(node, ast.JoinedStr):
+        return "".join(_render(part, constants, filename) for part in node.values)
+    if isinstance(node, ast.FormattedValue):
+        try:
+            return _render(node.value, constants, filename)
+        except DynamicSQL:
+            fragment = DYNAMIC_FRAGMENTS.get((filename, ast.unparse(node.value)))
+            if fragment is None:
+                raise
+            return fragment
+    raise DynamicSQL(ast.unparse(node))
+
+
+def _is_select(sql):
+    return sql.upper().startswith("SELECT ") and " FROM " in sql.upper()
+
+
+def collect_router_queries():
+    """라우터 소스의 SELECT 문 수집 -> ([(파일:라인, sql)], [(파일:라인, 풀 수 없는 식)])
+
+    문자열 상수, f-string, + 연결을 모두 보며 f-string/연결 안의 조각은 따로 세지 않는다.
+    """
+    queries, unresolved = [], []
+    for name in sorted(os.listdir(ROUTERS_DIR)):
+        if not name.endswith(".py"):
+            continue
+        path = os.path.join(ROUTERS_DIR, name)
+        with open(path, encoding="utf-8") as f:
+            tree = ast.parse(f.read(), filename=path)
+        constants = _module_constants(tree)
+
+        nested = set()
+        for node in ast.walk(tree):
+            if id(node) in nested:
+                continue
+            if isinstance(node, (ast.JoinedStr, ast.BinOp)):
+                nested.update(id(child) for child in ast.walk(node) if child is not node)
+            elif not (isinstance(node, ast.Constant) and isinstance(node.value, str)):
+                continue
+            location = f"{name}:{node.lineno}"
+            try:
+                sql = " ".join(_render(node, constants, name).split())
+            except DynamicSQL as e:
+                # SELECT로 시작하는 동적 SQL인데 대표 SQL이 없으면 검사할 수 없음
+                head = node.values[0] if isinstance(node, ast.JoinedStr) and node.values else node
+                text = head.value if isinstance(head, ast.Constant) and isinstance(head.value, str) else ""
+                if text.strip().upper().startswith("SELECT "):
+                    unresolved.append((location, str(e)))
+                continue
+            if _is_select(sql):
+                queries.append((location, sql))
+    return queries, unresolved
+
+
+def _allowed_scan(location, sql):
+    filename = location.split(":")[0]
+    return any(filename == allowed_file and marker in sql for allowed_file, marker in ALLOWED_SCANS)
+
+
+def build_schema():
+    conn = sqlite3.connect(":memory:")
+    for _version, _description, steps in MIGRATIONS:
+        for sql in steps:
+            conn.execute(sql)
+    return conn
+
+
+def main():
+    conn = build_schema()
+    failures, allowed = [], []
+    queries, unresolved = collect_router_queries()
+
+    for location, sql in queries:
+        # WHERE 없는 전체 목록 조회는 풀스캔이 정상
+        if " WHERE " not in sql.upper():
+            continue
+        params = [None] * sql.count("?")
+        plan = conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+        scans = [detail for *_ids, detail in plan if FULL_SCAN.match(detail) and not NOT_FULL_SCAN.match(detail)]
+        if scans:
+            (allowed if _allowed_scan(location, sql) else failures).append((location, sql, scans))
+
+    for label, entries in (("ALLOWED SCAN", allowed), ("FULL SCAN", failures)):
+        for location, sql, scans in entries:
+            print(f"[{label}] {location}: {sql}")
+            for detail in scans:
+                print(f"    {detail}")
+    for location, expression in unresolved:
+        print(f"[UNCHECKED] {location}: 동적 조각 {{{expression}}} - DYNAMIC_FRAGMENTS에 대표 SQL 등록 필요")
+
+    print(f"{len(queries)} queries checked, {len(failures)} full scans, "
+          f"{len(allowed)} allowed scans, {len(unresolved)} unchecked")
+    return 1 if failures or unresolved else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
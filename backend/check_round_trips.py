@@ -0,0 +1,87 @@
+"""
+카탈로그 목록 조회의 DB 왕복 횟수 검사
+
+메모리 SQLite DB에 책 N권, 2N권을 채우고 /books, /books/summary의 로더를
+database.track_request_queries() 안에서 실행해, 책 수와 무관하게 왕복(쿼리 또는
+batch 요청)이 1회인지 확인한다. 책마다 챕터를 따로 조회하는 N+1 회귀가 생기면
+실패(exit 1)한다.
+
+사용법: python check_round_trips.py [N]
+"""
+import sys
+import asyncio
+from contextlib import asynccontextmanager
+
+import aiosqlite
+
+from database import (
+    MIGRATIONS, AsyncSQLiteConnection, InstrumentedSQLiteConnection, _sqlite_row_factory, track_request_queries,
+)
+from routers import books
+
+CHAPTERS_PER_BOOK = 3
+
+# (이름, 로더) - 각각 전체 목록과 난이도 필터를 모두 검사
+LOADERS = (
+    ("_load_books", books._load_books),
+    ("_load_book_summaries", books._load_book_summaries),
+)
+
+
+async def open_memory_db(n_books):
+    conn = await aiosqlite.connect(":memory:", factory=InstrumentedSQLiteConnection)
+    conn.row_factory = _sqlite_row_factory
+    for _version, _description, statements in MIGRATIONS:
+        for sql in statements:
+            await conn.execute(sql)
+    await conn.executemany(
+        "INSERT INTO books (id, title, author, difficulty, word_count) VALUES (?, ?, ?, ?, ?)",
+        [(f"book-{i}", f"Book {i}", "Author", ("easy", "medium", "advanced")[i % 3], 1000) for i in range(n_books)]
+    )
+    await conn.executemany(
+        "INSERT INTO chapters (book_id, chapter_number, title, content, word_count) VALUES (?, ?, ?, ?, ?)",
+        [(f"book-{i}", n, f"Chapter {n}", "Once upon a time.", 4)
+         for i in range(n_books) for n in range(1, CHAPTERS_PER_BOOK + 1)]
+    )
+    await conn.commit()
+    return AsyncSQLiteConnection(conn, "sqlite")
+
+
+async def count_round_trips(n_books):
+    """[(로더 호출, 반환한 책 수, 왕복 횟수)]"""
+    conn = await open_memory_db(n_books)
+
+    @asynccontextmanager
+    async def memory_catalog_db():
+        yield conn
+
+    original = books.get_async_catalog_db
+    books.get_async_catalog_db = memory_catalog_db
+    results = []
+    try:
+        for name, loader in LOADERS:
+            for difficulty in (None, "easy"):
+                with track_request_queries() as usage:
+                    loaded = await loader(difficulty)
+                results.append((f"{name}({difficulty!r})", len(loaded), usage.count))
+    finally:
+        books.get_async_catalog_db = original
+        await conn.close()
+    return results
+
+
+async def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    failures = 0
+    for n_books in (n, 2 * n):
+        for call, loaded, count in await count_round_trips(n_books):
+            ok = count == 1
+            failures += not ok
+            print(f"[{'OK' if ok else 'FAIL'}] books={n_books:4d} {call:32s} loaded={loaded:4d} round_trips={count}")
+
+    print(f"{failures} failures")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -1,5 +1,14 @@
 import os
-from contextlib import contextmanager
+import re
+import time
+import hashlib
+import asyncio
+import tempfile
+import threading
+import contextvars
+from collections import deque
+from functools import lru_cache
+from contextlib import contextmanager, asynccontextmanager
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -14,14 +23,325 @@ LOCAL_DATABASE_PATH = os.path.join(os.path.dirname(__file__), "data", "classics.
 # Turso 사용 여부
 USE_TURSO = bool(TURSO_DATABASE_URL and TURSO_AUTH_TOKEN)
 
+# 커넥션 풀 설정
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "8"))  # 동시에 빌려줄 수 있는 최대 커넥션 수
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "10"))  # 풀이 꽉 찼을 때 대기 시간 (초)
+DB_POOL_MAX_IDLE = float(os.getenv("DB_POOL_MAX_IDLE", "300"))  # 이 시간 이상 놀고 있던 커넥션은 폐기 (초)
+DB_POOL_HEALTHCHECK_AFTER = float(os.getenv("DB_POOL_HEALTHCHECK_AFTER", "30"))  # 이 시간 이상 놀던 커넥션은 SELECT 1로 확인 (초)
+
+# Turso batch 크기 제한 (executemany / bulk_insert가 한 요청에 담는 양)
+TURSO_BATCH_MAX_ROWS = int(os.getenv("TURSO_BATCH_MAX_ROWS", "200"))
+TURSO_BATCH_MAX_BYTES = int(os.getenv("TURSO_BATCH_MAX_BYTES", str(2 * 1024 * 1024)))
+
+# 쿼리 계측 설정
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "200"))  # 이 시간 이상 걸린 쿼리는 slow-query 로그 출력
+QUERY_STATS_SAMPLES = int(os.getenv("QUERY_STATS_SAMPLES", "500"))  # fingerprint당 백분위 계산용 최근 측정값 수
+
+# 카탈로그 로컬 레플리카 (Turso 모드 전용)
+# 거의 바뀌지 않는 카탈로그 테이블을 로컬 SQLite 파일로 복제해 읽기는 로컬에서, 쓰기는 Turso로
+CATALOG_TABLES = ("heroes", "books", "chapters", "archaic_words", "semantic_shifts")
+# 카탈로그에서 파생된 색인 테이블과 카탈로그 버전도 함께 복제해 레플리카 내용과 일치시킴
+REPLICA_TABLES = CATALOG_TABLES + ("chapter_term_occurrences", "catalog_meta")
+CATALOG_REPLICA_ENABLED = USE_TURSO and os.getenv("CATALOG_REPLICA", "").lower() in ("1", "true", "yes")
+CATALOG_REPLICA_PATH = os.getenv(
+    "CATALOG_REPLICA_PATH",
+    os.path.join(os.path.dirname(__file__), "data", "catalog_replica.db")
+)
+CATALOG_REPLICA_SYNC_INTERVAL = float(os.getenv("CATALOG_REPLICA_SYNC_INTERVAL", "0"))  # 주기 동기화 간격 (초, 0이면 시작 시에만)
+
+# 로컬 SQLite는 폴백 DB와 카탈로그 레플리카 양쪽에서 사용
+import sqlite3
+import aiosqlite
+
 if USE_TURSO:
     import libsql_client
     print(f"Using Turso database: {TURSO_DATABASE_URL}")
 else:
-    import sqlite3
     print(f"Using local SQLite database: {LOCAL_DATABASE_PATH}")
 
 
+def _param_size(value):
+    """batch 요청 크기 추정용 - 파라미터 하나의 대략적인 바이트 수"""
+    if isinstance(value, (str, bytes)):
+        return len(value)
+    return 8
+
+
+def _chunk_params(sql, params_list):
+    """executemany 파라미터를 TURSO_BATCH_MAX_ROWS / TURSO_BATCH_MAX_BYTES 이하의 청크로 분할"""
+    chunk, chunk_bytes = [], 0
+    for params in params_list:
+        size = len(sql) + sum(_param_size(v) for v in params)
+        if chunk and (len(chunk) >= TURSO_BATCH_MAX_ROWS or chunk_bytes + size > TURSO_BATCH_MAX_BYTES):
+            yield chunk
+            chunk, chunk_bytes = [], 0
+        chunk.append(params)
+        chunk_bytes += size
+    if chunk:
+        yield chunk
+
+
+def _insert_sql(table, columns, or_replace=False):
+    verb = "INSERT OR REPLACE" if or_replace else "INSERT"
+    placeholders = ", ".join("?" for _ in columns)
+    return f"{verb} INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+
+
+class Row:
+    """조회 결과 행 - 튜플 기반, 컬럼 인덱스 맵은 결과셋 전체가 공유
+
+    row["col"], row[0], row.get("col"), row.keys(), dict(row) 지원.
+    행마다 dict를 만들던 방식보다 할당이 적고 메모리도 작음.
+    """
+    __slots__ = ("_index", "_values")
+
+    def __init__(self, index, values):
+        self._index = index
+        self._values = values
+
+    def __getitem__(self, key):
+        # 인덱스 맵에 컬럼명과 위치(0, 1, ...)가 모두 들어있어 분기 없이 조회
+        return self._values[self._index[key]]
+
+    def get(self, key, default=None):
+        i = self._index.get(key)
+        return default if i is None else self._values[i]
+
+    def keys(self):
+        return [key for key in self._index if key.__class__ is str]
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __repr__(self):
+        return f"Row({dict(zip(self.keys(), self._values))!r})"
+
+
+def _column_index(columns):
+    """결과셋 공유용 인덱스 맵 - 컬럼명과 위치 양쪽으로 조회 가능"""
+    index = {}
+    for i, name in enumerate(columns):
+        index[name] = i
+        index[i] = i
+    return index
+
+
+# 마지막으로 만든 (cursor.description, 인덱스 맵) - description 객체는 실행(execute)마다 새로 생기므로
+# 같은 객체면 같은 결과셋. 튜플 교체는 원자적이라 스레드 간 경합 시에도 재생성만 일어남
+_last_row_index = (None, None)
+
+
+def _sqlite_row_factory(cursor, values):
+    """sqlite3 row_factory - 같은 실행 결과의 행끼리 컬럼 인덱스 맵 공유"""
+    global _last_row_index
+    description, index = _last_row_index
+    if description is not cursor.description:
+        description = cursor.description
+        index = _column_index(col[0] for col in description)
+        _last_row_index = (description, index)
+    return Row(index, values)
+
+
+def _result_to_rows(result):
+    """libsql ResultSet -> Row 리스트 (컬럼 인덱스 맵 1개 공유)"""
+    if result and result.rows:
+        index = _column_index(result.columns)
+        return [Row(index, row.astuple()) for row in result.rows]
+    return []
+
+
+# ---------------------------------------------------------------------------
+# 쿼리 계측 (fingerprint별 소요 시간/행 수 집계 + slow-query 로그)
+# ---------------------------------------------------------------------------
+
+_SQL_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_SQL_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_SQL_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+
+
+@lru_cache(maxsize=1024)
+def sql_fingerprint(sql):
+    """SQL 정규화 - 공백 정리, 리터럴은 ?로, IN (?, ?, ...)은 (?+)로 (파라미터 개수가 달라도 같은 쿼리로 집계)"""
+    normalized = " ".join(sql.split())
+    normalized = _SQL_STRING_LITERAL.sub("?", normalized)
+    normalized = _SQL_NUMBER_LITERAL.sub("?", normalized)
+    return _SQL_PLACEHOLDER_LIST.sub("(?+)", normalized)
+
+
+def _percentile(sorted_values, pct):
+    """nearest-rank 백분위"""
+    if not sorted_values:
+        return None
+    index = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values) + 0.5) - 1))
+    return sorted_values[index]
+
+
+class QueryStats:
+    """프로세스 전역 쿼리 통계 (스레드 안전)"""
+    def __init__(self, max_samples):
+        self._max_samples = max_samples
+        self._lock = threading.Lock()
+        self._entries = {}  # (fingerprint, backend) -> 집계 dict
+
+    def record(self, fingerprint, backend, duration_ms, rows):
+        with self._lock:
+            entry = self._entries.get((fingerprint, backend))
+            if entry is None:
+                entry = self._entries[(fingerprint, backend)] = {
+                    "count": 0, "total_ms": 0.0, "max_ms": 0.0, "rows": 0,
+                    "samples": deque(maxlen=self._max_samples),
+                }
+            entry["count"] += 1
+            entry["total_ms"] += duration_ms
+            entry["max_ms"] = max(entry["max_ms"], duration_ms)
+            entry["rows"] += rows or 0
+            entry["samples"].append(duration_ms)
+
+    def snapshot(self):
+        """fingerprint별 집계 (총 소요 시간 내림차순)"""
+        with self._lock:
+            items = [(key, dict(entry, samples=sorted(entry["samples"]))) for key, entry in self._entries.items()]
+
+        result = []
+        for (fingerprint, backend), entry in items:
+            samples = entry["samples"]
+            result.append({
+                "fingerprint": fingerprint,
+                "backend": backend,
+                "count": entry["count"],
+                "totalMs": round(entry["total_ms"], 3),
+                "avgMs": round(entry["total_ms"] / entry["count"], 3),
+                "p50Ms": round(_percentile(samples, 50), 3),
+                "p95Ms": round(_percentile(samples, 95), 3),
+                "p99Ms": round(_percentile(samples, 99), 3),
+                "maxMs": round(entry["max_ms"], 3),
+                "avgRows": round(entry["rows"] / entry["count"], 1),
+            })
+        result.sort(key=lambda item: item["totalMs"], reverse=True)
+        return result
+
+    def reset(self):
+        with self._lock:
+            self._entries.clear()
+
+
+query_stats = QueryStats(QUERY_STATS_SAMPLES)
+
+
+class QueryUsage:
+    """요청 하나에서 실행된 쿼리 수/시간 (track_request_queries로 수집)"""
+    __slots__ = ("count", "total_ms")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+
+
+_request_usage = contextvars.ContextVar("request_query_usage", default=None)
+
+
+@contextmanager
+def track_request_queries():
+    """이 블록 안(하위 태스크/스레드 포함)에서 실행된 쿼리 수와 시간을 집계"""
+    usage = QueryUsage()
+    token = _request_usage.set(usage)
+    try:
+        yield usage
+    finally:
+        _request_usage.reset(token)
+
+
+def _record_query(sql, backend, elapsed, rows):
+    """쿼리 1회(또는 batch 요청 1회) 측정값 기록"""
+    duration_ms = elapsed * 1000
+    fingerprint = sql_fingerprint(sql)
+    query_stats.record(fingerprint, backend, duration_ms, rows)
+
+    usage = _request_usage.get()
+    if usage is not None:
+        usage.count += 1
+        usage.total_ms += duration_ms
+
+    if duration_ms >= SLOW_QUERY_MS:
+        print(f"[slow-query] {duration_ms:.1f}ms backend={backend} rows={rows} {fingerprint}")
+
+
+def _batch_sql(statements):
+    """batch 요청 기록용 SQL - 포함된 문장을 순서대로(중복 제거) 이어 붙임"""
+    seen = []
+    for statement in statements:
+        sql = statement[0] if isinstance(statement, tuple) else statement
+        fingerprint = sql_fingerprint(sql)
+        if fingerprint not in seen:
+            seen.append(fingerprint)
+    return "BATCH " + "; ".join(seen)
+
+
+def _result_row_count(result):
+    """libsql ResultSet의 행 수 (SELECT는 반환 행, DML은 영향받은 행)"""
+    if result is None:
+        return 0
+    return len(result.rows) if result.columns else result.rows_affected
+
+
+class InstrumentedSQLiteCursor(sqlite3.Cursor):
+    """소요 시간/행 수를 기록하는 sqlite3 커서
+
+    SELECT는 첫 fetch까지 포함해 측정 (sqlite3는 fetch 시점에 나머지 행을 읽으므로)
+    """
+    _pending = None  # (sql, 누적 소요 시간) - fetch 전인 SELECT
+
+    def execute(self, sql, params=()):
+        self._flush()
+        start = time.perf_counter()
+        try:
+            return super().execute(sql, params)
+        finally:
+            self._pending = (sql, time.perf_counter() - start)
+            if self.description is None:
+                # 결과 행이 없는 문장(DML/DDL)은 바로 기록
+                self._flush(rows=max(self.rowcount, 0))
+
+    def executemany(self, sql, params_list):
+        self._flush()
+        start = time.perf_counter()
+        try:
+            return super().executemany(sql, params_list)
+        finally:
+            _record_query(sql, "sqlite", time.perf_counter() - start, max(self.rowcount, 0))
+
+    def fetchone(self):
+        start = time.perf_counter()
+        row = super().fetchone()
+        self._flush(time.perf_counter() - start, 0 if row is None else 1)
+        return row
+
+    def fetchall(self):
+        start = time.perf_counter()
+        rows = super().fetchall()
+        self._flush(time.perf_counter() - start, len(rows))
+        return rows
+
+    def close(self):
+        self._flush()
+        super().close()
+
+    def _flush(self, extra=0.0, rows=None):
+        if self._pending is not None:
+            sql, elapsed = self._pending
+            self._pending = None
+            _record_query(sql, "sqlite", elapsed + extra, rows)
+
+
+class InstrumentedSQLiteConnection(sqlite3.Connection):
+    """cursor()가 InstrumentedSQLiteCursor를 반환하는 sqlite3 연결"""
+    def cursor(self, factory=InstrumentedSQLiteCursor):
+        return super().cursor(factory)
+
+
 # Turso용 동기 래퍼 클래스
 class TursoConnection:
     """libsql_client를 동기적으로 사용하기 위한 래퍼"""
@@ -44,7 +364,10 @@ class TursoConnection:
     def batch(self, statements):
         """여러 SQL을 한 번의 HTTP 요청으로 실행 (batch API)"""
         client = self._get_client()
+        start = time.perf_counter()
         results = client.batch(statements)
+        _record_query(_batch_sql(statements), "turso", time.perf_counter() - start,
+                      sum(_result_row_count(r) for r in results))
         return results
 
     def commit(self):
@@ -69,53 +392,642 @@ class TursoCursor:
         self._result = None
 
     def execute(self, sql, params=None):
+        start = time.perf_counter()
         if params:
             # libsql_client는 params를 list로 받음
             self._result = self.client.execute(sql, list(params))
         else:
             self._result = self.client.execute(sql)
+        _record_query(sql, "turso", time.perf_counter() - start, _result_row_count(self._result))
         return self
 
     def executemany(self, sql, params_list):
-        for params in params_list:
-            self.execute(sql, params)
+        """파라미터 묶음을 크기 제한된 청크로 나눠 batch API로 전송 (청크마다 HTTP 요청 1회, 트랜잭션 1개)"""
+        self._result = None
+        for chunk in _chunk_params(sql, params_list):
+            start = time.perf_counter()
+            self.client.batch([(sql, list(params)) for params in chunk])
+            _record_query(sql, "turso", time.perf_counter() - start, len(chunk))
         return self
 
     def fetchone(self):
         if self._result and self._result.rows:
-            row = self._result.rows[0]
-            return dict(zip(self._result.columns, row))
+            return Row(_column_index(self._result.columns), self._result.rows[0].astuple())
         return None
 
     def fetchall(self):
-        if self._result and self._result.rows:
-            return [dict(zip(self._result.columns, row)) for row in self._result.rows]
-        return []
+        return _result_to_rows(self._result)
 
 
 def get_connection():
-    """데이터베이스 연결 반환"""
+    """새 데이터베이스 연결 반환 (풀을 거치지 않음)"""
     if USE_TURSO:
         conn = TursoConnection(
             url=TURSO_DATABASE_URL,
             auth_token=TURSO_AUTH_TOKEN
         )
     else:
-        conn = sqlite3.connect(LOCAL_DATABASE_PATH)
-        conn.row_factory = sqlite3.Row
+        # 풀에 반납된 커넥션은 다른 워커 스레드가 다시 빌려갈 수 있음
+        conn = sqlite3.connect(LOCAL_DATABASE_PATH, check_same_thread=False, factory=InstrumentedSQLiteConnection)
+        conn.row_factory = _sqlite_row_factory
     return conn
 
 
+class ConnectionPool:
+    """프로세스 전역 커넥션 풀 (스레드 안전, 크기 제한)
+
+    - 최대 max_size개의 커넥션만 동시에 빌려줌 (초과 시 timeout까지 대기)
+    - 반납된 커넥션은 LIFO로 재사용 (최근에 쓴 커넥션일수록 살아있을 확률이 높음)
+    - max_idle 이상 쉰 커넥션은 폐기, healthcheck_after 이상 쉰 커넥션은 SELECT 1로 확인 후 재사용
+    """
+    def __init__(self, factory, max_size, timeout, max_idle, healthcheck_after):
+        self._factory = factory
+        self._timeout = timeout
+        self._max_idle = max_idle
+        self._healthcheck_after = healthcheck_after
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._lock = threading.Lock()
+        self._idle = []  # [(conn, 반납 시각)] - 뒤쪽이 가장 최근
+
+    def acquire(self):
+        if not self._slots.acquire(timeout=self._timeout):
+            raise TimeoutError(f"DB 커넥션 풀 대기 시간 초과 ({self._timeout}s)")
+        try:
+            return self._take_idle() or self._factory()
+        except Exception:
+            self._slots.release()
+            raise
+
+    def release(self, conn, broken=False):
+        try:
+            if broken:
+                self._discard(conn)
+            else:
+                with self._lock:
+                    self._idle.append((conn, time.monotonic()))
+        finally:
+            self._slots.release()
+
+    def close_all(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn, _ in idle:
+            self._discard(conn)
+
+    def _take_idle(self):
+        while True:
+            now = time.monotonic()
+            with self._lock:
+                # 앞쪽(가장 오래된)부터 max_idle 초과분 제거
+                expired = 0
+                while expired < len(self._idle) and now - self._idle[expired][1] > self._max_idle:
+                    expired += 1
+                stale, self._idle = self._idle[:expired], self._idle[expired:]
+                entry = self._idle.pop() if self._idle else None
+
+            for conn, _ in stale:
+                self._discard(conn)
+            if entry is None:
+                return None
+
+            conn, released_at = entry
+            if now - released_at < self._healthcheck_after or self._is_healthy(conn):
+                return conn
+            self._discard(conn)
+
+    @staticmethod
+    def _is_healthy(conn):
+        try:
+            conn.cursor().execute("SELECT 1")
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _discard(conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    """프로세스 전역 커넥션 풀 반환 (최초 호출 시 생성)"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(
+                    get_connection,
+                    max_size=DB_POOL_SIZE,
+                    timeout=DB_POOL_TIMEOUT,
+                    max_idle=DB_POOL_MAX_IDLE,
+                    healthcheck_after=DB_POOL_HEALTHCHECK_AFTER,
+                )
+    return _pool
+
+
+def close_pool():
+    """프로세스 전역 커넥션 풀의 커넥션을 모두 닫음 (이후 get_db를 부르면 새 풀 생성)
+
+    libsql_client 동기 클라이언트는 non-daemon 스레드를 띄우므로, get_db를 쓰는
+    스크립트는 끝나기 전에 finally에서 호출해야 인터프리터 종료가 멈추지 않는다.
+    """
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.close_all()
+
+
 @contextmanager
 def get_db():
-    """컨텍스트 매니저로 DB 연결 관리"""
-    conn = get_connection()
+    """컨텍스트 매니저로 DB 연결 관리 (풀에서 빌리고 반납)"""
+    pool = get_pool()
+    conn = pool.acquire()
+    broken = False
+    try:
+        yield conn
+    finally:
+        # 커밋되지 않은 트랜잭션이 남아있으면 되돌린 뒤 반납 (롤백조차 실패하면 폐기)
+        try:
+            conn.rollback()
+        except Exception:
+            broken = True
+        pool.release(conn, broken=broken)
+
+
+def bulk_insert(conn, table, columns, rows, or_replace=False):
+    """여러 행을 한 번에 삽입
+
+    Turso는 크기 제한된 청크마다 batch 요청 1회(청크 단위 트랜잭션),
+    SQLite는 executemany 한 번으로 처리. 커밋은 호출자가 담당.
+    """
+    conn.cursor().executemany(_insert_sql(table, columns, or_replace), rows)
+
+
+# ---------------------------------------------------------------------------
+# 비동기 DB 레이어 (FastAPI async 라우터용)
+# 스크립트/init_db는 위의 동기 get_db를, 라우터는 get_async_db를 사용
+# ---------------------------------------------------------------------------
+
+class AsyncTursoConnection:
+    """libsql_client 비동기 클라이언트 래퍼 (TursoConnection과 같은 인터페이스, 메서드만 await)"""
+    def __init__(self, url, auth_token):
+        self._client = libsql_client.create_client(url=url, auth_token=auth_token)
+
+    def cursor(self):
+        return AsyncTursoCursor(self._client)
+
+    async def batch(self, statements):
+        """여러 SQL을 한 번의 요청으로 실행 - 각 문장의 결과 행 리스트를 반환"""
+        start = time.perf_counter()
+        results = await self._client.batch(statements)
+        _record_query(_batch_sql(statements), "turso", time.perf_counter() - start,
+                      sum(_result_row_count(r) for r in results))
+        return [_result_to_rows(r) for r in results]
+
+    async def commit(self):
+        # libsql_client는 자동 커밋
+        pass
+
+    async def rollback(self):
+        pass
+
+    async def close(self):
+        await self._client.close()
+
+
+class AsyncTursoCursor:
+    """Turso용 비동기 커서 래퍼"""
+    def __init__(self, client):
+        self.client = client
+        self.lastrowid = None
+        self._result = None
+        self._offset = 0  # fetchmany 위치
+
+    async def execute(self, sql, params=None):
+        start = time.perf_counter()
+        self._offset = 0
+        if params:
+            self._result = await self.client.execute(sql, list(params))
+        else:
+            self._result = await self.client.execute(sql)
+        _record_query(sql, "turso", time.perf_counter() - start, _result_row_count(self._result))
+        return self
+
+    async def executemany(self, sql, params_list):
+        """TursoCursor.executemany와 동일 - 청크마다 batch 요청 1회"""
+        self._result = None
+        for chunk in _chunk_params(sql, params_list):
+            start = time.perf_counter()
+            await self.client.batch([(sql, list(params)) for params in chunk])
+            _record_query(sql, "turso", time.perf_counter() - start, len(chunk))
+        return self
+
+    async def fetchone(self):
+        rows = _result_to_rows(self._result)
+        return rows[0] if rows else None
+
+    async def fetchall(self):
+        return _result_to_rows(self._result)
+
+    async def fetchmany(self, size):
+        """size개씩 Row로 변환해 반환
+
+        Turso는 HTTP 응답으로 결과 전체를 한 번에 받으므로 원본 결과는 이미 메모리에 있음.
+        Row 변환만 나눠서 해 응답 조립 쪽 메모리를 줄인다.
+        """
+        if self._result is None:
+            return []
+        start = self._offset
+        self._offset = start + size
+        index = _column_index(self._result.columns)
+        return [Row(index, row.astuple()) for row in self._result.rows[start:self._offset]]
+
+
+class AsyncSQLiteConnection:
+    """aiosqlite 래퍼 - AsyncTursoConnection과 같은 인터페이스"""
+    def __init__(self, conn, backend="sqlite"):
+        self._conn = conn
+        self._backend = backend  # 쿼리 통계용 라벨 (sqlite / replica)
+
+    @classmethod
+    async def open(cls, path, read_only=False, backend="sqlite"):
+        if read_only:
+            conn = await aiosqlite.connect(f"file:{path}?mode=ro", uri=True, factory=InstrumentedSQLiteConnection)
+        else:
+            conn = await aiosqlite.connect(path, factory=InstrumentedSQLiteConnection)
+        conn.row_factory = _sqlite_row_factory
+        return cls(conn, backend)
+
+    def cursor(self):
+        return AsyncSQLiteCursor(self._conn, self._backend)
+
+    async def batch(self, statements):
+        """Turso batch와 같은 의미: 하나의 트랜잭션으로 순서대로 실행"""
+        results = []
+        start = time.perf_counter()
+        try:
+            for sql, params in statements:
+                cursor = await self._conn.execute(sql, params)
+                results.append(await cursor.fetchall())
+            await self._conn.commit()
+        except Exception:
+            await self._conn.rollback()
+            raise
+        _record_query(_batch_sql(statements), self._backend, time.perf_counter() - start,
+                      sum(len(rows) for rows in results))
+        return results
+
+    async def commit(self):
+        await self._conn.commit()
+
+    async def rollback(self):
+        await self._conn.rollback()
+
+    async def close(self):
+        await self._conn.close()
+
+
+class AsyncSQLiteCursor:
+    """aiosqlite용 커서 래퍼 (InstrumentedSQLiteCursor와 같은 방식으로 계측)"""
+    def __init__(self, conn, backend="sqlite"):
+        self._conn = conn
+        self._backend = backend
+        self._cursor = None
+        self._pending = None  # (sql, 누적 소요 시간) - fetch 전인 SELECT
+        self._fetched = 0  # fetchmany로 지금까지 읽은 행 수
+        self.lastrowid = None
+
+    async def execute(self, sql, params=None):
+        self._flush()
+        start = time.perf_counter()
+        self._cursor = await self._conn.execute(sql, params or ())
+        self._pending = (sql, time.perf_counter() - start)
+        self._fetched = 0
+        self.lastrowid = self._cursor.lastrowid
+        if self._cursor.description is None:
+            self._flush(rows=max(self._cursor.rowcount, 0))
+        return self
+
+    async def executemany(self, sql, params_list):
+        self._flush()
+        start = time.perf_counter()
+        self._cursor = await self._conn.executemany(sql, params_list)
+        _record_query(sql, self._backend, time.perf_counter() - start, max(self._cursor.rowcount, 0))
+        return self
+
+    async def fetchone(self):
+        start = time.perf_counter()
+        row = await self._cursor.fetchone()
+        self._flush(time.perf_counter() - start, 0 if row is None else 1)
+        return row
+
+    async def fetchall(self):
+        start = time.perf_counter()
+        rows = await self._cursor.fetchall()
+        self._flush(time.perf_counter() - start, len(rows))
+        return rows
+
+    async def fetchmany(self, size):
+        """size개씩 나눠 읽기 (스트리밍 응답용) - 결과를 끝까지 읽으면 쿼리 1건으로 기록"""
+        start = time.perf_counter()
+        rows = await self._cursor.fetchmany(size)
+        if self._pending is not None:
+            sql, elapsed = self._pending
+            self._pending = (sql, elapsed + time.perf_counter() - start)
+            self._fetched += len(rows)
+            if len(rows) < size:
+                self._flush(rows=self._fetched)
+        return rows
+
+    def _flush(self, extra=0.0, rows=None):
+        if self._pending is not None:
+            sql, elapsed = self._pending
+            self._pending = None
+            _record_query(sql, self._backend, elapsed + extra, rows)
+
+
+async def get_async_connection():
+    """새 비동기 데이터베이스 연결 반환 (풀을 거치지 않음)"""
+    if USE_TURSO:
+        return AsyncTursoConnection(url=TURSO_DATABASE_URL, auth_token=TURSO_AUTH_TOKEN)
+    return await AsyncSQLiteConnection.open(LOCAL_DATABASE_PATH)
+
+
+class AsyncConnectionPool:
+    """이벤트 루프용 커넥션 풀 - ConnectionPool과 같은 정책 (크기 제한, LIFO 재사용, 유휴 폐기, 헬스체크)"""
+    def __init__(self, factory, max_size, timeout, max_idle, healthcheck_after):
+        self._factory = factory
+        self._timeout = timeout
+        self._max_idle = max_idle
+        self._healthcheck_after = healthcheck_after
+        self._slots = asyncio.BoundedSemaphore(max_size)
+        self._idle = []  # [(conn, 반납 시각)] - 뒤쪽이 가장 최근
+        self._closed = False
+
+    async def acquire(self):
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self._timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"DB 커넥션 풀 대기 시간 초과 ({self._timeout}s)")
+        try:
+            return await self._take_idle() or await self._factory()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    async def release(self, conn, broken=False):
+        try:
+            if broken or self._closed:
+                # 닫힌 풀(교체된 레플리카 등)로 돌아온 커넥션은 재사용하지 않음
+                await self._discard(conn)
+            else:
+                self._idle.append((conn, time.monotonic()))
+        finally:
+            self._slots.release()
+
+    async def close_all(self):
+        self._closed = True
+        idle, self._idle = self._idle, []
+        for conn, _ in idle:
+            await self._discard(conn)
+
+    async def _take_idle(self):
+        while True:
+            now = time.monotonic()
+            # 앞쪽(가장 오래된)부터 max_idle 초과분 제거
+            while self._idle and now - self._idle[0][1] > self._max_idle:
+                conn, _ = self._idle.pop(0)
+                await self._discard(conn)
+            if not self._idle:
+                return None
+
+            conn, released_at = self._idle.pop()
+            if now - released_at < self._healthcheck_after or await self._is_healthy(conn):
+                return conn
+            await self._discard(conn)
+
+    @staticmethod
+    async def _is_healthy(conn):
+        try:
+            await conn.cursor().execute("SELECT 1")
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    async def _discard(conn):
+        try:
+            await conn.close()
+        except Exception:
+            pass
+
+
+_async_pool = None
+
+
+def get_async_pool():
+    """이벤트 루프용 커넥션 풀 반환 (최초 호출 시 생성)"""
+    global _async_pool
+    if _async_pool is None:
+        _async_pool = AsyncConnectionPool(
+            get_async_connection,
+            max_size=DB_POOL_SIZE,
+            timeout=DB_POOL_TIMEOUT,
+            max_idle=DB_POOL_MAX_IDLE,
+            healthcheck_after=DB_POOL_HEALTHCHECK_AFTER,
+        )
+    return _async_pool
+
+
+async def close_async_pool():
+    """앱 종료 시 비동기 풀의 커넥션 정리"""
+    global _async_pool
+    if _async_pool is not None:
+        await _async_pool.close_all()
+        _async_pool = None
+
+
+@asynccontextmanager
+async def get_async_db():
+    """get_db의 비동기 버전 - async 라우터에서 사용"""
+    pool = get_async_pool()
+    conn = await pool.acquire()
+    broken = False
     try:
         yield conn
     finally:
-        conn.close()
+        # 커밋되지 않은 트랜잭션이 남아있으면 되돌린 뒤 반납 (롤백조차 실패하면 폐기)
+        try:
+            await conn.rollback()
+        except Exception:
+            broken = True
+        await pool.release(conn, broken=broken)
+
+
+async def bulk_insert_async(conn, table, columns, rows, or_replace=False):
+    """bulk_insert의 비동기 버전"""
+    await conn.cursor().executemany(_insert_sql(table, columns, or_replace), rows)
+
+
+
+# ---------------------------------------------------------------------------
+# 카탈로그 로컬 레플리카
+# ---------------------------------------------------------------------------
+
+_replica_pool = None
+_replica_task = None
+_replica_schema_registry = None
+# 수동 동기화(/internal/catalog-replica/sync)와 주기 동기화가 겹치지 않게 직렬화
+_replica_lock = asyncio.Lock()
+
+
+def sync_catalog_replica(path=None):
+    """Turso의 카탈로그 테이블을 로컬 SQLite 파일로 복제
+
+    스키마(sqlite_master)와 전체 행을 batch 한 번(= 스냅샷 하나)으로 읽어
+    임시 파일에 쓴 뒤 원자적으로 교체. 반환값은 테이블별 행 수.
+    """
+    path = path or CATALOG_REPLICA_PATH
+    placeholders = ", ".join("?" for _ in REPLICA_TABLES)
+    statements = [(
+        f"SELECT type, name, sql FROM sqlite_master WHERE tbl_name IN ({placeholders}) "
+        "AND type IN ('table', 'index') AND sql IS NOT NULL ORDER BY type DESC",
+        list(REPLICA_TABLES)
+    )] + [f"SELECT * FROM {table}" for table in REPLICA_TABLES]
+
+    with get_db() as conn:
+        results = conn.batch(statements)
+    schema, table_results = results[0], results[1:]
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # 같은 디렉터리의 고유한 임시 파일 (다른 프로세스의 동기화와 겹쳐도 서로의 파일을 건드리지 않음)
+    fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp", dir=os.path.dirname(path))
+    os.close(fd)
+
+    try:
+        counts = _write_replica(tmp_path, schema, table_results)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    print(f"[replica] 카탈로그 레플리카 동기화 완료: {counts}")
+    return counts
+
+
+def _write_replica(tmp_path, schema, table_results):
+    """batch 결과를 빈 SQLite 파일에 기록 - 반환값은 테이블별 행 수"""
+    counts = {}
+    local = sqlite3.connect(tmp_path)
+    try:
+        # 테이블 먼저, 인덱스는 나중에 (ORDER BY type DESC)
+        for _type, _name, sql in schema.rows:
+            local.execute(sql)
+        for table, result in zip(REPLICA_TABLES, table_results):
+            rows = [row.astuple() for row in result.rows]
+            if rows:
+                local.executemany(_insert_sql(table, result.columns), rows)
+            counts[table] = len(rows)
+        # 검색 색인은 복제하지 않고 레플리카에서 새로 만듦 (Turso 쪽 FTS5 지원 여부와 무관)
+        try:
+            for sql in CHAPTERS_FTS_SQL:
+                local.execute(sql)
+        except sqlite3.OperationalError as e:
+            print(f"[replica] 챕터 검색 색인 생성 실패 (/search는 LIKE로 대체): {e}")
+        local.commit()
+    finally:
+        local.close()
+    return counts
+
+
+async def refresh_catalog_replica():
+    """레플리카를 다시 동기화하고 읽기 풀을 새 파일로 교체 (수동 트리거/주기 작업용)"""
+    global _replica_pool, _replica_schema_registry
+    async with _replica_lock:
+        counts = await asyncio.to_thread(sync_catalog_replica)
+        _replica_schema_registry = await asyncio.to_thread(_load_replica_schema_registry)
+
+        old_pool = _replica_pool
+        _replica_pool = AsyncConnectionPool(
+            lambda: AsyncSQLiteConnection.open(CATALOG_REPLICA_PATH, read_only=True, backend="replica"),
+            max_size=DB_POOL_SIZE,
+            timeout=DB_POOL_TIMEOUT,
+            max_idle=DB_POOL_MAX_IDLE,
+            healthcheck_after=DB_POOL_HEALTHCHECK_AFTER,
+        )
+        if old_pool is not None:
+            # 빌려간 커넥션은 반납 시점에 닫힘
+            await old_pool.close_all()
+    return counts
+
+
+def _load_replica_schema_registry():
+    local = sqlite3.connect(CATALOG_REPLICA_PATH)
+    try:
+        return load_schema_registry(local)
+    finally:
+        local.close()
 
 
+async def _replica_sync_loop():
+    while True:
+        await asyncio.sleep(CATALOG_REPLICA_SYNC_INTERVAL)
+        try:
+            await refresh_catalog_replica()
+        except Exception as e:
+            print(f"[replica] 주기 동기화 실패 (기존 레플리카 유지): {e}")
+
+
+async def start_catalog_replica():
+    """앱 시작 시 레플리카 초기 동기화 + 주기 동기화 작업 시작 (CATALOG_REPLICA 설정 시)"""
+    global _replica_task
+    if not CATALOG_REPLICA_ENABLED:
+        return
+    try:
+        await refresh_catalog_replica()
+    except Exception as e:
+        # 레플리카가 없으면 카탈로그 읽기도 Turso로 감
+        print(f"[replica] 초기 동기화 실패 (Turso에서 직접 읽음): {e}")
+    if CATALOG_REPLICA_SYNC_INTERVAL > 0:
+        _replica_task = asyncio.create_task(_replica_sync_loop())
+
+
+async def stop_catalog_replica():
+    global _replica_pool, _replica_task
+    if _replica_task is not None:
+        _replica_task.cancel()
+        _replica_task = None
+    if _replica_pool is not None:
+        await _replica_pool.close_all()
+        _replica_pool = None
+
+
+@asynccontextmanager
+async def get_async_catalog_db():
+    """카탈로그 읽기 전용 연결 - 레플리카가 준비되어 있으면 로컬 파일, 아니면 get_async_db와 동일"""
+    pool = _replica_pool
+    if pool is None:
+        async with get_async_db() as conn:
+            yield conn
+        return
+
+    conn = await pool.acquire()
+    broken = False
+    try:
+        yield conn
+    finally:
+        try:
+            await conn.rollback()
+        except Exception:
+            broken = True
+        await pool.release(conn, broken=broken)
+
 def _migrate_chapter_vocabulary_fk(cursor, conn):
     """chapter_vocabulary 테이블에서 FOREIGN KEY 제거 마이그레이션"""
     try:
@@ -126,7 +1038,7 @@ def _migrate_chapter_vocabulary_fk(cursor, conn):
         if not row:
             return
 
-        table_sql = row.get("sql", "") if isinstance(row, dict) else row[0]
+        table_sql = row["sql"] or ""
         if "FOREIGN KEY" not in table_sql:
             return  # FK 없음 - 마이그레이션 불필요
 
@@ -185,184 +1097,547 @@ def _migrate_chapter_vocabulary_fk(cursor, conn):
         print(f"[migrate] FK 마이그레이션 실패 (무시): {e}")
 
 
-def init_db():
-    """데이터베이스 초기화 - 테이블 생성"""
-    if not USE_TURSO:
-        os.makedirs(os.path.dirname(LOCAL_DATABASE_PATH), exist_ok=True)
+# 챕터 전문 검색 색인 (FTS5 external content - 본문은 chapters에만 두고 트리거로 색인만 동기화)
+# 마이그레이션 5, 레플리카 동기화, rebuild_chapter_search가 같은 목록을 쓴다 (모두 멱등)
+CHAPTERS_FTS_SQL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS chapters_fts USING fts5(
+        title, content, content='chapters', content_rowid='id', tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS chapters_fts_ai AFTER INSERT ON chapters BEGIN
+        INSERT INTO chapters_fts(rowid, title, content) VALUES (new.id, new.title, new.content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS chapters_fts_ad AFTER DELETE ON chapters BEGIN
+        INSERT INTO chapters_fts(chapters_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS chapters_fts_au AFTER UPDATE OF title, content ON chapters BEGIN
+        INSERT INTO chapters_fts(chapters_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content);
+        INSERT INTO chapters_fts(rowid, title, content) VALUES (new.id, new.title, new.content);
+    END
+    """,
+    # 기존 챕터 색인 (external content 테이블은 rebuild로 chapters 전체를 다시 읽음)
+    "INSERT INTO chapters_fts(chapters_fts) VALUES ('rebuild')",
+]
 
-    with get_db() as conn:
-        cursor = conn.cursor()
 
+# 스키마 마이그레이션 - (버전, 설명, [SQL, ...]) 순서대로 적용
+# 이미 배포된 단계는 수정하지 말고 새 버전을 뒤에 추가할 것 (DDL은 IF NOT EXISTS로 멱등하게)
+MIGRATIONS = [
+    (1, "initial schema", [
         # Heroes 테이블
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS heroes (
-                id TEXT PRIMARY KEY,
-                name TEXT NOT NULL,
-                name_ko TEXT,
-                period TEXT,
-                nationality TEXT,
-                nationality_ko TEXT,
-                occupation TEXT,
-                occupation_ko TEXT,
-                avatar TEXT,
-                difficulty TEXT CHECK(difficulty IN ('easy', 'medium', 'advanced')),
-                summary TEXT,
-                summary_ko TEXT,
-                achievements TEXT,
-                quotes TEXT,
-                conversation_tone TEXT,
-                conversation_personality TEXT,
-                system_prompt TEXT,
-                recommended_topics TEXT,
-                tts_rate REAL DEFAULT 0.9,
-                tts_pitch REAL DEFAULT 1.0,
-                portrait_image TEXT,
-                scenarios TEXT
-            )
-        """)
+        """
+        CREATE TABLE IF NOT EXISTS heroes (
+            id TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            name_ko TEXT,
+            period TEXT,
+            nationality TEXT,
+            nationality_ko TEXT,
+            occupation TEXT,
+            occupation_ko TEXT,
+            avatar TEXT,
+            difficulty TEXT CHECK(difficulty IN ('easy', 'medium', 'advanced')),
+            summary TEXT,
+            summary_ko TEXT,
+            achievements TEXT,
+            quotes TEXT,
+            conversation_tone TEXT,
+            conversation_personality TEXT,
+            system_prompt TEXT,
+            recommended_topics TEXT,
+            tts_rate REAL DEFAULT 0.9,
+            tts_pitch REAL DEFAULT 1.0,
+            portrait_image TEXT,
+            scenarios TEXT
+        )
+        """,
 
         # Books 테이블
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS books (
-                id TEXT PRIMARY KEY,
-                title TEXT NOT NULL,
-                author TEXT NOT NULL,
-                difficulty TEXT CHECK(difficulty IN ('easy', 'medium', 'advanced')),
-                genre TEXT,
-                year INTEGER,
-                description TEXT,
-                cover_color TEXT,
-                cover_image TEXT,
-                word_count INTEGER,
-                reading_time TEXT,
-                learning_focus TEXT,
-                hero_id TEXT,
-                FOREIGN KEY (hero_id) REFERENCES heroes(id)
-            )
-        """)
+        """
+        CREATE TABLE IF NOT EXISTS books (
+            id TEXT PRIMARY KEY,
+            title TEXT NOT NULL,
+            author TEXT NOT NULL,
+            difficulty TEXT CHECK(difficulty IN ('easy', 'medium', 'advanced')),
+            genre TEXT,
+            year INTEGER,
+            description TEXT,
+            cover_color TEXT,
+            cover_image TEXT,
+            word_count INTEGER,
+            reading_time TEXT,
+            learning_focus TEXT,
+            hero_id TEXT,
+            FOREIGN KEY (hero_id) REFERENCES heroes(id)
+        )
+        """,
 
         # Chapters 테이블
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS chapters (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                book_id TEXT NOT NULL,
-                chapter_number INTEGER NOT NULL,
-                title TEXT NOT NULL,
-                content TEXT NOT NULL,
-                word_count INTEGER,
-                vocabulary TEXT,
-                FOREIGN KEY (book_id) REFERENCES books(id)
-            )
-        """)
+        """
+        CREATE TABLE IF NOT EXISTS chapters (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            book_id TEXT NOT NULL,
+            chapter_number INTEGER NOT NULL,
+            title TEXT NOT NULL,
+            content TEXT NOT NULL,
+            word_count INTEGER,
+            vocabulary TEXT,
+            FOREIGN KEY (book_id) REFERENCES books(id)
+        )
+        """,
 
         # Archaic Words 테이블 (고어 사전)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS archaic_words (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                word TEXT NOT NULL UNIQUE,
-                modern_equivalent TEXT NOT NULL,
-                part_of_speech TEXT,
-                definition TEXT,
-                definition_ko TEXT,
-                example_sentence TEXT,
-                usage_note TEXT,
-                usage_note_ko TEXT,
-                category TEXT CHECK(category IN ('pronoun', 'verb', 'adverb', 'adjective', 'noun', 'contraction', 'other'))
-            )
-        """)
+        """
+        CREATE TABLE IF NOT EXISTS archaic_words (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            word TEXT NOT NULL UNIQUE,
+            modern_equivalent TEXT NOT NULL,
+            part_of_speech TEXT,
+            definition TEXT,
+            definition_ko TEXT,
+            example_sentence TEXT,
+            usage_note TEXT,
+            usage_note_ko TEXT,
+            category TEXT CHECK(category IN ('pronoun', 'verb', 'adverb', 'adjective', 'noun', 'contraction', 'other'))
+        )
+        """,
 
         # Semantic Shifts 테이블 (의미 변화 단어)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS semantic_shifts (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                word TEXT NOT NULL UNIQUE,
-                historical_meaning TEXT NOT NULL,
-                historical_meaning_ko TEXT,
-                modern_meaning TEXT NOT NULL,
-                modern_meaning_ko TEXT,
-                example_historical TEXT,
-                example_modern TEXT,
-                tip TEXT,
-                tip_ko TEXT
-            )
-        """)
+        """
+        CREATE TABLE IF NOT EXISTS semantic_shifts (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            word TEXT NOT NULL UNIQUE,
+            historical_meaning TEXT NOT NULL,
+            historical_meaning_ko TEXT,
+            modern_meaning TEXT NOT NULL,
+            modern_meaning_ko TEXT,
+            example_historical TEXT,
+            example_modern TEXT,
+            tip TEXT,
+            tip_ko TEXT
+        )
+        """,
 
         # Chapter Vocabulary 테이블 (챕터별 중요 단어/숙어 - GPT 추출 결과 캐싱)
         # chapter_id는 문자열 ID (예: "aesop-fables-ch1") - FK 없음
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS chapter_vocabulary (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                chapter_id TEXT NOT NULL,
-                word TEXT NOT NULL,
-                definition TEXT NOT NULL,
-                example TEXT,
-                phonetic TEXT,
-                is_idiom INTEGER DEFAULT 0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(chapter_id, word)
-            )
-        """)
-
-        # 기존 chapter_vocabulary 테이블에 새 컬럼 추가 (마이그레이션)
-        try:
-            cursor.execute("ALTER TABLE chapter_vocabulary ADD COLUMN phonetic TEXT")
-        except Exception:
-            pass  # 이미 존재하는 경우 무시
-        try:
-            cursor.execute("ALTER TABLE chapter_vocabulary ADD COLUMN is_idiom INTEGER DEFAULT 0")
-        except Exception:
-            pass  # 이미 존재하는 경우 무시
-
-        # 마이그레이션: FK가 있는 기존 테이블을 FK 없이 재생성
-        _migrate_chapter_vocabulary_fk(cursor, conn)
+        """
+        CREATE TABLE IF NOT EXISTS chapter_vocabulary (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            chapter_id TEXT NOT NULL,
+            word TEXT NOT NULL,
+            definition TEXT NOT NULL,
+            example TEXT,
+            phonetic TEXT,
+            is_idiom INTEGER DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(chapter_id, word)
+        )
+        """,
 
         # Chapter Translations 테이블 (챕터별 번역 캐싱)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS chapter_translations (
-                chapter_id TEXT PRIMARY KEY,
-                translation TEXT NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
+        """
+        CREATE TABLE IF NOT EXISTS chapter_translations (
+            chapter_id TEXT PRIMARY KEY,
+            translation TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
 
         # Sentence Translations 테이블 (문장/텍스트 단위 번역 캐싱)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS sentence_translations (
-                text_hash TEXT PRIMARY KEY,
-                source_text TEXT NOT NULL,
-                translated_text TEXT NOT NULL,
-                target_lang TEXT NOT NULL DEFAULT 'ko',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
+        """
+        CREATE TABLE IF NOT EXISTS sentence_translations (
+            text_hash TEXT PRIMARY KEY,
+            source_text TEXT NOT NULL,
+            translated_text TEXT NOT NULL,
+            target_lang TEXT NOT NULL DEFAULT 'ko',
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
 
         # Users 테이블 (Google OAuth 인증)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS users (
-                id TEXT PRIMARY KEY,
-                google_id TEXT NOT NULL UNIQUE,
-                email TEXT NOT NULL,
-                name TEXT NOT NULL,
-                picture TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                last_login_at TIMESTAMP
-            )
-        """)
+        """
+        CREATE TABLE IF NOT EXISTS users (
+            id TEXT PRIMARY KEY,
+            google_id TEXT NOT NULL UNIQUE,
+            email TEXT NOT NULL,
+            name TEXT NOT NULL,
+            picture TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            last_login_at TIMESTAMP
+        )
+        """,
 
         # User Sync Data 테이블 (크로스 디바이스 동기화)
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS user_sync_data (
-                user_id TEXT PRIMARY KEY,
-                data TEXT NOT NULL,
-                updated_at TIMESTAMP NOT NULL,
-                FOREIGN KEY (user_id) REFERENCES users(id)
-            )
-        """)
+        """
+        CREATE TABLE IF NOT EXISTS user_sync_data (
+            user_id TEXT PRIMARY KEY,
+            data TEXT NOT NULL,
+            updated_at TIMESTAMP NOT NULL,
+            FOREIGN KEY (user_id) REFERENCES users(id)
+        )
+        """,
+    ]),
+    (2, "indexes for hot lookup columns", [
+        # 책별 챕터 목록 (WHERE book_id = ? ORDER BY chapter_number)
+        "CREATE INDEX IF NOT EXISTS idx_chapters_book_number ON chapters(book_id, chapter_number)",
+        # 난이도 필터
+        "CREATE INDEX IF NOT EXISTS idx_books_difficulty ON books(difficulty)",
+        "CREATE INDEX IF NOT EXISTS idx_heroes_difficulty ON heroes(difficulty)",
+        # 카테고리별 고어 목록 (WHERE category = ? ORDER BY word)
+        "CREATE INDEX IF NOT EXISTS idx_archaic_words_category ON archaic_words(category, word)",
+        # 대소문자 무시 단어 조회 (WHERE LOWER(word) = LOWER(?)) - UNIQUE 인덱스는 LOWER()로 감싸면 못 씀
+        "CREATE INDEX IF NOT EXISTS idx_archaic_words_lower_word ON archaic_words(LOWER(word))",
+        "CREATE INDEX IF NOT EXISTS idx_semantic_shifts_lower_word ON semantic_shifts(LOWER(word))",
+    ]),
+    (3, "catalog version metadata", [
+        # 카탈로그 버전 등 key-value 메타데이터 (seed/ingest 스크립트가 갱신 -> API 캐시 무효화)
+        """
+        CREATE TABLE IF NOT EXISTS catalog_meta (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+    ]),
+    (4, "chapter term occurrence index", [
+        # 챕터별 고어/의미 변화 단어 등장 위치 (seed 시 archaic_detector.rebuild_term_occurrences로 채움)
+        # offsets: UTF-16 기준 [시작, 길이, 시작, 길이, ...] JSON 배열
+        """
+        CREATE TABLE IF NOT EXISTS chapter_term_occurrences (
+            chapter_id TEXT NOT NULL,
+            kind TEXT NOT NULL CHECK(kind IN ('archaic', 'shift')),
+            term TEXT NOT NULL,
+            occurrences INTEGER NOT NULL,
+            offsets TEXT NOT NULL,
+            PRIMARY KEY (chapter_id, kind, term)
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_chapter_term_occurrences_term ON chapter_term_occurrences(term, kind)",
+    ]),
+    # FTS5가 없는 빌드에서는 건너뛰고 버전만 기록 (MIGRATION_REQUIREMENTS) - /search는 LIKE로 대체
+    (5, "chapter full-text search (FTS5)", CHAPTERS_FTS_SQL),
+]
+
+
+def _fts5_available(cursor):
+    """연결된 SQLite/libSQL 빌드가 FTS5 모듈을 지원하는지"""
+    try:
+        cursor.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5') AS fts5")
+        row = cursor.fetchone()
+    except Exception:
+        return False
+    return bool(row and row["fts5"])
+
+
+# 실행 조건이 있는 마이그레이션 - 조건을 만족하지 않으면 해당 단계의 SQL은 건너뜀
+MIGRATION_REQUIREMENTS = {
+    5: ("FTS5", _fts5_available),
+}
+
+
+def _get_schema_version(cursor):
+    """적용된 최신 스키마 버전 (schema_version 테이블이 없으면 0)"""
+    try:
+        cursor.execute("SELECT MAX(version) AS version FROM schema_version")
+        row = cursor.fetchone()
+    except Exception:
+        return 0
+    version = row["version"] if row else None
+    return version or 0
+
+
+def _upgrade_legacy_schema(cursor, conn):
+    """schema_version 도입 이전에 만들어진 DB 보정 (버전 0일 때 한 번만 실행)"""
+    # 기존 chapter_vocabulary 테이블에 새 컬럼 추가 (테이블이 없거나 이미 있으면 실패 - 무시)
+    try:
+        cursor.execute("ALTER TABLE chapter_vocabulary ADD COLUMN phonetic TEXT")
+    except Exception:
+        pass
+    try:
+        cursor.execute("ALTER TABLE chapter_vocabulary ADD COLUMN is_idiom INTEGER DEFAULT 0")
+    except Exception:
+        pass
+
+    # FK가 있는 기존 테이블을 FK 없이 재생성
+    _migrate_chapter_vocabulary_fk(cursor, conn)
+
 
+def _run_in_transaction(conn, statements):
+    """(sql, params) 목록을 하나의 트랜잭션으로 실행 - Turso는 batch 요청 1회"""
+    if USE_TURSO:
+        conn.batch(statements)
+        return
+
+    cursor = conn.cursor()
+    try:
+        cursor.execute("BEGIN")
+        for sql, params in statements:
+            cursor.execute(sql, params)
         conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+
+class SchemaRegistry:
+    """DB에 실제로 있는 테이블과 컬럼 목록
+
+    마이그레이션 경로(init_db, rebuild_chapter_search, 레플리카 동기화)에서만 다시 만들고,
+    라우터는 요청 중에 DB를 확인하는 대신 여기서 조회해 미리 만들어 둔 SQL을 고른다.
+    """
+
+    def __init__(self, tables=None):
+        self.tables = tables or {}  # 테이블 이름 -> frozenset(컬럼 이름)
+
+    def has_table(self, table: str) -> bool:
+        return table in self.tables
+
+    def has_columns(self, table: str, *columns) -> bool:
+        existing = self.tables.get(table)
+        return existing is not None and existing.issuperset(columns)
+
+    def stats(self):
+        return {table: sorted(columns) for table, columns in sorted(self.tables.items())}
+
+
+SCHEMA_TABLES_SQL = "SELECT name, sql FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%' ORDER BY name"
+
+# 컬럼 정의가 아닌 테이블 제약 조건 (CREATE TABLE 본문에서 건너뜀)
+_TABLE_CONSTRAINTS = ("PRIMARY", "FOREIGN", "UNIQUE", "CHECK", "CONSTRAINT")
+_COLUMN_NAME_RE = re.compile(r'\s*("[^"]+"|`[^`]+`|\[[^\]]+\]|[^\s(]+)')
+
+
+def _split_top_level(body: str):
+    """CREATE TABLE 본문을 괄호/따옴표 밖의 쉼표로 분리"""
+    parts, depth, quote, start = [], 0, None, 0
+    for i, ch in enumerate(body):
+        if quote:
+            if ch == quote:
+                quote = None
+        elif ch in "'\"`[":
+            quote = "]" if ch == "[" else ch
+        elif ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif ch == "," and depth == 0:
+            parts.append(body[start:i])
+            start = i + 1
+    parts.append(body[start:])
+    return parts
+
+
+def _table_columns(sql: str):
+    """sqlite_master.sql(CREATE TABLE / CREATE VIRTUAL TABLE)의 컬럼 이름 목록
+
+    ALTER TABLE ADD COLUMN도 SQLite가 저장된 CREATE 문에 반영하므로 실제 컬럼과 같다.
+    가상 테이블(fts5)은 인자 중 option=value가 아닌 것이 컬럼.
+    """
+    start = sql.find("(")
+    if start < 0:
+        return []
+    depth = 0
+    for end in range(start, len(sql)):
+        depth += {"(": 1, ")": -1}.get(sql[end], 0)
+        if depth == 0:
+            break
+    virtual = sql.lstrip().upper().startswith("CREATE VIRTUAL")
+    columns = []
+    for part in _split_top_level(sql[start + 1:end]):
+        name = _COLUMN_NAME_RE.match(part)
+        if not name or (virtual and "=" in part) or (not virtual and name.group(1).upper() in _TABLE_CONSTRAINTS):
+            continue
+        columns.append(name.group(1).strip('"`[]'))
+    return columns
+
+
+def _registry_from_rows(rows) -> SchemaRegistry:
+    return SchemaRegistry({row["name"]: frozenset(_table_columns(row["sql"] or "")) for row in rows})
+
+
+def load_schema_registry(conn) -> SchemaRegistry:
+    """sqlite_master의 테이블 목록과 CREATE 문에서 컬럼을 읽어 레지스트리 생성 (쿼리 1회)
+
+    PRAGMA table_info는 Turso에서 미지원이라 쓰지 않는다.
+    """
+    cursor = conn.cursor()
+    cursor.execute(SCHEMA_TABLES_SQL)
+    return _registry_from_rows(cursor.fetchall())
+
+
+# 기본 DB의 스키마 (init_db가 채움) - 레플리카 쪽은 _replica_schema_registry (레플리카 동기화 때 채움)
+schema_registry = SchemaRegistry()
+
+
+def refresh_schema_registry(conn) -> SchemaRegistry:
+    """기본 DB 스키마를 다시 읽어 schema_registry 갱신 (스키마를 바꾼 직후 호출)
+
+    라우터가 from database import schema_registry로 가져가므로 객체는 그대로 두고 내용만 바꾼다.
+    """
+    return _set_schema_registry(load_schema_registry(conn))
+
+
+def _set_schema_registry(registry: SchemaRegistry) -> SchemaRegistry:
+    schema_registry.tables = registry.tables
+    print(f"[schema] 레지스트리 갱신: 테이블 {len(schema_registry.tables)}개")
+    return schema_registry
+
+
+def get_catalog_schema_registry() -> SchemaRegistry:
+    """get_async_catalog_db가 주는 DB의 스키마 - 레플리카를 쓰는 중이면 레플리카 쪽"""
+    if _replica_pool is not None and _replica_schema_registry is not None:
+        return _replica_schema_registry
+    return schema_registry
+
+
+def init_db():
+    """데이터베이스 초기화 - 미적용 마이그레이션만 실행 후 schema_registry 갱신
+
+    최신 상태면 스키마 버전, 스키마 레지스트리, catalog_version을 한 번에 읽고 끝나고
+    (Turso는 batch 요청 1회), 적용할 단계가 있으면 전부 하나의 batch(트랜잭션)로 실행.
+    """
+    if not USE_TURSO:
+        os.makedirs(os.path.dirname(LOCAL_DATABASE_PATH), exist_ok=True)
+
+    with get_db() as conn:
+        cursor = conn.cursor()
+        try:
+            current, registry, catalog_version = _read_startup_state(conn)
+        except Exception:
+            # schema_version/catalog_meta가 아직 없는 DB (새 DB, 이전 버전 DB) - 버전만 따로 확인
+            current, registry, catalog_version = _get_schema_version(cursor), None, None
+        pending = [m for m in MIGRATIONS if m[0] > current]
+        if not pending and registry is not None:
+            _set_schema_registry(registry)
+            if catalog_version is None:
+                bump_catalog_version(conn)
+            return
+        if not pending:
+            refresh_schema_registry(conn)
+            _ensure_catalog_version(conn)
+            return
+
+        if current == 0:
+            _upgrade_legacy_schema(cursor, conn)
+
+        skipped = []
+        statements = [("""
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version INTEGER PRIMARY KEY,
+                description TEXT,
+                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """, [])]
+        for version, description, steps in pending:
+            requirement = MIGRATION_REQUIREMENTS.get(version)
+            if requirement and not requirement[1](cursor):
+                skipped.append(f"v{version} ({requirement[0]} 미지원)")
+            else:
+                statements.extend((sql, []) for sql in steps)
+            # 여러 인스턴스가 동시에 기동해도 충돌하지 않도록 OR IGNORE
+            statements.append((
+                "INSERT OR IGNORE INTO schema_version (version, description) VALUES (?, ?)",
+                [version, description]
+            ))
+
+        _run_in_transaction(conn, statements)
+        print(f"[migrate] 스키마 v{current} -> v{pending[-1][0]} ({len(pending)}단계 적용)")
+        if skipped:
+            print(f"[migrate] 건너뛴 단계: {', '.join(skipped)}")
+        refresh_schema_registry(conn)
+        _ensure_catalog_version(conn)
+
+
+def _read_startup_state(conn):
+    """(스키마 버전, SchemaRegistry, catalog_version 또는 None)을 한 번에 조회
+
+    Turso는 batch 요청 한 번, 로컬 SQLite는 같은 쿼리를 차례로 실행.
+    schema_version이나 catalog_meta 테이블이 없으면 예외.
+    """
+    statements = [
+        "SELECT MAX(version) AS version FROM schema_version",
+        SCHEMA_TABLES_SQL,
+        "SELECT value FROM catalog_meta WHERE key = 'catalog_version'",
+    ]
+    if isinstance(conn, TursoConnection):
+        results = [_result_to_rows(result) for result in conn.batch(statements)]
+    else:
+        cursor = conn.cursor()
+        results = []
+        for sql in statements:
+            cursor.execute(sql)
+            results.append(cursor.fetchall())
+    version_rows, table_rows, catalog_rows = results
+    current = (version_rows[0]["version"] if version_rows else None) or 0
+    return current, _registry_from_rows(table_rows), catalog_rows[0]["value"] if catalog_rows else None
+
+
+def _ensure_catalog_version(conn):
+    """catalog_version이 아직 없으면 (seed를 다시 돌리지 않은 기존 DB) 현재 내용으로 한 번 계산해 기록
+
+    값이 없으면 API 서버가 카탈로그 캐시/ETag/감지기 재사용을 할 수 없으므로 기동 시 채운다.
+    """
+    cursor = conn.cursor()
+    cursor.execute("SELECT value FROM catalog_meta WHERE key = 'catalog_version'")
+    if cursor.fetchone() is None:
+        bump_catalog_version(conn)
+
+
+def rebuild_chapter_search(conn):
+    """chapters_fts 색인을 (없으면 만들고) chapters 전체로 재구성 - seed 스크립트에서 호출
+
+    트리거가 있으면 평소에는 자동으로 동기화되지만, 마이그레이션 5를 건너뛴 DB에
+    나중에 FTS5가 생긴 경우나 색인이 어긋난 경우를 여기서 바로잡는다.
+    FTS5를 지원하지 않으면 아무것도 하지 않고 False.
+    """
+    cursor = conn.cursor()
+    if not _fts5_available(cursor):
+        print("[search] FTS5 미지원 - 챕터 검색 색인 생략 (/search는 LIKE로 대체)")
+        return False
+    for sql in CHAPTERS_FTS_SQL:
+        cursor.execute(sql)
+    conn.commit()
+    print("[search] 챕터 검색 색인 재구성 완료")
+    refresh_schema_registry(conn)
+    return True
+
+
+def bump_catalog_version(conn):
+    """카탈로그 테이블 내용 해시를 catalog_version으로 기록
+
+    seed/ingest 스크립트가 카탈로그 데이터를 바꾼 뒤 호출. API 서버는 이 값이
+    바뀐 것을 보고 카탈로그 캐시(ETag 포함)를 무효화한다.
+    """
+    cursor = conn.cursor()
+    digest = hashlib.sha256()
+    for table in CATALOG_TABLES:
+        cursor.execute(f"SELECT * FROM {table} ORDER BY 1")
+        for row in cursor.fetchall():
+            digest.update(repr(tuple(row)).encode("utf-8"))
+    version = digest.hexdigest()
+
+    cursor.execute(
+        """
+        INSERT INTO catalog_meta (key, value) VALUES ('catalog_version', ?)
+        ON CONFLICT(key) DO UPDATE SET value = excluded.value, updated_at = CURRENT_TIMESTAMP
+        """,
+        (version,)
+    )
+    conn.commit()
+    print(f"[catalog] catalog_version = {version[:12]}")
+    return version
 
 
 if __name__ == "__main__":
-    init_db()
+    try:
+        init_db()
+    finally:
+        close_pool()
     db_type = "Turso" if USE_TURSO else "Local SQLite"
     print(f"Database initialized ({db_type})")
@@ -0,0 +1,121 @@
+"""고어/의미 변화 사전 자동완성 인덱스
+
+두 사전의 단어를 소문자 정렬 배열 하나로 합쳐 접두어는 bisect로 범위를 찾고,
+오타(편집 거리 1)는 symmetric delete 방식으로 찾는다: 모든 단어의 접두어와
+그 접두어에서 한 글자를 지운 형태를 미리 dict에 넣어 두면, 질의 쪽도 한 글자씩
+지운 형태만 조회하면 되므로 사전 크기와 무관하게 dict 조회 몇 번으로 끝난다.
+
+항목 데이터는 archaic_detector의 감지기(catalog_version당 하나)에서 가져오므로
+사전 테이블이 바뀌어 감지기가 다시 만들어지면 이 인덱스도 다음 요청에서 다시 만든다.
+감지기가 덧붙이는 -eth/-est 굴절형 항목은 사전 단어가 아니므로 넣지 않는다.
+"""
+from bisect import bisect_left
+from archaic_detector import get_archaic_detector
+
+# 오타 허용 검색을 시작하는 최소 접두어 길이 (짧은 접두어는 한 글자만 바꿔도 거의 모든 단어와 맞음)
+FUZZY_MIN_LENGTH = 3
+
+
+def _deletes(text: str):
+    """text와 text에서 한 글자를 지운 형태들"""
+    return {text} | {text[:i] + text[i + 1:] for i in range(len(text))}
+
+
+def _within_one_edit(a: str, b: str) -> bool:
+    """편집 거리(삽입/삭제/치환/인접 전치) 1 이하인지"""
+    if a == b:
+        return True
+    la, lb = len(a), len(b)
+    if abs(la - lb) > 1:
+        return False
+    if la > lb:
+        a, b, la, lb = b, a, lb, la
+    i = 0
+    while i < la and a[i] == b[i]:
+        i += 1
+    if la == lb:
+        if a[i + 1:] == b[i + 1:]:  # 치환
+            return True
+        # 인접 전치 (thuo <-> thou)
+        return i + 1 < la and a[i] == b[i + 1] and a[i + 1] == b[i] and a[i + 2:] == b[i + 2:]
+    return a[i:] == b[i + 1:]  # 삽입/삭제
+
+
+class DictionarySuggest:
+    """사전 한 버전에 대한 자동완성 인덱스 (만든 뒤에는 읽기 전용)"""
+
+    def __init__(self, detector):
+        self.source = detector
+        self.version = detector.version
+        self.entries = [{
+            "word": entry["word"],
+            "kind": "archaic",
+            "summary": entry["modernEquivalent"]
+        } for entry in detector.archaic[:detector.dictionary_words]] + [{
+            "word": entry["word"],
+            "kind": "shift",
+            "summary": entry["modernMeaningKo"]
+        } for entry in detector.shifts]
+
+        # 소문자 단어 정렬 배열 (같은 단어가 두 사전에 있으면 둘 다)
+        pairs = sorted((entry["word"].lower(), i) for i, entry in enumerate(self.entries))
+        self._keys = [key for key, _i in pairs]
+        self._refs = [i for _key, i in pairs]
+
+        # 접두어(길이 FUZZY_MIN_LENGTH - 1 이상)의 한 글자 삭제형 -> 항목 인덱스 집합
+        self._fuzzy = {}
+        for key, i in pairs:
+            for length in range(FUZZY_MIN_LENGTH - 1, len(key) + 1):
+                for variant in _deletes(key[:length]):
+                    self._fuzzy.setdefault(variant, set()).add(i)
+
+    def suggest(self, prefix: str, limit: int = 10) -> list:
+        """접두어로 시작하는 단어 (알파벳 순) + 모자라면 편집 거리 1 이내의 접두어를 가진 단어"""
+        prefix = " ".join(prefix.lower().split())
+        if not prefix:
+            return []
+
+        results, seen = [], set()
+        keys = self._keys
+        position = bisect_left(keys, prefix)
+        while position < len(keys) and len(results) < limit and keys[position].startswith(prefix):
+            i = self._refs[position]
+            results.append(dict(self.entries[i], match="prefix"))
+            seen.add(i)
+            position += 1
+
+        if len(results) < limit and len(prefix) >= FUZZY_MIN_LENGTH:
+            candidates = set()
+            for variant in _deletes(prefix):
+                candidates.update(self._fuzzy.get(variant, ()))
+            fuzzy = []
+            for i in candidates - seen:
+                key = self.entries[i]["word"].lower()
+                # 후보는 편집 거리 2까지 섞여 있으므로 길이 ±1 접두어로 다시 확인
+                if any(_within_one_edit(prefix, key[:length])
+                       for length in (len(prefix) - 1, len(prefix), len(prefix) + 1) if length <= len(key)):
+                    fuzzy.append((key, i))
+            for _key, i in sorted(fuzzy)[:limit - len(results)]:
+                results.append(dict(self.entries[i], match="fuzzy"))
+        return results
+
+    def stats(self):
+        return {
+            "version": self.version,
+            "words": len(self._keys),
+            "fuzzyKeys": len(self._fuzzy),
+        }
+
+
+_index = None
+
+
+async def get_dictionary_suggest():
+    """현재 감지기(= catalog_version)의 자동완성 인덱스 반환 (감지기가 바뀌었으면 다시 만듦)"""
+    global _index
+    detector = await get_archaic_detector()
+    index = _index
+    if index is None or index.source is not detector:
+        index = DictionarySuggest(detector)
+        _index = index
+    return index
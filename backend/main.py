@@ -3,8 +3,9 @@ import traceback
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-from routers import books, heroes, chapters, words, openai_proxy, vocabulary, translations, auth, sync
-from database import init_db
+from routers import books, heroes, chapters, words, search, openai_proxy, vocabulary, translations, auth, sync, internal
+from database import init_db, close_pool, close_async_pool, start_catalog_replica, stop_catalog_replica, track_request_queries
+from archaic_detector import get_archaic_detector
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -28,15 +29,37 @@ app.include_router(books.router, prefix="/api")
 app.include_router(heroes.router, prefix="/api")
 app.include_router(chapters.router, prefix="/api")
 app.include_router(words.router, prefix="/api")
+app.include_router(search.router, prefix="/api")
 app.include_router(openai_proxy.router, prefix="/api")
 app.include_router(vocabulary.router, prefix="/api")
 app.include_router(translations.router, prefix="/api")
 app.include_router(auth.router, prefix="/api")
 app.include_router(sync.router, prefix="/api")
+app.include_router(internal.router, prefix="/api")
 
 @app.on_event("startup")
-def startup():
+async def startup():
     init_db()
+    await start_catalog_replica()
+    try:
+        # 고어 감지 인덱스 미리 로드 (첫 요청 지연 방지)
+        await get_archaic_detector()
+    except Exception as e:
+        print(f"[archaic] 감지기 초기 로드 실패 (첫 요청 시 재시도): {e}")
+
+@app.on_event("shutdown")
+async def shutdown():
+    await stop_catalog_replica()
+    await close_async_pool()
+    close_pool()
+
+@app.middleware("http")
+async def db_query_timing(request: Request, call_next):
+    """요청별 DB 쿼리 수/시간을 Server-Timing 헤더로 노출"""
+    with track_request_queries() as usage:
+        response = await call_next(request)
+    response.headers["Server-Timing"] = f'db;dur={usage.total_ms:.1f};desc="{usage.count} queries"'
+    return response
 
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
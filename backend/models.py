@@ -36,6 +36,19 @@ class Book(BaseModel):
 class BookWithChapters(Book):
     chapters: List[ChapterInBook] = []
 
+class ChapterSummary(BaseModel):
+    id: str  # 고유 챕터 ID (예: "aesop-fables-ch1")
+    chapterNumber: Optional[int] = None
+    title: str
+    wordCount: Optional[int] = None
+
+class BookSummary(Book):
+    chapters: List[ChapterSummary] = []
+
+class ChapterBatch(BaseModel):
+    chapters: List[ChapterInBook] = []  # 요청한 ids 순서
+    missing: List[str] = []  # 존재하지 않거나 형식이 잘못된 id
+
 class RecommendedTopic(BaseModel):
     title: str
     titleKo: str
@@ -59,3 +72,46 @@ class Hero(BaseModel):
     ttsConfig: Optional[dict] = None
     portraitImage: Optional[str] = None
     scenarios: Optional[List[dict]] = None
+
+class TopicTag(BaseModel):
+    title: str
+    titleKo: str
+
+class HeroCard(BaseModel):
+    """영웅 선택 화면용 요약 (프롬프트/시나리오 제외 - /heroes/{id}/scenarios로 따로 조회)"""
+    id: str
+    name: str
+    nameKo: Optional[str] = None
+    period: Optional[str] = None
+    nationality: Optional[str] = None
+    nationalityKo: Optional[str] = None
+    avatar: Optional[str] = None
+    difficulty: Optional[str] = None
+    linkedContent: Optional[str] = None
+    profile: Optional[dict] = None  # summary, summaryKo
+    recommendedTopics: List[TopicTag] = []
+    portraitImage: Optional[str] = None
+    scenarioCount: int = 0
+
+class HeroScenarios(BaseModel):
+    heroId: str
+    conversationStyle: Optional[dict] = None
+    scenarios: List[dict] = []
+
+class SearchHit(BaseModel):
+    chapterId: str  # "{bookId}-ch{n}"
+    bookId: str
+    bookTitle: str
+    chapterNumber: int
+    title: str
+    snippet: str
+    highlights: List[int] = []  # snippet 안의 일치 위치 [시작, 길이, ...] (UTF-16)
+    score: Optional[float] = None  # FTS 관련도 (클수록 관련도 높음), LIKE 대체 검색은 None
+
+class SearchResults(BaseModel):
+    query: str
+    mode: str  # "fts" | "like" (FTS5 색인이 없는 DB)
+    total: int
+    limit: int
+    offset: int
+    results: List[SearchHit] = []
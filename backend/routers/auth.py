@@ -4,12 +4,13 @@ import uuid
 from datetime import datetime, timedelta, timezone
 
 from fastapi import APIRouter, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from google.oauth2 import id_token
 from google.auth.transport import requests as google_requests
 import jwt
 
-from database import get_db
+from database import get_async_db
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -72,42 +73,42 @@ def get_current_user(request: Request) -> dict:
 
 
 @router.post("/google", response_model=AuthResponse)
-def google_login(request: GoogleLoginRequest):
+async def google_login(request: GoogleLoginRequest):
     """Google ID token으로 로그인/회원가입"""
     if not GOOGLE_CLIENT_ID:
         raise HTTPException(status_code=500, detail="서버에 GOOGLE_CLIENT_ID가 설정되지 않았습니다")
 
-    # Google 토큰 검증
-    idinfo = verify_google_token(request.credential)
+    # Google 토큰 검증 (공개키 조회가 블로킹 HTTP라 스레드풀에서 실행)
+    idinfo = await run_in_threadpool(verify_google_token, request.credential)
     google_id = idinfo["sub"]
     email = idinfo.get("email", "")
     name = idinfo.get("name", "")
     picture = idinfo.get("picture", "")
 
-    with get_db() as conn:
+    async with get_async_db() as conn:
         cursor = conn.cursor()
         now = datetime.now(timezone.utc).isoformat()
 
         # 기존 유저 조회
-        cursor.execute("SELECT id, email, name, picture FROM users WHERE google_id = ?", (google_id,))
-        existing = cursor.fetchone()
+        await cursor.execute("SELECT id, email, name, picture FROM users WHERE google_id = ?", (google_id,))
+        existing = await cursor.fetchone()
 
         if existing:
             user_id = existing["id"]
             # 마지막 로그인 시간 업데이트
-            cursor.execute(
+            await cursor.execute(
                 "UPDATE users SET last_login_at = ?, name = ?, picture = ? WHERE id = ?",
                 (now, name, picture, user_id)
             )
         else:
             # 신규 유저 생성
             user_id = str(uuid.uuid4())
-            cursor.execute(
+            await cursor.execute(
                 "INSERT INTO users (id, google_id, email, name, picture, created_at, last_login_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
                 (user_id, google_id, email, name, picture, now, now)
             )
 
-        conn.commit()
+        await conn.commit()
 
     # JWT 발급
     token = create_jwt(user_id)
@@ -119,15 +120,15 @@ def google_login(request: GoogleLoginRequest):
 
 
 @router.get("/me", response_model=UserResponse)
-def get_me(request: Request):
+async def get_me(request: Request):
     """현재 로그인된 유저 정보 반환"""
     payload = get_current_user(request)
     user_id = payload["sub"]
 
-    with get_db() as conn:
+    async with get_async_db() as conn:
         cursor = conn.cursor()
-        cursor.execute("SELECT id, email, name, picture FROM users WHERE id = ?", (user_id,))
-        user = cursor.fetchone()
+        await cursor.execute("SELECT id, email, name, picture FROM users WHERE id = ?", (user_id,))
+        user = await cursor.fetchone()
 
     if not user:
         raise HTTPException(status_code=404, detail="유저를 찾을 수 없습니다")
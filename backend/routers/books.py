@@ -1,11 +1,16 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from typing import List, Optional
 import json
-from database import get_db
-from models import Book, BookWithChapters, ChapterInBook
+from database import get_async_catalog_db
+from catalog_cache import cached_catalog_response, catalog_conditional, render_json
+from models import Book, BookWithChapters, ChapterInBook, BookSummary
 
 router = APIRouter(tags=["books"])
 
+# stream=true 응답에서 한 번에 커서에서 읽어 두는 챕터 수
+CHAPTER_STREAM_BATCH = 2
+
 def row_to_book(row) -> dict:
     return {
         "id": row["id"],
@@ -35,71 +40,217 @@ def row_to_chapter(row, book_id: str) -> dict:
         "vocabulary": json.loads(row["vocabulary"]) if row["vocabulary"] else None
     }
 
-@router.get("/books", response_model=List[BookWithChapters])
-def get_books(difficulty: Optional[str] = None):
-    with get_db() as conn:
+def row_to_chapter_summary(row, book_id: str) -> dict:
+    return {
+        "id": f"{book_id}-ch{row['chapter_number']}",
+        "chapterNumber": row["chapter_number"],
+        "title": row["title"],
+        "wordCount": row["word_count"]
+    }
+
+def group_chapters(chapter_rows, to_chapter=row_to_chapter) -> dict:
+    """챕터 행들을 book_id별 응답 챕터 리스트로 묶기 (행은 book_id, chapter_number 순)"""
+    grouped = {}
+    for ch in chapter_rows:
+        grouped.setdefault(ch["book_id"], []).append(to_chapter(ch, ch["book_id"]))
+    return grouped
+
+async def _fetch_rows(sql: str, params: list) -> list:
+    async with get_async_catalog_db() as conn:
+        cursor = conn.cursor()
+        await cursor.execute(sql, params)
+        return await cursor.fetchall()
+
+async def _stream_books_json(book_rows, chapter_sql: str, params: list, single: bool):
+    """책 메타데이터와 챕터 커서를 병합해 JSON을 조각 단위로 생성
+
+    챕터는 book_rows와 같은 순서(books.rowid, chapter_number)로 읽으므로 커서를
+    한 번만 훑으면 되고, 메모리에는 CHAPTER_STREAM_BATCH개 챕터만 올라간다.
+    출력 바이트는 response_model 경로(render_json)와 동일.
+    """
+    async with get_async_catalog_db() as conn:
         cursor = conn.cursor()
+        await cursor.execute(chapter_sql, params)
+        pending, exhausted = [], False
+
+        if not single:
+            yield b"["
+        for i, book_row in enumerate(book_rows):
+            book_id = book_row["id"]
+            # Book 직렬화 결과의 닫는 괄호를 떼고 chapters 배열을 이어 붙임
+            head = render_json(row_to_book(book_row), Book)[:-1]
+            yield (b"," if i else b"") + head + b',"chapters":['
+            first = True
+            while True:
+                if not pending and not exhausted:
+                    pending = await cursor.fetchmany(CHAPTER_STREAM_BATCH)
+                    exhausted = len(pending) < CHAPTER_STREAM_BATCH
+                if not pending or pending[0]["book_id"] != book_id:
+                    break
+                chapter = render_json(row_to_chapter(pending.pop(0), book_id), ChapterInBook)
+                yield chapter if first else b"," + chapter
+                first = False
+            yield b"]}"
+        if not single:
+            yield b"]"
+
+async def _streaming_books_response(request: Request, key: str, book_sql: str, chapter_sql: str,
+                                    params: list, single: bool = False):
+    """stream=true 모드 - 챕터 본문을 모아 두지 않고 커서에서 읽는 대로 전송
+
+    책 수/챕터 길이와 무관하게 요청당 메모리가 일정. ETag는 일반 응답과 같은 키를 사용
+    (바이트가 같으므로). 캐시에는 저장하지 않는다.
+    """
+    headers, not_modified = await catalog_conditional(request, key)
+    if not_modified is not None:
+        return not_modified
+
+    book_rows = await _fetch_rows(book_sql, params)
+    if single and not book_rows:
+        raise HTTPException(status_code=404, detail="Book not found")
+
+    return StreamingResponse(
+        _stream_books_json(book_rows, chapter_sql, params, single),
+        media_type="application/json",
+        headers=headers,
+    )
+
+@router.get("/books", response_model=List[BookWithChapters])
+async def get_books(request: Request, difficulty: Optional[str] = None, stream: bool = False):
+    key = f"books:{difficulty or ''}"
+    if stream:
+        if difficulty:
+            return await _streaming_books_response(
+                request, key,
+                "SELECT * FROM books WHERE difficulty = ? ORDER BY rowid",
+                """
+                    SELECT c.* FROM chapters c
+                    JOIN books b ON b.id = c.book_id
+                    WHERE b.difficulty = ?
+                    ORDER BY b.rowid, c.chapter_number
+                """,
+                [difficulty],
+            )
+        return await _streaming_books_response(
+            request, key,
+            "SELECT * FROM books ORDER BY rowid",
+            """
+                SELECT c.* FROM chapters c
+                JOIN books b ON b.id = c.book_id
+                ORDER BY b.rowid, c.chapter_number
+            """,
+            [],
+        )
 
+    return await cached_catalog_response(
+        request, key, lambda: _load_books(difficulty), List[BookWithChapters]
+    )
+
+async def _load_books(difficulty: Optional[str]) -> list:
+    async with get_async_catalog_db() as conn:
+        # 책 목록과 해당 책들의 챕터 전부를 batch 한 번으로 조회 (책 수와 무관하게 왕복 1회)
         if difficulty:
-            cursor.execute("SELECT * FROM books WHERE difficulty = ?", (difficulty,))
+            book_rows, chapter_rows = await conn.batch([
+                ("SELECT * FROM books WHERE difficulty = ?", [difficulty]),
+                ("""
+                    SELECT c.* FROM chapters c
+                    JOIN books b ON b.id = c.book_id
+                    WHERE b.difficulty = ?
+                    ORDER BY c.book_id, c.chapter_number
+                """, [difficulty]),
+            ])
         else:
-            cursor.execute("SELECT * FROM books")
+            book_rows, chapter_rows = await conn.batch([
+                ("SELECT * FROM books", []),
+                ("SELECT * FROM chapters ORDER BY book_id, chapter_number", []),
+            ])
 
-        books = cursor.fetchall()
+        chapters_by_book = group_chapters(chapter_rows)
         result = []
 
-        for book_row in books:
+        for book_row in book_rows:
             book_data = row_to_book(book_row)
+            book_data["chapters"] = chapters_by_book.get(book_row["id"], [])
+            result.append(book_data)
 
-            # 각 책의 챕터 가져오기
-            cursor.execute(
-                "SELECT * FROM chapters WHERE book_id = ? ORDER BY chapter_number",
-                (book_row["id"],)
-            )
-            chapters = cursor.fetchall()
-            book_data["chapters"] = [row_to_chapter(ch, book_row["id"]) for ch in chapters]
+        return result
+
+@router.get("/books/summary", response_model=List[BookSummary])
+async def get_book_summaries(request: Request, difficulty: Optional[str] = None):
+    """책 카드용 목록 - 챕터 본문/어휘 없이 메타데이터만 (본문은 /books/{id}로 필요할 때 조회)"""
+    return await cached_catalog_response(
+        request, f"books-summary:{difficulty or ''}", lambda: _load_book_summaries(difficulty), List[BookSummary]
+    )
 
+async def _load_book_summaries(difficulty: Optional[str]) -> list:
+    async with get_async_catalog_db() as conn:
+        if difficulty:
+            book_rows, chapter_rows = await conn.batch([
+                ("SELECT * FROM books WHERE difficulty = ?", [difficulty]),
+                ("""
+                    SELECT c.book_id, c.chapter_number, c.title, c.word_count FROM chapters c
+                    JOIN books b ON b.id = c.book_id
+                    WHERE b.difficulty = ?
+                    ORDER BY c.book_id, c.chapter_number
+                """, [difficulty]),
+            ])
+        else:
+            book_rows, chapter_rows = await conn.batch([
+                ("SELECT * FROM books", []),
+                ("SELECT book_id, chapter_number, title, word_count FROM chapters ORDER BY book_id, chapter_number", []),
+            ])
+
+        chapters_by_book = group_chapters(chapter_rows, row_to_chapter_summary)
+        result = []
+        for book_row in book_rows:
+            book_data = row_to_book(book_row)
+            book_data["chapters"] = chapters_by_book.get(book_row["id"], [])
             result.append(book_data)
 
         return result
 
 @router.get("/books/{book_id}", response_model=BookWithChapters)
-def get_book(book_id: str):
-    with get_db() as conn:
-        cursor = conn.cursor()
+async def get_book(book_id: str, request: Request, stream: bool = False):
+    key = f"book:{book_id}"
+    if stream:
+        return await _streaming_books_response(
+            request, key,
+            "SELECT * FROM books WHERE id = ?",
+            "SELECT * FROM chapters WHERE book_id = ? ORDER BY chapter_number",
+            [book_id],
+            single=True,
+        )
 
-        cursor.execute("SELECT * FROM books WHERE id = ?", (book_id,))
-        book_row = cursor.fetchone()
+    return await cached_catalog_response(
+        request, key, lambda: _load_book(book_id), BookWithChapters
+    )
 
-        if not book_row:
-            raise HTTPException(status_code=404, detail="Book not found")
+async def _load_book(book_id: str) -> dict:
+    async with get_async_catalog_db() as conn:
+        # 책 + 챕터를 batch 한 번으로 조회
+        book_rows, chapter_rows = await conn.batch([
+            ("SELECT * FROM books WHERE id = ?", [book_id]),
+            ("SELECT * FROM chapters WHERE book_id = ? ORDER BY chapter_number", [book_id]),
+        ])
 
-        book_data = row_to_book(book_row)
+        if not book_rows:
+            raise HTTPException(status_code=404, detail="Book not found")
 
-        # 챕터 가져오기
-        cursor.execute(
-            "SELECT * FROM chapters WHERE book_id = ? ORDER BY chapter_number",
-            (book_id,)
-        )
-        chapters = cursor.fetchall()
-        book_data["chapters"] = [row_to_chapter(ch, book_id) for ch in chapters]
+        book_data = row_to_book(book_rows[0])
+        book_data["chapters"] = [row_to_chapter(ch, book_id) for ch in chapter_rows]
 
         return book_data
 
 @router.get("/books/{book_id}/chapters")
-def get_book_chapters(book_id: str):
-    with get_db() as conn:
-        cursor = conn.cursor()
+async def get_book_chapters(book_id: str):
+    async with get_async_catalog_db() as conn:
+        # 책 존재 확인 + 챕터 조회를 batch 한 번으로
+        book_rows, chapter_rows = await conn.batch([
+            ("SELECT id FROM books WHERE id = ?", [book_id]),
+            ("SELECT * FROM chapters WHERE book_id = ? ORDER BY chapter_number", [book_id]),
+        ])
 
-        # 책 존재 확인
-        cursor.execute("SELECT id FROM books WHERE id = ?", (book_id,))
-        if not cursor.fetchone():
+        if not book_rows:
             raise HTTPException(status_code=404, detail="Book not found")
 
-        cursor.execute(
-            "SELECT * FROM chapters WHERE book_id = ? ORDER BY chapter_number",
-            (book_id,)
-        )
-        chapters = cursor.fetchall()
-
-        return [row_to_chapter(ch, book_id) for ch in chapters]
+        return [row_to_chapter(ch, book_id) for ch in chapter_rows]
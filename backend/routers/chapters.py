@@ -1,10 +1,17 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 import json
-from database import get_db
-from models import Chapter
+from database import get_async_db, get_async_catalog_db
+from catalog_cache import cached_catalog_response, catalog_cache, etag_matches, json_response, render_json
+from models import Chapter, ChapterBatch
+from routers.books import row_to_chapter as row_to_book_chapter
+from routers.vocabulary import vocabulary_statements
+from archaic_detector import get_archaic_detector
 
 router = APIRouter(tags=["chapters"])
 
+# GET /chapters?ids= 한 번에 조회할 수 있는 최대 챕터 수
+MAX_CHAPTER_IDS = 50
+
 def row_to_chapter(row) -> dict:
     return {
         "id": row["id"],
@@ -16,13 +23,138 @@ def row_to_chapter(row) -> dict:
         "vocabulary": json.loads(row["vocabulary"]) if row["vocabulary"] else None
     }
 
+def parse_chapter_id(composite_id: str):
+    """"{book_id}-ch{n}" 형식의 공개 챕터 ID를 (book_id, chapter_number)로 분리 (형식이 틀리면 None)"""
+    book_id, sep, number = composite_id.rpartition("-ch")
+    if not sep or not book_id or not number.isdigit():
+        return None
+    return book_id, int(number)
+
+async def _load_chapter_batch(ids: list) -> dict:
+    keys = {composite_id: parse_chapter_id(composite_id) for composite_id in ids}
+    lookups = [key for key in keys.values() if key is not None]
+
+    found = {}
+    if lookups:
+        # (book_id, chapter_number) OR 체인 -> idx_chapters_book_number로 id마다 인덱스 조회
+        where = " OR ".join("(book_id = ? AND chapter_number = ?)" for _ in lookups)
+        params = [value for key in lookups for value in key]
+        async with get_async_catalog_db() as conn:
+            cursor = conn.cursor()
+            await cursor.execute(f"SELECT * FROM chapters WHERE {where}", params)
+            for row in await cursor.fetchall():
+                found[(row["book_id"], row["chapter_number"])] = row
+
+    chapters, missing = [], []
+    for composite_id, key in keys.items():
+        row = found.get(key)
+        if row is None:
+            missing.append(composite_id)
+        else:
+            chapters.append(row_to_book_chapter(row, row["book_id"]))
+    return {"chapters": chapters, "missing": missing}
+
+@router.get("/chapters", response_model=ChapterBatch)
+async def get_chapters(request: Request, ids: str = Query(..., description='쉼표로 구분한 챕터 ID (예: "aesop-fables-ch1,aesop-fables-ch2")')):
+    """공개 챕터 ID 여러 개를 한 번에 조회 (다음 챕터 미리 받기용)"""
+    # 순서는 유지하고 중복은 제거
+    id_list = list(dict.fromkeys(part.strip() for part in ids.split(",") if part.strip()))
+    if not id_list:
+        raise HTTPException(status_code=400, detail="ids가 비어 있습니다")
+    if len(id_list) > MAX_CHAPTER_IDS:
+        raise HTTPException(status_code=400, detail=f"ids는 최대 {MAX_CHAPTER_IDS}개까지 조회할 수 있습니다")
+
+    return await cached_catalog_response(
+        request, "chapters:" + ",".join(id_list), lambda: _load_chapter_batch(id_list), ChapterBatch
+    )
+
+async def _load_chapter_annotations(composite_id: str) -> dict:
+    key = parse_chapter_id(composite_id)
+    if key is None:
+        raise HTTPException(status_code=404, detail="Chapter not found")
+
+    async with get_async_catalog_db() as conn:
+        chapter_rows, occurrence_rows = await conn.batch([
+            ("SELECT id FROM chapters WHERE book_id = ? AND chapter_number = ?", list(key)),
+            ("SELECT kind, term, offsets FROM chapter_term_occurrences WHERE chapter_id = ?", [composite_id]),
+        ])
+    if not chapter_rows:
+        raise HTTPException(status_code=404, detail="Chapter not found")
+
+    detector = await get_archaic_detector()
+    return {"chapterId": composite_id, **detector.annotations(occurrence_rows)}
+
+@router.get("/chapters/{composite_id}/annotations")
+async def get_chapter_annotations(composite_id: str, request: Request):
+    """seed 시 색인해 둔 챕터의 고어/의미 변화 단어와 등장 위치 (/detect-archaic?positions=true와 같은 형식)"""
+    return await cached_catalog_response(
+        request, f"annotations:{composite_id}", lambda: _load_chapter_annotations(composite_id)
+    )
+
+@router.get("/chapters/{composite_id}/bundle")
+async def get_chapter_bundle(composite_id: str, request: Request):
+    """챕터를 열 때 필요한 데이터(본문, 중요 단어, 번역, 고어 감지)를 한 번에 반환
+
+    DB는 batch 한 번으로 조회 (Turso는 HTTP 요청 1회). 고어 감지 결과는 seed 때 색인해 둔
+    chapter_term_occurrences에서 읽어 /chapters/{id}/annotations와 같은 형식으로 만든다.
+    번역/단어처럼 GPT로 만들어 저장해 두는 항목이 아직 없으면 missing에 이름을 넣어,
+    클라이언트는 그것만 따로 요청.
+
+    ETag는 catalog_version + 챕터 ID라 If-None-Match가 맞으면 DB 조회/직렬화 없이 304.
+    빠진 항목이 있는 응답에는 ETag를 주지 않는다 (나중에 저장되면 내용이 달라지므로).
+    단어/번역을 지우고 다시 만든 경우는 catalog_version이 바뀔 때까지 이전 ETag가 유효하다.
+    """
+    key = parse_chapter_id(composite_id)
+    if key is None:
+        raise HTTPException(status_code=404, detail="Chapter not found")
+    book_id, chapter_number = key
+
+    version = await catalog_cache.current_version()
+    etag = catalog_cache.etag_for(version, f"bundle:{composite_id}") if version is not None else None
+    # 단어/번역은 언제든 저장될 수 있으므로 매번 재검증 (일치하면 304로 본문 전송 생략)
+    headers = {"Cache-Control": "no-cache"}
+    if etag is not None and etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={**headers, "ETag": etag})
+
+    # 단어/번역은 사용자 데이터라 레플리카가 아닌 기본 DB에서 (카탈로그 테이블도 함께 조회)
+    vocabulary = vocabulary_statements()
+    async with get_async_db() as conn:
+        chapter_rows, vocabulary_rows, translation_rows, occurrence_rows = await conn.batch([
+            ("SELECT * FROM chapters WHERE book_id = ? AND chapter_number = ?", [book_id, chapter_number]),
+            (vocabulary.select, [composite_id]),
+            ("SELECT translation FROM chapter_translations WHERE chapter_id = ?", [composite_id]),
+            ("SELECT kind, term, offsets FROM chapter_term_occurrences WHERE chapter_id = ?", [composite_id]),
+        ])
+
+    if not chapter_rows:
+        raise HTTPException(status_code=404, detail="Chapter not found")
+    detector = await get_archaic_detector()
+
+    missing = []
+    if not vocabulary_rows:
+        missing.append("vocabulary")
+    if not translation_rows:
+        missing.append("translation")
+    if etag is not None and not missing:
+        headers["ETag"] = etag
+
+    body = render_json({
+        "bookId": book_id,
+        "chapter": row_to_book_chapter(chapter_rows[0], book_id),
+        "vocabulary": [vocabulary.to_response(row).model_dump() for row in vocabulary_rows],
+        "translation": translation_rows[0]["translation"] if translation_rows else None,
+        "archaic": detector.annotations(occurrence_rows),
+        "missing": missing,
+    })
+    return json_response(body, headers)
+
 @router.get("/chapters/{chapter_id}", response_model=Chapter)
-def get_chapter(chapter_id: int):
-    with get_db() as conn:
+async def get_chapter(chapter_id: int):
+    async with get_async_catalog_db() as conn:
         cursor = conn.cursor()
 
-        cursor.execute("SELECT * FROM chapters WHERE id = ?", (chapter_id,))
-        chapter_row = cursor.fetchone()
+        await cursor.execute("SELECT * FROM chapters WHERE id = ?", (chapter_id,))
+        chapter_row = await cursor.fetchone()
 
         if not chapter_row:
             raise HTTPException(status_code=404, detail="Chapter not found")
@@ -1,17 +1,22 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query, Request
 from typing import List, Optional
 import json
-from database import get_db
-from models import Hero
+from database import get_async_catalog_db
+from catalog_cache import cached_catalog_response, catalog_cache
+from models import Hero, HeroCard, HeroScenarios
 
 router = APIRouter(tags=["heroes"])
 
-def safe_get(row, key, default=None):
-    """sqlite3.Row에서 안전하게 값 가져오기"""
-    try:
-        return row[key]
-    except (KeyError, IndexError):
-        return default
+# view=card: 카드에 필요한 컬럼만 SQL에서 선택 (system_prompt, 성격 설명, scenarios 본문 제외)
+HERO_CARD_SQL = """
+    SELECT id, name, name_ko, period, nationality, nationality_ko, avatar, difficulty,
+           summary, summary_ko, recommended_topics, portrait_image,
+           CASE WHEN json_valid(scenarios) THEN json_array_length(scenarios) ELSE 0 END AS scenario_count
+    FROM heroes
+"""
+
+# 디코딩된 영웅 목록 (catalog_version, [hero...], {id: hero}) - 버전이 바뀔 때만 다시 만듦
+_hero_index = None
 
 HERO_GENDER = {
     "aesop": "male",
@@ -23,7 +28,7 @@ HERO_GENDER = {
 }
 
 def row_to_hero(row) -> dict:
-    scenarios_raw = safe_get(row, "scenarios")
+    scenarios_raw = row.get("scenarios")  # 구버전 스키마에는 scenarios 컬럼이 없음
 
     # scenarios JSON 파싱 시 에러 처리
     scenarios = []
@@ -67,28 +72,103 @@ def row_to_hero(row) -> dict:
         "scenarios": scenarios
     }
 
-@router.get("/heroes")
-def get_heroes(difficulty: Optional[str] = None):
-    with get_db() as conn:
+async def get_hero_index():
+    """영웅 전체를 한 번 조회해 JSON 컬럼까지 디코딩해 둔 인덱스 반환
+
+    catalog_version이 같으면 메모리의 인덱스를 그대로 사용 (DB 조회/json.loads 없음).
+    버전이 없으면(seed 전) 캐시하지 않고 매번 새로 만든다.
+    """
+    global _hero_index
+    version = await catalog_cache.current_version()
+    if _hero_index is not None and version is not None and _hero_index[0] == version:
+        return _hero_index
+
+    async with get_async_catalog_db() as conn:
         cursor = conn.cursor()
+        await cursor.execute("SELECT * FROM heroes")
+        rows = await cursor.fetchall()
 
-        if difficulty:
-            cursor.execute("SELECT * FROM heroes WHERE difficulty = ?", (difficulty,))
-        else:
-            cursor.execute("SELECT * FROM heroes")
+    heroes = [row_to_hero(row) for row in rows]
+    index = (version, heroes, {hero["id"]: hero for hero in heroes})
+    if version is not None:
+        _hero_index = index
+    return index
 
-        heroes = cursor.fetchall()
-        return [row_to_hero(row) for row in heroes]
+async def _load_heroes(difficulty: Optional[str]) -> list:
+    _version, heroes, _by_id = await get_hero_index()
+    if difficulty:
+        return [hero for hero in heroes if hero["difficulty"] == difficulty]
+    return heroes
 
-@router.get("/heroes/{hero_id}")
-def get_hero(hero_id: str):
-    with get_db() as conn:
+async def _load_hero(hero_id: str) -> dict:
+    _version, _heroes, by_id = await get_hero_index()
+    hero = by_id.get(hero_id)
+    if hero is None:
+        raise HTTPException(status_code=404, detail="Hero not found")
+    return hero
+
+def row_to_hero_card(row) -> dict:
+    topics = json.loads(row["recommended_topics"]) if row["recommended_topics"] else []
+    return {
+        "id": row["id"],
+        "name": row["name"],
+        "nameKo": row["name_ko"],
+        "period": row["period"],
+        "nationality": row["nationality"],
+        "nationalityKo": row["nationality_ko"],
+        "avatar": row["avatar"],
+        "difficulty": row["difficulty"],
+        "linkedContent": row["id"],
+        "profile": {
+            "summary": row["summary"],
+            "summaryKo": row["summary_ko"]
+        },
+        # 카드에는 주제 태그만 표시 - 질문 목록은 제외
+        "recommendedTopics": [{"title": t["title"], "titleKo": t["titleKo"]} for t in topics],
+        "portraitImage": row["portrait_image"],
+        "scenarioCount": row["scenario_count"] or 0
+    }
+
+async def _load_hero_cards(difficulty: Optional[str]) -> list:
+    async with get_async_catalog_db() as conn:
         cursor = conn.cursor()
+        if difficulty:
+            await cursor.execute(HERO_CARD_SQL + " WHERE difficulty = ?", (difficulty,))
+        else:
+            await cursor.execute(HERO_CARD_SQL)
+        return [row_to_hero_card(row) for row in await cursor.fetchall()]
 
-        cursor.execute("SELECT * FROM heroes WHERE id = ?", (hero_id,))
-        hero_row = cursor.fetchone()
+async def _load_hero_scenarios(hero_id: str) -> dict:
+    hero = await _load_hero(hero_id)
+    return {
+        "heroId": hero["id"],
+        "conversationStyle": hero["conversationStyle"],
+        "scenarios": hero["scenarios"]
+    }
 
-        if not hero_row:
-            raise HTTPException(status_code=404, detail="Hero not found")
+@router.get("/heroes")
+async def get_heroes(
+    request: Request,
+    difficulty: Optional[str] = None,
+    view: str = Query("full", pattern="^(full|card)$", description="card: 선택 화면용 요약 (프롬프트/시나리오 제외)"),
+):
+    if view == "card":
+        return await cached_catalog_response(
+            request, f"heroes-card:{difficulty or ''}", lambda: _load_hero_cards(difficulty), List[HeroCard]
+        )
+    return await cached_catalog_response(
+        request, f"heroes:{difficulty or ''}", lambda: _load_heroes(difficulty)
+    )
+
+@router.get("/heroes/{hero_id}")
+async def get_hero(hero_id: str, request: Request):
+    return await cached_catalog_response(
+        request, f"hero:{hero_id}", lambda: _load_hero(hero_id)
+    )
 
-        return row_to_hero(hero_row)
+@router.get("/heroes/{hero_id}/scenarios", response_model=HeroScenarios)
+async def get_hero_scenarios(hero_id: str, request: Request):
+    """대화 시작 시 필요한 대화 스타일(시스템 프롬프트 포함)과 시나리오 목록"""
+    return await cached_catalog_response(
+        request, f"hero-scenarios:{hero_id}", lambda: _load_hero_scenarios(hero_id), HeroScenarios
+    )
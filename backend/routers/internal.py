@@ -0,0 +1,80 @@
+import os
+import hmac
+from fastapi import APIRouter, HTTPException, Request
+from database import (
+    CATALOG_REPLICA_ENABLED, SLOW_QUERY_MS, refresh_catalog_replica, query_stats,
+    schema_registry, get_catalog_schema_registry,
+)
+from catalog_cache import catalog_cache
+from archaic_detector import load_archaic_detector
+
+router = APIRouter(prefix="/internal", tags=["internal"])
+
+INTERNAL_API_TOKEN = os.getenv("INTERNAL_API_TOKEN")
+
+
+def require_internal_token(request: Request):
+    """X-Internal-Token 헤더 검증 - INTERNAL_API_TOKEN 미설정 시 내부 API 비활성화"""
+    if not INTERNAL_API_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    token = request.headers.get("X-Internal-Token", "")
+    if not hmac.compare_digest(token, INTERNAL_API_TOKEN):
+        raise HTTPException(status_code=403, detail="유효하지 않은 내부 토큰입니다")
+
+
+@router.post("/catalog-replica/sync")
+async def sync_catalog_replica(request: Request):
+    """카탈로그 레플리카 수동 동기화 (seed/ingest 직후 호출)"""
+    require_internal_token(request)
+    if not CATALOG_REPLICA_ENABLED:
+        raise HTTPException(status_code=400, detail="카탈로그 레플리카가 비활성화되어 있습니다 (CATALOG_REPLICA)")
+    counts = await refresh_catalog_replica()
+    catalog_cache.invalidate()
+    return {"status": "ok", "tables": counts}
+
+
+@router.post("/catalog-cache/invalidate")
+async def invalidate_catalog_cache(request: Request):
+    """카탈로그 응답 캐시 즉시 무효화 (catalog_version TTL을 기다리지 않고 반영)"""
+    require_internal_token(request)
+    catalog_cache.invalidate()
+    version = await catalog_cache.current_version()
+    return {"status": "ok", "catalogVersion": version}
+
+
+@router.post("/archaic-detector/reload")
+async def reload_archaic_detector(request: Request):
+    """고어 감지 인덱스 즉시 재구성 (사전 테이블 수정 직후)"""
+    require_internal_token(request)
+    catalog_cache.invalidate()
+    detector = await load_archaic_detector(await catalog_cache.current_version())
+    return {"status": "ok", **detector.stats()}
+
+
+@router.get("/catalog-cache")
+async def get_catalog_cache_stats(request: Request):
+    """카탈로그 응답 캐시 상태"""
+    require_internal_token(request)
+    return catalog_cache.stats()
+
+
+@router.get("/schema")
+async def get_schema_registry(request: Request):
+    """스키마 레지스트리 (기본 DB / 카탈로그 읽기 DB의 테이블별 컬럼)"""
+    require_internal_token(request)
+    return {"primary": schema_registry.stats(), "catalog": get_catalog_schema_registry().stats()}
+
+
+@router.get("/query-stats")
+async def get_query_stats(request: Request):
+    """fingerprint별 쿼리 통계 (총 소요 시간 내림차순)"""
+    require_internal_token(request)
+    return {"slowQueryMs": SLOW_QUERY_MS, "queries": query_stats.snapshot()}
+
+
+@router.delete("/query-stats")
+async def reset_query_stats(request: Request):
+    """쿼리 통계 초기화"""
+    require_internal_token(request)
+    query_stats.reset()
+    return {"status": "ok"}
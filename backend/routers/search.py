@@ -0,0 +1,159 @@
+from fastapi import APIRouter, HTTPException, Query
+import re
+from database import get_async_catalog_db, get_catalog_schema_registry
+from models import SearchResults
+
+router = APIRouter(tags=["search"])
+
+SEARCH_MAX_LIMIT = 50
+SNIPPET_TOKENS = 16  # FTS snippet() 토큰 수
+SNIPPET_CHARS = 160  # LIKE 대체 검색의 snippet 글자 수
+
+# snippet 안 일치 구간 표시 (응답 전에 highlights 오프셋으로 바꾸고 제거)
+_MARK_START, _MARK_END = "\x02", "\x03"
+
+# 따옴표로 묶은 구 또는 공백으로 구분한 단어 (단어 끝의 *는 접두어 검색)
+QUERY_TERM_RE = re.compile(r'"([^"]*)"|(\S+)')
+WORD_RE = re.compile(r"\w+")
+
+SEARCH_FTS_SQL = f"""
+    SELECT c.book_id, c.chapter_number, c.title, b.title AS book_title,
+           snippet(chapters_fts, 1, ?, ?, '…', {SNIPPET_TOKENS}) AS snippet,
+           bm25(chapters_fts, 5.0, 1.0) AS rank
+    FROM chapters_fts
+    JOIN chapters c ON c.id = chapters_fts.rowid
+    JOIN books b ON b.id = c.book_id
+    WHERE chapters_fts MATCH ?
+    ORDER BY rank
+    LIMIT ? OFFSET ?
+"""
+SEARCH_FTS_COUNT_SQL = "SELECT COUNT(*) AS total FROM chapters_fts WHERE chapters_fts MATCH ?"
+
+
+def parse_search_query(q: str):
+    """검색어 -> [(단어 목록, 접두어 여부)] (따옴표 구는 단어 목록 하나, 단어가 없으면 빈 목록)"""
+    terms = []
+    for phrase, word in QUERY_TERM_RE.findall(q):
+        tokens = WORD_RE.findall(phrase or word)
+        if tokens:
+            terms.append((tokens, bool(word) and word.endswith("*")))
+    return terms
+
+
+def to_fts_query(terms) -> str:
+    """모든 항목을 구 문법("...")으로 인용해 AND로 연결 - 입력의 FTS5 연산자/특수문자로 구문 오류가 나지 않게"""
+    return " ".join(f'"{" ".join(tokens)}"' + ("*" if prefix else "") for tokens, prefix in terms)
+
+
+def _utf16_len(text: str) -> int:
+    return len(text.encode("utf-16-le")) // 2
+
+
+def split_highlights(marked: str):
+    """표시 문자가 들어간 snippet -> (일반 텍스트, [시작, 길이, ...] UTF-16 오프셋)"""
+    parts, highlights, position = [], [], 0
+    for i, piece in enumerate(marked.split(_MARK_START)):
+        if i:
+            hit, _, piece = piece.partition(_MARK_END)
+            length = _utf16_len(hit)
+            highlights.extend((position, length))
+            parts.append(hit)
+            position += length
+        parts.append(piece)
+        position += _utf16_len(piece)
+    return "".join(parts), highlights
+
+
+def _like_snippet(content: str, patterns) -> str:
+    """LIKE 대체 검색용 snippet - 첫 일치 주변 SNIPPET_CHARS 글자, 구간 안의 모든 일치에 표시 문자"""
+    hits = sorted(m.span() for pattern in patterns for m in pattern.finditer(content))
+    start = max(0, hits[0][0] - SNIPPET_CHARS // 3) if hits else 0
+    end = min(len(content), start + SNIPPET_CHARS)
+    parts, cursor = [], start
+    for hit_start, hit_end in hits:
+        if hit_start < cursor or hit_end > end:
+            continue
+        parts.extend((content[cursor:hit_start], _MARK_START, content[hit_start:hit_end], _MARK_END))
+        cursor = hit_end
+    parts.append(content[cursor:end])
+    return ("…" if start > 0 else "") + "".join(parts) + ("…" if end < len(content) else "")
+
+
+def _like_pattern(text: str) -> str:
+    return "%" + text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
+
+def _hit(row, snippet: str, score=None) -> dict:
+    text, highlights = split_highlights(snippet)
+    return {
+        "chapterId": f"{row['book_id']}-ch{row['chapter_number']}",
+        "bookId": row["book_id"],
+        "bookTitle": row["book_title"],
+        "chapterNumber": row["chapter_number"],
+        "title": row["title"],
+        "snippet": text,
+        "highlights": highlights,
+        "score": score,
+    }
+
+
+async def _search_fts(conn, terms, limit, offset):
+    match = to_fts_query(terms)
+    rows, count = await conn.batch([
+        (SEARCH_FTS_SQL, [_MARK_START, _MARK_END, match, limit, offset]),
+        (SEARCH_FTS_COUNT_SQL, [match]),
+    ])
+    # bm25는 작을수록 관련도가 높음 - 응답에서는 부호를 바꿔 클수록 높게
+    return count[0]["total"], [_hit(row, row["snippet"], round(-row["rank"], 4)) for row in rows]
+
+
+async def _search_like(conn, terms, limit, offset):
+    """FTS5 색인이 없는 DB(Turso에서 FTS5 미지원 + 레플리카 미사용 등)용 - 모든 항목을 포함하는 챕터, 책/챕터 순"""
+    phrases = [" ".join(tokens) for tokens, _prefix in terms]
+    where = " AND ".join("(c.title LIKE ? ESCAPE '\\' OR c.content LIKE ? ESCAPE '\\')" for _ in phrases)
+    params = []
+    for phrase in phrases:
+        pattern = _like_pattern(phrase)
+        params.extend((pattern, pattern))
+    rows, count = await conn.batch([
+        (f"""
+            SELECT c.book_id, c.chapter_number, c.title, b.title AS book_title, c.content
+            FROM chapters c JOIN books b ON b.id = c.book_id
+            WHERE {where}
+            ORDER BY b.rowid, c.chapter_number
+            LIMIT ? OFFSET ?
+        """, params + [limit, offset]),
+        (f"SELECT COUNT(*) AS total FROM chapters c WHERE {where}", params),
+    ])
+    patterns = [re.compile(re.escape(phrase), re.IGNORECASE) for phrase in phrases]
+    return count[0]["total"], [_hit(row, _like_snippet(row["content"] or "", patterns)) for row in rows]
+
+
+@router.get("/search", response_model=SearchResults)
+async def search_chapters(
+    q: str = Query(..., min_length=1, max_length=200, description='검색어 (공백 = AND, "따옴표" = 구, 단어* = 접두어)'),
+    limit: int = Query(20, ge=1, le=SEARCH_MAX_LIMIT),
+    offset: int = Query(0, ge=0),
+):
+    """챕터 본문/제목 전문 검색 - FTS5 관련도 순 + 일치 위치가 표시된 snippet
+
+    chapters_fts 색인이 없는 DB에서는 LIKE 검색으로 대체 (mode="like", 관련도 없음).
+    """
+    terms = parse_search_query(q)
+    if not terms:
+        raise HTTPException(status_code=400, detail="검색어에 단어가 없습니다")
+
+    async with get_async_catalog_db() as conn:
+        mode = "like"
+        # 레플리카를 쓰는 중이면 레플리카 쪽 스키마 (레플리카는 동기화 때 자체 색인을 만듦)
+        if get_catalog_schema_registry().has_table("chapters_fts"):
+            try:
+                total, results = await _search_fts(conn, terms, limit, offset)
+                mode = "fts"
+            except Exception as e:
+                # 레지스트리 갱신 뒤 색인이 사라졌거나 FTS5 모듈이 없는 연결
+                print(f"[search] FTS 검색 실패 (LIKE로 대체): {e}")
+        if mode == "like":
+            total, results = await _search_like(conn, terms, limit, offset)
+
+    return {"query": q, "mode": mode, "total": total, "limit": limit, "offset": offset, "results": results}
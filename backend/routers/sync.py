@@ -5,7 +5,7 @@ from fastapi import APIRouter, Request
 from pydantic import BaseModel
 from typing import Optional
 
-from database import get_db
+from database import get_async_db
 from routers.auth import get_current_user
 
 router = APIRouter(prefix="/sync", tags=["sync"])
@@ -28,18 +28,18 @@ class SyncResponse(BaseModel):
 
 
 @router.get("/", response_model=SyncResponse)
-def get_sync_data(request: Request):
+async def get_sync_data(request: Request):
     """서버에 저장된 동기화 데이터 조회"""
     payload = get_current_user(request)
     user_id = payload["sub"]
 
-    with get_db() as conn:
+    async with get_async_db() as conn:
         cursor = conn.cursor()
-        cursor.execute(
+        await cursor.execute(
             "SELECT data, updated_at FROM user_sync_data WHERE user_id = ?",
             (user_id,)
         )
-        row = cursor.fetchone()
+        row = await cursor.fetchone()
 
     if not row:
         return SyncResponse(data=None, updatedAt=None)
@@ -51,22 +51,22 @@ def get_sync_data(request: Request):
 
 
 @router.put("/")
-def put_sync_data(sync_data: SyncData, request: Request):
+async def put_sync_data(sync_data: SyncData, request: Request):
     """동기화 데이터 저장 (UPSERT)"""
     payload = get_current_user(request)
     user_id = payload["sub"]
     now = datetime.now(timezone.utc).isoformat()
     data_json = json.dumps(sync_data.model_dump(), ensure_ascii=False)
 
-    with get_db() as conn:
+    async with get_async_db() as conn:
         cursor = conn.cursor()
         # UPSERT: 있으면 업데이트, 없으면 삽입
-        cursor.execute(
+        await cursor.execute(
             """INSERT INTO user_sync_data (user_id, data, updated_at)
                VALUES (?, ?, ?)
                ON CONFLICT(user_id) DO UPDATE SET data = ?, updated_at = ?""",
             (user_id, data_json, now, data_json, now)
         )
-        conn.commit()
+        await conn.commit()
 
     return {"status": "ok", "updatedAt": now}
@@ -2,7 +2,7 @@ import hashlib
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import Optional
-from database import get_db
+from database import get_async_db
 
 router = APIRouter(prefix="/translations", tags=["translations"])
 
@@ -30,15 +30,15 @@ class SentenceTranslationResponse(BaseModel):
 
 
 @router.get("/chapter/{chapter_id}", response_model=Optional[TranslationResponse])
-def get_chapter_translation(chapter_id: str):
+async def get_chapter_translation(chapter_id: str):
     """챕터의 캐싱된 번역 조회 (없으면 null 반환)"""
-    with get_db() as conn:
+    async with get_async_db() as conn:
         cursor = conn.cursor()
-        cursor.execute(
+        await cursor.execute(
             "SELECT chapter_id, translation FROM chapter_translations WHERE chapter_id = ?",
             (chapter_id,)
         )
-        row = cursor.fetchone()
+        row = await cursor.fetchone()
 
         if row:
             return TranslationResponse(
@@ -50,14 +50,14 @@ def get_chapter_translation(chapter_id: str):
 
 
 @router.post("/chapter/{chapter_id}", response_model=TranslationResponse)
-def save_chapter_translation(chapter_id: str, data: TranslationCreate):
+async def save_chapter_translation(chapter_id: str, data: TranslationCreate):
     """챕터의 번역 저장 (LLM 번역 결과 캐싱)"""
     try:
-        with get_db() as conn:
+        async with get_async_db() as conn:
             cursor = conn.cursor()
 
             # UPSERT (있으면 업데이트, 없으면 삽입)
-            cursor.execute(
+            await cursor.execute(
                 """
                 INSERT INTO chapter_translations (chapter_id, translation)
                 VALUES (?, ?)
@@ -67,7 +67,7 @@ def save_chapter_translation(chapter_id: str, data: TranslationCreate):
                 """,
                 (chapter_id, data.translation)
             )
-            conn.commit()
+            await conn.commit()
 
             return TranslationResponse(
                 chapter_id=chapter_id,
@@ -80,15 +80,15 @@ def save_chapter_translation(chapter_id: str, data: TranslationCreate):
 
 
 @router.delete("/chapter/{chapter_id}")
-def delete_chapter_translation(chapter_id: str):
+async def delete_chapter_translation(chapter_id: str):
     """챕터의 번역 삭제 (재번역용)"""
-    with get_db() as conn:
+    async with get_async_db() as conn:
         cursor = conn.cursor()
-        cursor.execute(
+        await cursor.execute(
             "DELETE FROM chapter_translations WHERE chapter_id = ?",
             (chapter_id,)
         )
-        conn.commit()
+        await conn.commit()
 
         return {"message": f"Translation for chapter {chapter_id} deleted"}
 
@@ -100,15 +100,15 @@ def _make_text_hash(text: str, target_lang: str) -> str:
 
 
 @router.get("/sentence/{text_hash}", response_model=Optional[SentenceTranslationResponse])
-def get_sentence_translation(text_hash: str):
+async def get_sentence_translation(text_hash: str):
     """문장/텍스트의 캐싱된 번역 조회"""
-    with get_db() as conn:
+    async with get_async_db() as conn:
         cursor = conn.cursor()
-        cursor.execute(
+        await cursor.execute(
             "SELECT text_hash, translated_text FROM sentence_translations WHERE text_hash = ?",
             (text_hash,)
         )
-        row = cursor.fetchone()
+        row = await cursor.fetchone()
 
         if row:
             return SentenceTranslationResponse(
@@ -120,14 +120,14 @@ def get_sentence_translation(text_hash: str):
 
 
 @router.post("/sentence", response_model=SentenceTranslationResponse)
-def save_sentence_translation(data: SentenceTranslationCreate):
+async def save_sentence_translation(data: SentenceTranslationCreate):
     """문장/텍스트 번역 저장 (LLM 번역 결과 캐싱)"""
     try:
         text_hash = _make_text_hash(data.source_text, data.target_lang)
 
-        with get_db() as conn:
+        async with get_async_db() as conn:
             cursor = conn.cursor()
-            cursor.execute(
+            await cursor.execute(
                 """
                 INSERT INTO sentence_translations (text_hash, source_text, translated_text, target_lang)
                 VALUES (?, ?, ?, ?)
@@ -137,7 +137,7 @@ def save_sentence_translation(data: SentenceTranslationCreate):
                 """,
                 (text_hash, data.source_text.strip(), data.translated_text, data.target_lang)
             )
-            conn.commit()
+            await conn.commit()
 
             return SentenceTranslationResponse(
                 text_hash=text_hash,
@@ -150,6 +150,6 @@ def save_sentence_translation(data: SentenceTranslationCreate):
 
 
 @router.get("/sentence-hash")
-def get_text_hash(text: str, target_lang: str = "ko"):
+async def get_text_hash(text: str, target_lang: str = "ko"):
     """원문의 해시값 반환 (프론트에서 캐시 조회용)"""
     return {"text_hash": _make_text_hash(text, target_lang)}
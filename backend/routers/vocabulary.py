@@ -2,29 +2,11 @@ import traceback
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import List, Optional
-from database import get_db, USE_TURSO
+from database import get_async_db, schema_registry
 
 router = APIRouter(prefix="/vocabulary", tags=["vocabulary"])
 
 
-# 새 컬럼(phonetic, is_idiom) 존재 여부 캐시
-_has_new_columns = None
-
-
-def _check_new_columns(cursor):
-    """chapter_vocabulary 테이블에 phonetic, is_idiom 컬럼이 있는지 확인"""
-    global _has_new_columns
-    if _has_new_columns is not None:
-        return _has_new_columns
-    try:
-        # 실제 쿼리로 컬럼 존재 여부 확인 (PRAGMA는 Turso에서 미지원)
-        cursor.execute("SELECT phonetic, is_idiom FROM chapter_vocabulary LIMIT 0")
-        _has_new_columns = True
-    except Exception:
-        _has_new_columns = False
-    return _has_new_columns
-
-
 class VocabularyItem(BaseModel):
     word: str
     definition: str
@@ -48,132 +30,104 @@ class VocabularyResponse(BaseModel):
     is_idiom: Optional[bool] = False
 
 
+class VocabularyStatements:
+    """chapter_vocabulary 스키마별 SQL - phonetic/is_idiom 컬럼 유무에 따라 미리 만들어 둔 두 벌 중 하나"""
+
+    def __init__(self, has_new: bool, select: str, insert: str):
+        self.has_new = has_new
+        self.select = select  # WHERE chapter_id = ? ORDER BY id
+        self.insert = insert
+
+    def insert_params(self, chapter_id: str, item: VocabularyItem) -> list:
+        params = [chapter_id, item.word, item.definition, item.example]
+        if self.has_new:
+            params.extend((item.phonetic, 1 if item.is_idiom else 0))
+        return params
+
+    def to_response(self, row) -> VocabularyResponse:
+        return row_to_vocabulary(row, self.has_new)
+
+
+VOCABULARY_STATEMENTS = VocabularyStatements(
+    True,
+    """
+    SELECT id, chapter_id, word, definition, example, phonetic, is_idiom
+    FROM chapter_vocabulary
+    WHERE chapter_id = ?
+    ORDER BY id
+    """,
+    "INSERT INTO chapter_vocabulary (chapter_id, word, definition, example, phonetic, is_idiom) VALUES (?, ?, ?, ?, ?, ?)",
+)
+
+# phonetic/is_idiom 컬럼 추가 전 스키마 (_upgrade_legacy_schema의 ALTER가 실패한 DB)
+LEGACY_VOCABULARY_STATEMENTS = VocabularyStatements(
+    False,
+    """
+    SELECT id, chapter_id, word, definition, example
+    FROM chapter_vocabulary
+    WHERE chapter_id = ?
+    ORDER BY id
+    """,
+    "INSERT INTO chapter_vocabulary (chapter_id, word, definition, example) VALUES (?, ?, ?, ?)",
+)
+
+
+def vocabulary_statements() -> VocabularyStatements:
+    """현재 스키마에 맞는 SQL (database.schema_registry 조회만 - 요청마다 DB를 확인하지 않음)"""
+    if schema_registry.has_columns("chapter_vocabulary", "phonetic", "is_idiom"):
+        return VOCABULARY_STATEMENTS
+    return LEGACY_VOCABULARY_STATEMENTS
+
+
+def row_to_vocabulary(row, has_new: bool) -> VocabularyResponse:
+    return VocabularyResponse(
+        id=row["id"],
+        chapter_id=row["chapter_id"],
+        word=row["word"],
+        definition=row["definition"],
+        example=row["example"],
+        phonetic=row["phonetic"] if has_new else None,
+        is_idiom=bool(row["is_idiom"]) if has_new and row["is_idiom"] is not None else False
+    )
+
+
 @router.get("/chapter/{chapter_id}", response_model=List[VocabularyResponse])
-def get_chapter_vocabulary(chapter_id: str):
+async def get_chapter_vocabulary(chapter_id: str):
     """챕터의 저장된 중요 단어/숙어 조회"""
-    with get_db() as conn:
+    statements = vocabulary_statements()
+    async with get_async_db() as conn:
         cursor = conn.cursor()
-        has_new = _check_new_columns(cursor)
-
-        if has_new:
-            cursor.execute(
-                """
-                SELECT id, chapter_id, word, definition, example, phonetic, is_idiom
-                FROM chapter_vocabulary
-                WHERE chapter_id = ?
-                ORDER BY id
-                """,
-                (chapter_id,)
-            )
-        else:
-            cursor.execute(
-                """
-                SELECT id, chapter_id, word, definition, example
-                FROM chapter_vocabulary
-                WHERE chapter_id = ?
-                ORDER BY id
-                """,
-                (chapter_id,)
-            )
-        rows = cursor.fetchall()
-
-        return [
-            VocabularyResponse(
-                id=row["id"],
-                chapter_id=row["chapter_id"],
-                word=row["word"],
-                definition=row["definition"],
-                example=row["example"],
-                phonetic=row["phonetic"] if has_new else None,
-                is_idiom=bool(row["is_idiom"]) if has_new and row["is_idiom"] is not None else False
-            )
-            for row in rows
-        ]
+        await cursor.execute(statements.select, (chapter_id,))
+        rows = await cursor.fetchall()
+
+        return [statements.to_response(row) for row in rows]
 
 
 @router.post("/chapter/{chapter_id}", response_model=List[VocabularyResponse])
-def save_chapter_vocabulary(chapter_id: str, data: VocabularyCreate):
+async def save_chapter_vocabulary(chapter_id: str, data: VocabularyCreate):
     """챕터의 중요 단어/숙어 저장 (GPT 추출 결과)"""
     if data.chapter_id != chapter_id:
         raise HTTPException(status_code=400, detail="chapter_id mismatch")
 
+    vocabulary = vocabulary_statements()
     try:
-        with get_db() as conn:
+        async with get_async_db() as conn:
             cursor = conn.cursor()
-            has_new = _check_new_columns(cursor)
-
-            if USE_TURSO:
-                # Turso: batch()로 DELETE + INSERT를 한 번의 HTTP 요청으로 실행
-                statements = [
-                    ("DELETE FROM chapter_vocabulary WHERE chapter_id = ?", [chapter_id])
-                ]
-                for item in data.items:
-                    if has_new:
-                        statements.append((
-                            "INSERT INTO chapter_vocabulary (chapter_id, word, definition, example, phonetic, is_idiom) VALUES (?, ?, ?, ?, ?, ?)",
-                            [chapter_id, item.word, item.definition, item.example, item.phonetic, 1 if item.is_idiom else 0]
-                        ))
-                    else:
-                        statements.append((
-                            "INSERT INTO chapter_vocabulary (chapter_id, word, definition, example) VALUES (?, ?, ?, ?)",
-                            [chapter_id, item.word, item.definition, item.example]
-                        ))
-
-                conn.batch(statements)
-            else:
-                # 로컬 SQLite: 기존 방식
-                cursor.execute(
-                    "DELETE FROM chapter_vocabulary WHERE chapter_id = ?",
-                    (chapter_id,)
-                )
-                for item in data.items:
-                    if has_new:
-                        cursor.execute(
-                            "INSERT INTO chapter_vocabulary (chapter_id, word, definition, example, phonetic, is_idiom) VALUES (?, ?, ?, ?, ?, ?)",
-                            (chapter_id, item.word, item.definition, item.example, item.phonetic, 1 if item.is_idiom else 0)
-                        )
-                    else:
-                        cursor.execute(
-                            "INSERT INTO chapter_vocabulary (chapter_id, word, definition, example) VALUES (?, ?, ?, ?)",
-                            (chapter_id, item.word, item.definition, item.example)
-                        )
-                conn.commit()
 
-            # 저장된 데이터 반환
-            if has_new:
-                cursor.execute(
-                    """
-                    SELECT id, chapter_id, word, definition, example, phonetic, is_idiom
-                    FROM chapter_vocabulary
-                    WHERE chapter_id = ?
-                    ORDER BY id
-                    """,
-                    (chapter_id,)
-                )
-            else:
-                cursor.execute(
-                    """
-                    SELECT id, chapter_id, word, definition, example
-                    FROM chapter_vocabulary
-                    WHERE chapter_id = ?
-                    ORDER BY id
-                    """,
-                    (chapter_id,)
-                )
-            rows = cursor.fetchall()
-
-            return [
-                VocabularyResponse(
-                    id=row["id"],
-                    chapter_id=row["chapter_id"],
-                    word=row["word"],
-                    definition=row["definition"],
-                    example=row["example"],
-                    phonetic=row["phonetic"] if has_new else None,
-                    is_idiom=bool(row["is_idiom"]) if has_new and row["is_idiom"] is not None else False
-                )
-                for row in rows
+            # DELETE + INSERT를 batch 하나로 실행 (Turso는 HTTP 요청 1회, 둘 다 단일 트랜잭션)
+            statements = [
+                ("DELETE FROM chapter_vocabulary WHERE chapter_id = ?", [chapter_id])
             ]
+            for item in data.items:
+                statements.append((vocabulary.insert, vocabulary.insert_params(chapter_id, item)))
+
+            await conn.batch(statements)
+
+            # 저장된 데이터 반환
+            await cursor.execute(vocabulary.select, (chapter_id,))
+            rows = await cursor.fetchall()
+
+            return [vocabulary.to_response(row) for row in rows]
     except HTTPException:
         raise
     except Exception as e:
@@ -183,14 +137,14 @@ def save_chapter_vocabulary(chapter_id: str, data: VocabularyCreate):
 
 
 @router.delete("/chapter/{chapter_id}")
-def delete_chapter_vocabulary(chapter_id: str):
+async def delete_chapter_vocabulary(chapter_id: str):
     """챕터의 중요 단어/숙어 삭제 (재추출용)"""
-    with get_db() as conn:
+    async with get_async_db() as conn:
         cursor = conn.cursor()
-        cursor.execute(
+        await cursor.execute(
             "DELETE FROM chapter_vocabulary WHERE chapter_id = ?",
             (chapter_id,)
         )
-        conn.commit()
+        await conn.commit()
 
         return {"message": f"Vocabulary for chapter {chapter_id} deleted"}
@@ -1,26 +1,43 @@
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel
 from typing import List, Optional
-import json
-from database import get_db
+from database import get_async_catalog_db
+from archaic_detector import get_archaic_detector
+from dictionary_suggest import get_dictionary_suggest
+from catalog_cache import cached_catalog_response
 
 router = APIRouter(tags=["words"])
 
+# POST /detect-archaic/batch 제한
+DETECT_BATCH_MAX_PASSAGES = 500
+DETECT_BATCH_MAX_CHARS = 2_000_000
+# 합계가 이보다 긴 입력은 이벤트 루프를 막지 않도록 스레드풀에서 감지
+DETECT_THREADPOOL_CHARS = 50_000
+# GET /dictionary/suggest 최대 결과 수
+SUGGEST_MAX_LIMIT = 50
+
+
+class DetectBatchRequest(BaseModel):
+    passages: List[str]
+    positions: bool = False
+
 
 @router.get("/archaic-words")
-def get_archaic_words(category: Optional[str] = None):
+async def get_archaic_words(category: Optional[str] = None):
     """모든 고어 단어 또는 카테고리별 조회"""
-    with get_db() as conn:
+    async with get_async_catalog_db() as conn:
         cursor = conn.cursor()
 
         if category:
-            cursor.execute(
+            await cursor.execute(
                 "SELECT * FROM archaic_words WHERE category = ? ORDER BY word",
                 (category,)
             )
         else:
-            cursor.execute("SELECT * FROM archaic_words ORDER BY word")
+            await cursor.execute("SELECT * FROM archaic_words ORDER BY word")
 
-        words = cursor.fetchall()
+        words = await cursor.fetchall()
 
         return [{
             "id": row["id"],
@@ -37,15 +54,15 @@ def get_archaic_words(category: Optional[str] = None):
 
 
 @router.get("/archaic-words/{word}")
-def get_archaic_word(word: str):
+async def get_archaic_word(word: str):
     """특정 고어 단어 조회"""
-    with get_db() as conn:
+    async with get_async_catalog_db() as conn:
         cursor = conn.cursor()
-        cursor.execute(
+        await cursor.execute(
             "SELECT * FROM archaic_words WHERE LOWER(word) = LOWER(?)",
             (word,)
         )
-        row = cursor.fetchone()
+        row = await cursor.fetchone()
 
         if not row:
             raise HTTPException(status_code=404, detail="Archaic word not found")
@@ -65,12 +82,12 @@ def get_archaic_word(word: str):
 
 
 @router.get("/semantic-shifts")
-def get_semantic_shifts():
+async def get_semantic_shifts():
     """모든 의미 변화 단어 조회"""
-    with get_db() as conn:
+    async with get_async_catalog_db() as conn:
         cursor = conn.cursor()
-        cursor.execute("SELECT * FROM semantic_shifts ORDER BY word")
-        words = cursor.fetchall()
+        await cursor.execute("SELECT * FROM semantic_shifts ORDER BY word")
+        words = await cursor.fetchall()
 
         return [{
             "id": row["id"],
@@ -87,15 +104,15 @@ def get_semantic_shifts():
 
 
 @router.get("/semantic-shifts/{word}")
-def get_semantic_shift(word: str):
+async def get_semantic_shift(word: str):
     """특정 의미 변화 단어 조회"""
-    with get_db() as conn:
+    async with get_async_catalog_db() as conn:
         cursor = conn.cursor()
-        cursor.execute(
+        await cursor.execute(
             "SELECT * FROM semantic_shifts WHERE LOWER(word) = LOWER(?)",
             (word,)
         )
-        row = cursor.fetchone()
+        row = await cursor.fetchone()
 
         if not row:
             raise HTTPException(status_code=404, detail="Semantic shift word not found")
@@ -114,46 +131,86 @@ def get_semantic_shift(word: str):
         }
 
 
-@router.post("/detect-archaic")
-def detect_archaic_words(text: str = Query(..., description="Text to analyze")):
-    """텍스트에서 고어 단어 감지"""
-    with get_db() as conn:
+@router.get("/dictionary/suggest")
+async def suggest_dictionary_words(
+    prefix: str = Query(..., min_length=1, max_length=50),
+    limit: int = Query(10, ge=1, le=SUGGEST_MAX_LIMIT),
+):
+    """고어/의미 변화 사전 자동완성 - 접두어 일치(match="prefix") 다음 오타 허용 일치(match="fuzzy", 편집 거리 1)
+
+    메모리의 정렬 배열/삭제형 인덱스만 사용 (DB 조회 없음, 사전이 바뀌면 자동으로 다시 만듦).
+    """
+    index = await get_dictionary_suggest()
+    return {"prefix": prefix, "suggestions": index.suggest(prefix, limit)}
+
+
+async def _load_term_chapters(term: str) -> list:
+    # 굴절형/변이형(doeth 등)은 감지기가 연결하는 사전 단어로 바꿔 조회 (색인은 사전 단어 기준)
+    detector = await get_archaic_detector()
+    keys = detector.resolve_term(term)
+    if keys:
+        where = " OR ".join("(term = ? AND kind = ?)" for _ in keys)
+        params = [value for kind, word in keys for value in (word, kind)]
+    else:
+        where, params = "term = ?", [term]
+
+    async with get_async_catalog_db() as conn:
         cursor = conn.cursor()
+        await cursor.execute(
+            f"""
+            SELECT chapter_id, kind, occurrences FROM chapter_term_occurrences
+            WHERE {where}
+            ORDER BY occurrences DESC, chapter_id
+            """,
+            params
+        )
+        rows = await cursor.fetchall()
 
-        # 모든 고어 단어 가져오기
-        cursor.execute("SELECT word, modern_equivalent, definition_ko FROM archaic_words")
-        archaic_words = {row["word"].lower(): {
-            "word": row["word"],
-            "modernEquivalent": row["modern_equivalent"],
-            "definitionKo": row["definition_ko"]
-        } for row in cursor.fetchall()}
+    return [{
+        "chapterId": row["chapter_id"],
+        "kind": row["kind"],
+        "occurrences": row["occurrences"]
+    } for row in rows]
 
-        # 모든 의미 변화 단어 가져오기
-        cursor.execute("SELECT word, historical_meaning_ko, modern_meaning_ko, tip_ko FROM semantic_shifts")
-        semantic_shifts = {row["word"].lower(): {
-            "word": row["word"],
-            "historicalMeaningKo": row["historical_meaning_ko"],
-            "modernMeaningKo": row["modern_meaning_ko"],
-            "tipKo": row["tip_ko"]
-        } for row in cursor.fetchall()}
 
-        # 텍스트에서 단어 추출 (소문자로)
-        import re
-        words_in_text = set(re.findall(r'\b[a-zA-Z]+\b', text.lower()))
+@router.get("/terms/{term}/chapters")
+async def get_term_chapters(term: str, request: Request):
+    """고어/의미 변화 단어가 등장하는 챕터 목록 (등장 횟수 내림차순, 챕터 단어 색인 사용)
 
-        # 감지된 단어들
-        detected_archaic = []
-        detected_shifts = []
+    굴절형/변이형(knoweth, doeth 등)으로 물어도 감지기가 연결하는 사전 단어의 챕터를 반환.
+    """
+    term = " ".join(term.lower().split())
+    return await cached_catalog_response(
+        request, f"term-chapters:{term}", lambda: _load_term_chapters(term)
+    )
 
-        for word in words_in_text:
-            if word in archaic_words:
-                detected_archaic.append(archaic_words[word])
-            if word in semantic_shifts:
-                detected_shifts.append(semantic_shifts[word])
 
-        return {
-            "archaicWords": detected_archaic,
-            "semanticShifts": detected_shifts,
-            "totalArchaic": len(detected_archaic),
-            "totalShifts": len(detected_shifts)
-        }
+@router.post("/detect-archaic")
+async def detect_archaic_words(
+    text: str = Query(..., description="Text to analyze"),
+    positions: bool = Query(False, description="등장 위치(archaicSpans/shiftSpans: [시작, 길이, 항목 인덱스]...)도 반환"),
+):
+    """텍스트에서 고어 단어 감지 (메모리의 감지 인덱스 사용 - DB 조회 없음)"""
+    detector = await get_archaic_detector()
+    return detector.detect(text, positions)
+
+
+@router.post("/detect-archaic/batch")
+async def detect_archaic_words_batch(data: DetectBatchRequest):
+    """여러 텍스트(문단, 대화 메시지 등)의 고어 단어를 한 번에 감지 - 결과는 passages 순서대로"""
+    if len(data.passages) > DETECT_BATCH_MAX_PASSAGES:
+        raise HTTPException(status_code=413, detail=f"passages는 최대 {DETECT_BATCH_MAX_PASSAGES}개까지 보낼 수 있습니다")
+    total_chars = sum(len(text) for text in data.passages)
+    if total_chars > DETECT_BATCH_MAX_CHARS:
+        raise HTTPException(status_code=413, detail=f"텍스트 합계는 최대 {DETECT_BATCH_MAX_CHARS}자까지 보낼 수 있습니다")
+
+    detector = await get_archaic_detector()
+
+    def detect_all():
+        return [detector.detect(text, data.positions) for text in data.passages]
+
+    if total_chars > DETECT_THREADPOOL_CHARS:
+        results = await run_in_threadpool(detect_all)
+    else:
+        results = detect_all()
+    return {"results": results}
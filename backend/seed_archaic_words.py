@@ -1,8 +1,7 @@
-import sqlite3
-import os
-from database import DATABASE_PATH, init_db
+from database import init_db, get_db, close_pool, bulk_insert, bump_catalog_version
+from archaic_detector import rebuild_term_occurrences
 
-def seed_archaic_words(cursor):
+def seed_archaic_words(conn):
     """고어(Archaic Words) 데이터 시딩 - 현대어 매칭"""
     archaic_words = [
         # Pronouns (대명사)
@@ -374,22 +373,20 @@ def seed_archaic_words(cursor):
         }
     ]
 
-    for word_data in archaic_words:
-        cursor.execute("""
-            INSERT OR REPLACE INTO archaic_words
-            (word, modern_equivalent, part_of_speech, definition, definition_ko,
-             example_sentence, usage_note, usage_note_ko, category)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            word_data["word"], word_data["modern_equivalent"], word_data["part_of_speech"],
-            word_data["definition"], word_data["definition_ko"], word_data["example_sentence"],
-            word_data["usage_note"], word_data["usage_note_ko"], word_data["category"]
-        ))
+    columns = [
+        "word", "modern_equivalent", "part_of_speech", "definition", "definition_ko",
+        "example_sentence", "usage_note", "usage_note_ko", "category"
+    ]
+    bulk_insert(conn, "archaic_words", columns, [
+        tuple(word_data[col] for col in columns) for word_data in archaic_words
+    ], or_replace=True)
+    # 예전 seed가 넣던 동사 어미 항목 제거 (굴절형은 이제 archaic_inflections가 감지기 안에서만 만듦)
+    conn.cursor().execute("DELETE FROM archaic_words WHERE word IN ('-eth', '-est')")
 
     print(f"Seeded {len(archaic_words)} archaic words")
 
 
-def seed_semantic_shifts(cursor):
+def seed_semantic_shifts(conn):
     """의미 변화 단어 (Semantic Shifts) 데이터 시딩"""
     semantic_shifts = [
         {
@@ -559,18 +556,13 @@ def seed_semantic_shifts(cursor):
         }
     ]
 
-    for shift_data in semantic_shifts:
-        cursor.execute("""
-            INSERT OR REPLACE INTO semantic_shifts
-            (word, historical_meaning, historical_meaning_ko, modern_meaning, modern_meaning_ko,
-             example_historical, example_modern, tip, tip_ko)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            shift_data["word"], shift_data["historical_meaning"], shift_data["historical_meaning_ko"],
-            shift_data["modern_meaning"], shift_data["modern_meaning_ko"],
-            shift_data["example_historical"], shift_data["example_modern"],
-            shift_data["tip"], shift_data["tip_ko"]
-        ))
+    columns = [
+        "word", "historical_meaning", "historical_meaning_ko", "modern_meaning", "modern_meaning_ko",
+        "example_historical", "example_modern", "tip", "tip_ko"
+    ]
+    bulk_insert(conn, "semantic_shifts", columns, [
+        tuple(shift_data[col] for col in columns) for shift_data in semantic_shifts
+    ], or_replace=True)
 
     print(f"Seeded {len(semantic_shifts)} semantic shift words")
 
@@ -578,21 +570,22 @@ def seed_semantic_shifts(cursor):
 def main():
     init_db()
 
-    conn = sqlite3.connect(DATABASE_PATH)
-    cursor = conn.cursor()
-
-    try:
-        seed_archaic_words(cursor)
-        seed_semantic_shifts(cursor)
-        conn.commit()
-        print("Archaic words and semantic shifts seeding completed!")
-    except Exception as e:
-        conn.rollback()
-        print(f"Error seeding data: {e}")
-        raise
-    finally:
-        conn.close()
+    with get_db() as conn:
+        try:
+            seed_archaic_words(conn)
+            seed_semantic_shifts(conn)
+            conn.commit()
+            rebuild_term_occurrences(conn)
+            bump_catalog_version(conn)
+            print("Archaic words and semantic shifts seeding completed!")
+        except Exception as e:
+            conn.rollback()
+            print(f"Error seeding data: {e}")
+            raise
 
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    finally:
+        close_pool()
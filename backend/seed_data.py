@@ -1,5 +1,6 @@
 import json
-from database import init_db, get_db, USE_TURSO
+from database import init_db, get_db, close_pool, bulk_insert, bump_catalog_version, rebuild_chapter_search, USE_TURSO
+from archaic_detector import rebuild_term_occurrences
 
 def clear_all_data(cursor):
     """기존 데이터 모두 삭제"""
@@ -8,7 +9,7 @@ def clear_all_data(cursor):
     cursor.execute("DELETE FROM heroes")
     print("All existing data cleared")
 
-def seed_heroes(cursor):
+def seed_heroes(conn):
     """6명의 영웅 데이터 시딩 - 공개 도메인 저자들"""
     heroes = [
         # Beginner (2명)
@@ -394,25 +395,19 @@ def seed_heroes(cursor):
         }
     ]
 
-    for hero in heroes:
-        cursor.execute("""
-            INSERT OR REPLACE INTO heroes
-            (id, name, name_ko, period, nationality, nationality_ko, occupation, occupation_ko,
-             avatar, difficulty, summary, summary_ko, achievements, quotes,
-             conversation_tone, conversation_personality, system_prompt, recommended_topics, tts_rate, tts_pitch, portrait_image, scenarios)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            hero["id"], hero["name"], hero["name_ko"], hero["period"],
-            hero["nationality"], hero["nationality_ko"], hero["occupation"], hero["occupation_ko"],
-            hero["avatar"], hero["difficulty"], hero["summary"], hero["summary_ko"],
-            hero["achievements"], hero["quotes"], hero["conversation_tone"],
-            hero["conversation_personality"], hero["system_prompt"], hero["recommended_topics"],
-            hero["tts_rate"], hero["tts_pitch"], hero.get("portrait_image"), hero.get("scenarios")
-        ))
+    columns = [
+        "id", "name", "name_ko", "period", "nationality", "nationality_ko", "occupation", "occupation_ko",
+        "avatar", "difficulty", "summary", "summary_ko", "achievements", "quotes",
+        "conversation_tone", "conversation_personality", "system_prompt", "recommended_topics",
+        "tts_rate", "tts_pitch", "portrait_image", "scenarios"
+    ]
+    bulk_insert(conn, "heroes", columns, [
+        tuple(hero.get(col) for col in columns) for hero in heroes
+    ], or_replace=True)
 
     print(f"Seeded {len(heroes)} heroes")
 
-def seed_books_and_chapters(cursor):
+def seed_books_and_chapters(conn):
     """숏폼 학습에 최적화된 공개 도메인 책과 챕터 데이터"""
     books_data = [
         # ========== BEGINNER (5권) ==========
@@ -1450,28 +1445,19 @@ If the end brings me out wrong, ten angels swearing I was right would make no di
         }
     ]
 
-    for book_data in books_data:
-        book = book_data["book"]
-        cursor.execute("""
-            INSERT OR REPLACE INTO books
-            (id, title, author, difficulty, genre, year, description, cover_color, cover_image,
-             word_count, reading_time, learning_focus, hero_id)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            book["id"], book["title"], book["author"], book["difficulty"], book["genre"],
-            book["year"], book["description"], book["cover_color"], book["cover_image"],
-            book["word_count"], book["reading_time"], book["learning_focus"], book["hero_id"]
-        ))
-
-        for i, chapter in enumerate(book_data["chapters"], 1):
-            cursor.execute("""
-                INSERT OR REPLACE INTO chapters
-                (book_id, chapter_number, title, content, word_count, vocabulary)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (
-                book["id"], i, chapter["title"], chapter["content"],
-                chapter["word_count"], chapter["vocabulary"]
-            ))
+    book_columns = [
+        "id", "title", "author", "difficulty", "genre", "year", "description", "cover_color", "cover_image",
+        "word_count", "reading_time", "learning_focus", "hero_id"
+    ]
+    bulk_insert(conn, "books", book_columns, [
+        tuple(book_data["book"][col] for col in book_columns) for book_data in books_data
+    ], or_replace=True)
+
+    bulk_insert(conn, "chapters", ["book_id", "chapter_number", "title", "content", "word_count", "vocabulary"], [
+        (book_data["book"]["id"], i, chapter["title"], chapter["content"], chapter["word_count"], chapter["vocabulary"])
+        for book_data in books_data
+        for i, chapter in enumerate(book_data["chapters"], 1)
+    ], or_replace=True)
 
     print(f"Seeded {len(books_data)} books with chapters")
 
@@ -1487,22 +1473,31 @@ def main():
             clear_all_data(cursor)
 
             # 새 데이터 시딩
-            seed_heroes(cursor)
-            seed_books_and_chapters(cursor)
+            seed_heroes(conn)
+            seed_books_and_chapters(conn)
             conn.commit()
 
+            # 챕터별 고어 단어 색인 (사전이 아직 없으면 빈 색인 - seed_archaic_words.py가 다시 만듦)
+            rebuild_term_occurrences(conn)
+
+            # 챕터 전문 검색 색인 (트리거로 동기화되지만 FTS5가 나중에 생긴 DB도 여기서 채움)
+            rebuild_chapter_search(conn)
+
+            # API 서버의 카탈로그 캐시 무효화
+            bump_catalog_version(conn)
+
             # 결과 확인
             cursor.execute("SELECT COUNT(*) as cnt FROM heroes")
             result = cursor.fetchone()
-            hero_count = result['cnt'] if isinstance(result, dict) else result[0]
+            hero_count = result['cnt']
 
             cursor.execute("SELECT COUNT(*) as cnt FROM books")
             result = cursor.fetchone()
-            book_count = result['cnt'] if isinstance(result, dict) else result[0]
+            book_count = result['cnt']
 
             cursor.execute("SELECT COUNT(*) as cnt FROM chapters")
             result = cursor.fetchone()
-            chapter_count = result['cnt'] if isinstance(result, dict) else result[0]
+            chapter_count = result['cnt']
 
             db_type = "Turso" if USE_TURSO else "Local SQLite"
             print(f"\n=== Database Seeding Complete ({db_type}) ===")
@@ -1517,4 +1512,7 @@ def main():
             raise
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    finally:
+        close_pool()
@@ -152,6 +152,14 @@ if __name__ == "__main__":
 
             print("\nScenarios data seeding completed!")
 
+            # API 서버의 카탈로그 캐시 무효화
+            from database import get_db, close_pool, bump_catalog_version
+            try:
+                with get_db() as conn:
+                    bump_catalog_version(conn)
+            finally:
+                close_pool()
+
         finally:
             client.close()
     else:
@@ -183,3 +191,11 @@ if __name__ == "__main__":
         conn.commit()
         conn.close()
         print("\n[DONE] Scenarios data updated!")
+
+        # API 서버의 카탈로그 캐시 무효화
+        from database import get_db, close_pool, bump_catalog_version
+        try:
+            with get_db() as conn:
+                bump_catalog_version(conn)
+        finally:
+            close_pool()